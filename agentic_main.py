@@ -2,26 +2,44 @@
 import click
 import os
 from loguru import logger
-from src.cv_parser import CVParser
-from src.cover_letter_generator import CoverLetterGenerator
-from src.gmail_agent import GmailAgent
-from src.generic_applier import GenericPortalApplier
+from src.gmail_agent import GmailAgent, SendRateLimiter
 from src.llm.llm_manager import AIAdapter
-from main import ConfigValidator, FileManager, init_browser
+from main import ConfigValidator, FileManager, create_browser_session_pool
+from app_config import CV_INGEST_WORKERS, PORTAL_BROWSER_POOL_SIZE
 from pathlib import Path
+from src.resume_projection import load_resume_projection
 import yaml
 import shutil
 import json
 
+def portal_settings(parameters, data_folder):
+    """GenericPortalApplier settings: the limits from the optional 'portal' section of config.yaml and the form mapping cache."""
+    from src.form_mapping_cache import FormMappingCache
+
+    portal = parameters.get('portal') or {}
+    settings = {key: portal[key] for key in ('max_pages', 'page_timeout') if key in portal}
+    settings['mapping_cache'] = FormMappingCache(data_folder / "output" / "form_mappings.json")
+    return settings
+
+def gmail_agent(gmail_user, gmail_password, data_folder):
+    """A GmailAgent whose daily sending limit is shared by every run through output/gmail_sent.json."""
+    return GmailAgent(gmail_user, gmail_password,
+                      rate_limiter=SendRateLimiter(state_file=data_folder / "output" / "gmail_sent.json"))
+
 @click.command()
-@click.option('--action', type=click.Choice(['update_cv', 'draft_email', 'apply_email', 'apply_portal']), required=True, help='Action to perform')
+@click.option('--action', type=click.Choice(['update_cv', 'ingest_cvs', 'draft_email', 'apply_email', 'apply_email_batch', 'apply_portal', 'apply_portal_batch']), required=True, help='Action to perform')
 @click.option('--cv_path', help='Path to the PDF CV (required for update_cv)')
+@click.option('--cv_dir', type=click.Path(exists=True, file_okay=False, path_type=Path), help='Directory of PDF CVs, one per candidate (required for ingest_cvs)')
+@click.option('--profiles_dir', type=click.Path(file_okay=False, path_type=Path), default=Path('data_folder') / 'candidates', show_default=True, help='Where ingest_cvs writes one profile directory per candidate')
 @click.option('--job_description', help='Job description text (required for draft_email/apply_email)')
 @click.option('--recruiter_email', help='Recruiter email (required for apply_email)')
+@click.option('--applications', type=click.File('r', encoding='utf-8'), help='JSON lines file of {"recruiter_email", "job_description", optional "subject"} (required for apply_email_batch)')
 @click.option('--gmail_user', help='Your Gmail address (required for apply_email)')
 @click.option('--gmail_password', help='Your Gmail App Password (required for apply_email)')
 @click.option('--portal_url', help='URL of the job portal (required for apply_portal)')
-def main(action, cv_path, job_description, recruiter_email, gmail_user, gmail_password, portal_url):
+@click.option('--portal_urls', type=click.File('r', encoding='utf-8'), help='File with one portal URL per line, or - for stdin (required for apply_portal_batch)')
+@click.option('--workers', type=click.IntRange(min=1), default=None, help=f'Number of browsers used by apply_portal_batch (default {PORTAL_BROWSER_POOL_SIZE}) or CVs parsed at once by ingest_cvs (default {CV_INGEST_WORKERS})')
+def main(action, cv_path, cv_dir, profiles_dir, job_description, recruiter_email, applications, gmail_user, gmail_password, portal_url, portal_urls, workers):
 
     # Initialize LLM
     try:
@@ -49,7 +67,9 @@ def main(action, cv_path, job_description, recruiter_email, gmail_user, gmail_pa
         if not cv_path:
             click.echo("Error: --cv_path is required for update_cv")
             return
-        parser = CVParser(ai_adapter)
+        from src.cv_parse_cache import CVParseCache
+        from src.cv_parser import CVParser
+        parser = CVParser(ai_adapter, cache=CVParseCache(data_folder / "output" / "cv_cache"))
         try:
             text = parser.extract_text_from_pdf(cv_path)
             yaml_content = parser.parse_cv_to_yaml_structure(text)
@@ -60,10 +80,34 @@ def main(action, cv_path, job_description, recruiter_email, gmail_user, gmail_pa
         except Exception as e:
             click.echo(f"Error updating CV: {e}")
 
+    elif action == 'ingest_cvs':
+        if not cv_dir:
+            click.echo("Error: --cv_dir is required for ingest_cvs")
+            return
+        from src.cv_ingestion import INGESTED, CVIngestionRunner, list_cvs
+        from src.cv_parse_cache import CVParseCache
+        from src.cv_parser import CVParser
+
+        cvs = list_cvs(cv_dir)
+        if not cvs:
+            click.echo(f"No PDF files found in {cv_dir}")
+            return
+        results_file = data_folder / "output" / "cv_ingestion_results.jsonl"
+        parser = CVParser(ai_adapter, cache=CVParseCache(data_folder / "output" / "cv_cache"))
+        runner = CVIngestionRunner(parser, profiles_dir, results_file, workers=workers or CV_INGEST_WORKERS)
+        outcomes = runner.run(cvs)
+        for outcome in outcomes:
+            timing = f"{outcome.seconds:6.1f}s (text {outcome.extract_seconds:.1f}s, LLM {outcome.parse_seconds:.1f}s)"
+            detail = " - ".join(part for part in (outcome.profile, outcome.error) if part)
+            click.echo(f"{outcome.status:>8}  {timing}  {Path(outcome.cv).name}: {detail}")
+        failed = sum(outcome.status != INGESTED for outcome in outcomes)
+        click.echo(f"Ingested {len(outcomes) - failed} of {len(outcomes)} CVs into {profiles_dir}. Timings are in {results_file}")
+
     elif action == 'draft_email':
         if not job_description:
             click.echo("Error: --job_description is required for draft_email")
             return
+        from src.cover_letter_generator import CoverLetterGenerator
         generator = CoverLetterGenerator(ai_adapter)
         cover_letter = generator.generate_cover_letter(job_description)
         click.echo("--- Generated Cover Letter ---")
@@ -84,76 +128,113 @@ def main(action, cv_path, job_description, recruiter_email, gmail_user, gmail_pa
             click.echo("Error: Missing required information.")
             return
 
+        from src.cover_letter_generator import CoverLetterGenerator
         generator = CoverLetterGenerator(ai_adapter)
         cover_letter = generator.generate_cover_letter(job_description)
 
-        agent = GmailAgent(gmail_user, gmail_password)
         try:
             attachment = cv_path
             if not attachment and (data_folder / "resume.pdf").exists():
                 attachment = str(data_folder / "resume.pdf")
 
-            agent.send_email(
-                to_email=recruiter_email,
-                subject="Job Application",
-                body=cover_letter,
-                attachment_path=attachment
-            )
+            with gmail_agent(gmail_user, gmail_password, data_folder) as agent:
+                agent.send_email(
+                    to_email=recruiter_email,
+                    subject="Job Application",
+                    body=cover_letter,
+                    attachment_path=attachment
+                )
             click.echo(f"Application sent to {recruiter_email} with attachment {attachment if attachment else 'None'}")
         except Exception as e:
             click.echo(f"Error sending email: {e}")
 
+    elif action == 'apply_email_batch':
+        if not applications:
+            click.echo("Error: --applications is required for apply_email_batch")
+            return
+        if not gmail_user:
+             gmail_user = click.prompt("Please enter your Gmail address")
+        if not gmail_password:
+             gmail_password = click.prompt("Please enter your Gmail App Password", hide_input=True)
+
+        from src.cover_letter_generator import CoverLetterGenerator
+        from src.gmail_agent import SENT, OutgoingEmail
+        generator = CoverLetterGenerator(ai_adapter)
+        attachment = cv_path
+        if not attachment and (data_folder / "resume.pdf").exists():
+            attachment = str(data_folder / "resume.pdf")
+
+        emails = []
+        for number, line in enumerate(applications, start=1):
+            if not line.strip():
+                continue
+            try:
+                application = json.loads(line)
+                recipient, description = application['recruiter_email'], application['job_description']
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                click.echo(f"Skipping line {number} of {applications.name}: {e}")
+                continue
+            cover_letter = generator.generate_cover_letter(description)
+            emails.append(OutgoingEmail(recipient, application.get('subject') or "Job Application", cover_letter, attachment))
+
+        try:
+            with gmail_agent(gmail_user, gmail_password, data_folder) as agent:
+                outcomes = agent.send_batch(emails)
+        except Exception as e:
+            click.echo(f"Error sending emails: {e}")
+            return
+        for outcome in outcomes:
+            click.echo(f"{outcome.status:>8}  {outcome.to_email}" + (f": {outcome.error}" if outcome.error else ""))
+        sent = sum(outcome.status == SENT for outcome in outcomes)
+        click.echo(f"Sent {sent} of {len(outcomes)} applications over one SMTP session.")
+
     elif action == 'apply_portal':
         if not portal_url:
             portal_url = click.prompt("Please enter the job portal URL")
 
         try:
-            with open(plain_text_resume_file, "r") as f:
-                resume_data = yaml.safe_load(f)
-
-            # Flatten resume data for easier mapping
-            flat_resume_data = {}
-
-            # Personal Info
-            if 'personal_information' in resume_data:
-                for k, v in resume_data['personal_information'].items():
-                    flat_resume_data[f"personal_information.{k}"] = v
-
-            # Education (just taking the most recent/first one for simplicity in flat mapping)
-            if 'education_details' in resume_data and isinstance(resume_data['education_details'], list) and len(resume_data['education_details']) > 0:
-                edu = resume_data['education_details'][0]
-                for k, v in edu.items():
-                    if isinstance(v, (str, int, float)):
-                        flat_resume_data[f"education.{k}"] = v
-
-            # Experience (most recent)
-            if 'experience_details' in resume_data and isinstance(resume_data['experience_details'], list) and len(resume_data['experience_details']) > 0:
-                exp = resume_data['experience_details'][0]
-                for k, v in exp.items():
-                    if isinstance(v, (str, int, float)):
-                        flat_resume_data[f"experience.{k}"] = v
-
-            # Projects
-            if 'projects' in resume_data and isinstance(resume_data['projects'], list) and len(resume_data['projects']) > 0:
-                 proj = resume_data['projects'][0]
-                 for k, v in proj.items():
-                     flat_resume_data[f"project.{k}"] = v
-
-            # Skills/Languages/Interests (often lists)
-            if 'languages' in resume_data:
-                flat_resume_data['languages'] = ", ".join([l.get('language', '') for l in resume_data['languages']])
-
-            if 'interests' in resume_data:
-                flat_resume_data['interests'] = ", ".join(resume_data['interests'])
-
-            driver = init_browser()
-            applier = GenericPortalApplier(driver, ai_adapter, flat_resume_data)
-            applier.apply(portal_url)
-            click.echo(f"Application process initiated for {portal_url}")
-            click.echo("The browser will remain open for you to verify and complete the application.")
-            input("Press Enter to close browser...")
+            resume_projection = load_resume_projection(plain_text_resume_file)
+
+            from src.generic_applier import GenericPortalApplier
+            pool = create_browser_session_pool(max_size=1, fast=parameters.get('fast_browser', False))
+            try:
+                with pool.session() as driver:
+                    applier = GenericPortalApplier(driver, ai_adapter, resume_projection, **portal_settings(parameters, data_folder))
+                    applier.apply(portal_url)
+                    click.echo(f"Application process initiated for {portal_url}")
+                    click.echo("The browser will remain open for you to verify and complete the application.")
+                    input("Press Enter to close browser...")
+            finally:
+                pool.close()
         except Exception as e:
             click.echo(f"Error applying to portal: {e}")
 
+    elif action == 'apply_portal_batch':
+        if not portal_urls:
+            click.echo("Error: --portal_urls is required for apply_portal_batch")
+            return
+
+        from src.application_ledger import ApplicationLedger
+        from src.generic_applier import GenericPortalApplier
+        from src.portal_batch import PortalBatchRunner
+
+        output_folder = data_folder / "output"
+        resume_projection = load_resume_projection(plain_text_resume_file)
+        settings = portal_settings(parameters, data_folder)
+        workers = workers or PORTAL_BROWSER_POOL_SIZE
+        pool = create_browser_session_pool(max_size=workers, fast=parameters.get('fast_browser', False))
+        runner = PortalBatchRunner(
+            pool,
+            lambda driver: GenericPortalApplier(driver, ai_adapter, resume_projection, **settings),
+            ApplicationLedger(output_folder / "portal_ledger.jsonl"),
+            output_folder / "portal_results.jsonl",
+            workers=workers,
+        )
+        try:
+            results = runner.run(portal_urls)
+        finally:
+            pool.close()
+        click.echo(f"Portal batch finished: {dict(results)}. Outcomes and timings are in {output_folder / 'portal_results.jsonl'}")
+
 if __name__ == '__main__':
     main()
@@ -4,12 +4,10 @@ import yaml
 import os
 import shutil
 from pathlib import Path
-from src.cv_parser import CVParser
-from src.cover_letter_generator import CoverLetterGenerator
-from src.gmail_agent import GmailAgent
-from src.generic_applier import GenericPortalApplier
+from src.gmail_agent import GmailAgent, SendRateLimiter
 from src.llm.llm_manager import AIAdapter
-from main import ConfigValidator, FileManager, init_browser
+from src.resume_projection import load_resume_projection
+from main import ConfigValidator, FileManager, create_browser_session_pool
 from loguru import logger
 
 # Setup Page
@@ -21,6 +19,7 @@ SECRETS_FILE = DATA_FOLDER / "secrets.yaml"
 CONFIG_FILE = DATA_FOLDER / "config.yaml"
 RESUME_FILE = DATA_FOLDER / "plain_text_resume.yaml"
 PDF_RESUME_FILE = DATA_FOLDER / "resume.pdf"
+GMAIL_STATE_FILE = DATA_FOLDER / "output" / "gmail_sent.json"
 
 # Ensure data folder exists
 if not DATA_FOLDER.exists():
@@ -52,6 +51,21 @@ def get_ai_adapter(api_key):
         st.error(f"Error initializing AI: {e}")
         return None
 
+@st.cache_resource
+def get_browser_pool():
+    # Shared by every Streamlit session and rerun, so Chrome windows are reused instead of leaked
+    return create_browser_session_pool()
+
+@st.cache_resource
+def get_form_mapping_cache():
+    from src.form_mapping_cache import FormMappingCache
+    return FormMappingCache(DATA_FOLDER / "output" / "form_mappings.json")
+
+def release_portal_browser(discard=False):
+    driver = st.session_state.pop('portal_browser', None)
+    if driver is not None:
+        get_browser_pool().release(driver, discard=discard)
+
 # --- UI Components ---
 
 st.title("🦅 AIHawk: Agentic Job Application Assistant")
@@ -110,8 +124,11 @@ with tab_resume:
                             f.write(uploaded_file.getbuffer())
 
                         # Initialize AI
+                        from src.cv_parse_cache import CVParseCache
+                        from src.cv_parser import CVParser
+
                         adapter = get_ai_adapter(api_key)
-                        parser = CVParser(adapter)
+                        parser = CVParser(adapter, cache=CVParseCache(DATA_FOLDER / "output" / "cv_cache"))
 
                         # Parse
                         text = parser.extract_text_from_pdf(str(temp_path))
@@ -150,6 +167,8 @@ with tab_cover_letter:
             st.warning("Please enter a job description.")
         else:
             with st.spinner("Drafting your letter..."):
+                from src.cover_letter_generator import CoverLetterGenerator
+
                 adapter = get_ai_adapter(api_key)
                 generator = CoverLetterGenerator(adapter)
                 draft = generator.generate_cover_letter(job_desc)
@@ -184,15 +203,15 @@ with tab_email:
         else:
             with st.spinner("Sending email..."):
                 try:
-                    agent = GmailAgent(gmail_user, gmail_pass)
                     attachment = str(PDF_RESUME_FILE) if (attach_resume and PDF_RESUME_FILE.exists()) else None
 
-                    agent.send_email(
-                        to_email=recruiter_email,
-                        subject=subject_line,
-                        body=email_body,
-                        attachment_path=attachment
-                    )
+                    with GmailAgent(gmail_user, gmail_pass, rate_limiter=SendRateLimiter(state_file=GMAIL_STATE_FILE)) as agent:
+                        agent.send_email(
+                            to_email=recruiter_email,
+                            subject=subject_line,
+                            body=email_body,
+                            attachment_path=attachment
+                        )
                     st.success(f"Application sent to {recruiter_email}!")
                 except Exception as e:
                     st.error(f"Failed to send email: {e}")
@@ -216,53 +235,27 @@ with tab_portal:
             status_text.info("Initializing Agent...")
 
             try:
-                # Load Resume Data
-                with open(RESUME_FILE, "r") as f:
-                    resume_data = yaml.safe_load(f)
-
-                # Flatten Data (Logic copied/adapted from agentic_main.py)
-                flat_resume_data = {}
-                # Personal Info
-                if 'personal_information' in resume_data:
-                    for k, v in resume_data['personal_information'].items():
-                        flat_resume_data[f"personal_information.{k}"] = v
-
-                # Education
-                if 'education_details' in resume_data and isinstance(resume_data['education_details'], list) and len(resume_data['education_details']) > 0:
-                    edu = resume_data['education_details'][0]
-                    for k, v in edu.items():
-                        if isinstance(v, (str, int, float)):
-                            flat_resume_data[f"education.{k}"] = v
-
-                # Experience
-                if 'experience_details' in resume_data and isinstance(resume_data['experience_details'], list) and len(resume_data['experience_details']) > 0:
-                    exp = resume_data['experience_details'][0]
-                    for k, v in exp.items():
-                        if isinstance(v, (str, int, float)):
-                            flat_resume_data[f"experience.{k}"] = v
-
-                # Projects
-                if 'projects' in resume_data and isinstance(resume_data['projects'], list) and len(resume_data['projects']) > 0:
-                     proj = resume_data['projects'][0]
-                     for k, v in proj.items():
-                         flat_resume_data[f"project.{k}"] = v
-
-                if 'languages' in resume_data:
-                    flat_resume_data['languages'] = ", ".join([l.get('language', '') for l in resume_data['languages']])
-
-                if 'interests' in resume_data:
-                    flat_resume_data['interests'] = ", ".join(resume_data['interests'])
+                resume_projection = load_resume_projection(RESUME_FILE)
 
                 # Launch
                 status_text.info(f"Launching browser for {portal_url}...")
 
+                from src.generic_applier import GenericPortalApplier
+
                 adapter = get_ai_adapter(api_key)
-                driver = init_browser() # This comes from main.py
-                applier = GenericPortalApplier(driver, adapter, flat_resume_data)
+                release_portal_browser()
+                driver = get_browser_pool().acquire(timeout=60)
+                st.session_state['portal_browser'] = driver
+                applier = GenericPortalApplier(driver, adapter, resume_projection, mapping_cache=get_form_mapping_cache())
 
                 applier.apply(portal_url)
 
                 status_text.success("Agent finished processing the page(s). Please check the browser window to verify and submit.")
 
             except Exception as e:
+                release_portal_browser(discard=True)
                 status_text.error(f"Agent failed: {e}")
+
+    if 'portal_browser' in st.session_state and st.button("Done, free the browser"):
+        release_portal_browser()
+        st.rerun()
@@ -11,3 +11,49 @@ MINIMUM_LOG_LEVEL can only be one of the followings:
 MINIMUM_LOG_LEVEL = "DEBUG"
 
 MINIMUM_WAIT_TIME = 60
+
+"""
+Readiness waits (see src/wait_policy.py). After the page signals that it is ready,
+the bot still pauses for a random human-like delay between MINIMUM_HUMAN_DELAY and
+MAXIMUM_HUMAN_DELAY seconds, counted from the start of the wait.
+"""
+MINIMUM_HUMAN_DELAY = 0.4
+MAXIMUM_HUMAN_DELAY = 1.2
+READINESS_TIMEOUT = 15
+
+"""
+Warm browser sessions for portal applications (see src/browser_session_pool.py). At most
+PORTAL_BROWSER_POOL_SIZE Chrome windows are kept; one that stays unused for
+PORTAL_BROWSER_IDLE_TIMEOUT seconds is closed.
+"""
+PORTAL_BROWSER_POOL_SIZE = 2
+PORTAL_BROWSER_IDLE_TIMEOUT = 300
+
+"""
+Default limits of the generic portal applier (src/generic_applier.py). Both can be overridden
+with the optional 'portal' section of config.yaml.
+"""
+PORTAL_MAX_PAGES = 5
+
+"""
+Tailored resumes (see src/tailored_resume_cache.py). A resume generated for one job description
+is reused for descriptions whose SimHash fingerprints differ in at most
+TAILORED_RESUME_MAX_DISTANCE of 64 bits (reposts, the same role in another city). The oldest
+tailored resumes in generated_cv/ are deleted once they grow beyond GENERATED_CV_MAX_MB.
+"""
+TAILORED_RESUME_MAX_DISTANCE = 4
+GENERATED_CV_MAX_MB = 200
+
+"""
+Bulk CV ingestion (see src/cv_ingestion.py). agentic_main.py --action ingest_cvs parses at most
+CV_INGEST_WORKERS CVs at once; each of them sends its sections to the LLM concurrently.
+"""
+CV_INGEST_WORKERS = 4
+
+"""
+Email applications (see src/gmail_agent.py). Messages are spaced to at most
+GMAIL_MESSAGES_PER_MINUTE, and sending stops for the day after GMAIL_DAILY_LIMIT messages,
+below the 500 a day Gmail allows personal accounts.
+"""
+GMAIL_MESSAGES_PER_MINUTE = 20
+GMAIL_DAILY_LIMIT = 400
@@ -0,0 +1,67 @@
+"""
+Compares Chrome startup and page load times of the default and the fast browser options.
+
+    python -m benchmarks.browser_startup --runs 3 --url https://www.linkedin.com/jobs
+
+Each run starts a fresh browser on a throwaway profile, so the numbers include a cold cache.
+"""
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from src.driver_resolver import ChromeDriverResolver
+from src.utils import chrome_browser_options, enable_fast_mode
+
+NAVIGATION_TIMING = """
+const [entry] = performance.getEntriesByType('navigation');
+return entry ? [entry.domContentLoadedEventEnd, entry.loadEventEnd, performance.getEntriesByType('resource').length] : null;
+"""
+
+
+def measure(driver_path, urls, fast):
+    with tempfile.TemporaryDirectory() as user_data_dir:
+        options = chrome_browser_options(str(Path(user_data_dir) / "profile"), fast=fast)
+        started_at = time.perf_counter()
+        driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+        if fast:
+            enable_fast_mode(driver)
+        startup = time.perf_counter() - started_at
+        loads = []
+        try:
+            for url in urls:
+                started_at = time.perf_counter()
+                driver.get(url)
+                wall = time.perf_counter() - started_at
+                dom_ready, load, requests = driver.execute_script(NAVIGATION_TIMING) or (0, 0, 0)
+                loads.append((wall, dom_ready / 1000, load / 1000, requests))
+        finally:
+            driver.quit()
+    return startup, loads
+
+
+def summarize(name, samples):
+    startups = [startup for startup, _ in samples]
+    loads = [load for _, page_loads in samples for load in page_loads]
+    print(f"{name:>8}: startup median {statistics.median(startups):.2f}s, "
+          f"page load median {statistics.median(load[0] for load in loads):.2f}s "
+          f"(DOMContentLoaded {statistics.median(load[1] for load in loads):.2f}s, "
+          f"load {statistics.median(load[2] for load in loads):.2f}s, "
+          f"{statistics.median(load[3] for load in loads):.0f} requests)")
+
+
+@click.command()
+@click.option('--runs', type=click.IntRange(min=1), default=3, show_default=True)
+@click.option('--url', 'urls', multiple=True, default=["https://www.linkedin.com/jobs"], show_default=True)
+def main(runs, urls):
+    driver_path = ChromeDriverResolver().resolve()
+    for name, fast in (("default", False), ("fast", True)):
+        summarize(name, [measure(driver_path, urls, fast) for _ in range(runs)])
+
+
+if __name__ == "__main__":
+    main()
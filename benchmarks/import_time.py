@@ -0,0 +1,59 @@
+"""
+Measures how long the entry points take to import, using Python's -X importtime.
+
+    python -m benchmarks.import_time --runs 5 --top 10
+
+Every run imports the module in a fresh interpreter. The report shows the median total import
+time, the slowest direct imports of the last run, and which heavy packages were loaded.
+"""
+import re
+import statistics
+import subprocess
+import sys
+
+import click
+
+ENTRY_POINTS = ["main", "agentic_main", "src.llm.llm_manager"]
+HEAVY_PACKAGES = ["selenium", "webdriver_manager", "lib_resume_builder_AIHawk", "langchain_core", "pdfminer",
+                  "httpx", "Levenshtein"]
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_once(module):
+    """Returns the total import time, the cumulative time of each direct import and the heavy packages loaded."""
+    check = f"import sys, {module}; print(','.join(p for p in {HEAVY_PACKAGES!r} if p in sys.modules))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", check], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise click.ClickException(f"Importing {module} failed:\n{result.stderr.splitlines()[-1]}")
+    total, direct_imports = 0, {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        depth = len(match.group(3)) // 2
+        if depth == 0:
+            total += int(match.group(2))
+        elif depth == 1:
+            direct_imports[match.group(4)] = int(match.group(2))
+    loaded = [package for package in result.stdout.strip().split(",") if package]
+    return total, direct_imports, loaded
+
+
+@click.command()
+@click.option('--runs', type=click.IntRange(min=1), default=5, show_default=True)
+@click.option('--top', type=click.IntRange(min=0), default=10, show_default=True)
+@click.argument('modules', nargs=-1)
+def main(runs, top, modules):
+    for module in modules or ENTRY_POINTS:
+        totals = []
+        for _ in range(runs):
+            total, direct_imports, loaded = import_once(module)
+            totals.append(total)
+        print(f"{module}: {statistics.median(totals) / 1000:.0f} ms median over {runs} runs, "
+              f"heavy packages loaded: {', '.join(loaded) or 'none'}")
+        for name, micros in sorted(direct_imports.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"    {micros / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares pdfminer's extract_text with the page-parallel extractor on a corpus of PDFs.
+
+    python -m benchmarks.pdf_extraction --corpus ~/cvs --workers 4
+    python -m benchmarks.pdf_extraction --pages 30 --documents 10
+
+Without --corpus, a synthetic corpus of multi-page CVs is generated with ReportLab. The report
+shows the total time and pages per second of each extractor setting.
+"""
+import io
+import random
+import time
+from pathlib import Path
+
+import click
+from pdfminer.high_level import extract_text
+from reportlab.pdfgen import canvas
+
+from src.pdf_extractor import PdfExtractor, count_pages
+
+WORDS = ("data analysis reporting python sql dashboards survey monitoring evaluation donors field teams "
+         "logistics procurement budget training kabul herat mazar coordination english dari pashto").split()
+
+
+def synthetic_cv(pages: int, rng: random.Random) -> bytes:
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(pages):
+        pdf.setFont("Helvetica-Bold", 14)
+        pdf.drawString(56, 790, f"Experience, page {page + 1}")
+        pdf.setFont("Helvetica", 10)
+        for line in range(55):
+            column = 56 if line % 2 == 0 or page % 3 else 310
+            pdf.drawString(column, 770 - line * 13, " ".join(rng.choices(WORDS, k=9)))
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def run(name, extract, corpus):
+    started_at = time.perf_counter()
+    for pdf in corpus:
+        extract(pdf)
+    elapsed = time.perf_counter() - started_at
+    pages = sum(count_pages(pdf) for pdf in corpus)
+    print(f"{name:>22}: {elapsed:.2f}s, {pages / elapsed:.1f} pages/s")
+
+
+@click.command()
+@click.option('--corpus', type=click.Path(exists=True, file_okay=False, path_type=Path), default=None)
+@click.option('--documents', type=click.IntRange(min=1), default=5, show_default=True)
+@click.option('--pages', type=click.IntRange(min=1), default=20, show_default=True)
+@click.option('--workers', type=click.IntRange(min=1), default=None, help="Default: one per CPU.")
+def main(corpus, documents, pages, workers):
+    if corpus:
+        pdfs = [path.read_bytes() for path in sorted(corpus.glob("*.pdf"))]
+    else:
+        rng = random.Random(1)
+        pdfs = [synthetic_cv(pages, rng) for _ in range(documents)]
+    if not pdfs:
+        raise click.ClickException(f"No PDF files in {corpus}")
+
+    run("pdfminer extract_text", lambda pdf: extract_text(io.BytesIO(pdf)), pdfs)
+    run("sequential", PdfExtractor(workers=1).extract, pdfs)
+    run("parallel", PdfExtractor(workers=workers).extract, pdfs)
+    run("parallel, fast", PdfExtractor(workers=workers, fast=True).extract, pdfs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,27 @@
 import os
+import random
 import re
 import sys
+import time
+from itertools import product
 from pathlib import Path
 import yaml
 import click
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import WebDriverException
-from lib_resume_builder_AIHawk import Resume,StyleManager,FacadeManager,ResumeGenerator
-from src.utils import chrome_browser_options
+from app_config import PORTAL_BROWSER_IDLE_TIMEOUT, PORTAL_BROWSER_POOL_SIZE
+from src.utils import chrome_browser_options, derived_profile_path, enable_fast_mode
 from src.llm.llm_manager import GPTAnswerer
-from src.aihawk_authenticator import AIHawkAuthenticator
-from src.aihawk_bot_facade import AIHawkBotFacade
-from src.aihawk_job_manager import AIHawkJobManager
 from src.job_application_profile import JobApplicationProfile
+from src.application_ledger import ApplicationLedger
+from src.browser_session_pool import BrowserSessionPool
+from src.pacing import PacingPolicy
+from src.run_checkpoint import RunCheckpoint
+from src.search_plan import SearchPlan
+from src.worker_pool import BrowserWorkerPool, JobLinkTask, SearchPlanTask, SearchTask, Worker
 from loguru import logger
 
+# Selenium, webdriver-manager, the resume builder and the LinkedIn bot are imported inside the
+# functions that use them, so agentic_main.py and app.py can import the config helpers cheaply.
+
 # Suppress stderr
 sys.stderr = open(os.devnull, 'w')
 
@@ -97,6 +102,15 @@ class ConfigValidator:
             if parameters[blacklist] is None:
                 parameters[blacklist] = []
 
+        if parameters.get('pacing') is not None and not isinstance(parameters['pacing'], dict):
+            raise ConfigError(f"'pacing' must be a mapping in config file {config_yaml_path}")
+
+        if parameters.get('search_plan') is not None and not isinstance(parameters['search_plan'], dict):
+            raise ConfigError(f"'search_plan' must be a mapping in config file {config_yaml_path}")
+
+        if parameters.get('portal') is not None and not isinstance(parameters['portal'], dict):
+            raise ConfigError(f"'portal' must be a mapping in config file {config_yaml_path}")
+
         return parameters
 
 
@@ -148,32 +162,72 @@ class FileManager:
 
         return result
 
-def init_browser() -> webdriver.Chrome:
+def init_browser(profile_path: str = None, fast: bool = False) -> "webdriver.Chrome":
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from src.driver_resolver import ChromeDriverResolver, StartupTiming
+
     try:
-        
-        options = chrome_browser_options()
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        timing = StartupTiming()
+        options = chrome_browser_options(profile_path, fast=fast) if profile_path else chrome_browser_options(fast=fast)
+        service = ChromeService(ChromeDriverResolver().resolve(timing))
+        started_at = time.perf_counter()
+        driver = webdriver.Chrome(service=service, options=options)
+        if fast:
+            enable_fast_mode(driver)
+        timing.browser_launch = time.perf_counter() - started_at
+        logger.info(timing.summary())
+        return driver
     except Exception as e:
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
 
-def create_and_run_bot(parameters, llm_api_key):
+def create_browser_session_pool(max_size: int = PORTAL_BROWSER_POOL_SIZE, fast: bool = False) -> BrowserSessionPool:
+    """Warm browsers for portal applications, each on its own Chrome profile next to the LinkedIn one."""
+    return BrowserSessionPool(lambda slot: init_browser(derived_profile_path(f"portal_{slot}"), fast),
+                              max_size=max_size, idle_timeout=PORTAL_BROWSER_IDLE_TIMEOUT)
+
+def create_and_run_bot(parameters, llm_api_key, workers: int = 1, job_links: list = None, search_plan_path: Path = None,
+                       resume_run: bool = False):
+    from selenium.common.exceptions import WebDriverException
+    from lib_resume_builder_AIHawk import Resume, StyleManager, FacadeManager, ResumeGenerator
+    from src.aihawk_authenticator import AIHawkAuthenticator
+    from src.aihawk_bot_facade import AIHawkBotFacade
+    from src.aihawk_job_manager import AIHawkJobManager
+    from src.resume_loader import load_resume
+
     try:
         style_manager = StyleManager()
         resume_generator = ResumeGenerator()
-        with open(parameters['uploads']['plainTextResume'], "r", encoding='utf-8') as file:
-            plain_text_resume = file.read()
-        resume_object = Resume(plain_text_resume)
+        plain_text_resume = load_resume(parameters['uploads']['plainTextResume'])
+        resume_object = Resume(plain_text_resume.text)
         resume_generator_manager = FacadeManager(llm_api_key, style_manager, resume_generator, resume_object, Path("data_folder/output"))
         os.system('cls' if os.name == 'nt' else 'clear')
         resume_generator_manager.choose_style()
         os.system('cls' if os.name == 'nt' else 'clear')
         
-        job_application_profile_object = JobApplicationProfile(plain_text_resume)
-        
-        browser = init_browser()
+        job_application_profile_object = JobApplicationProfile(plain_text_resume.data)
+
+        search_plan = SearchPlan(search_plan_path) if search_plan_path else None
+
+        if workers > 1 or job_links:
+            run_worker_pool(parameters, llm_api_key, workers, job_links, search_plan, resume_object,
+                            job_application_profile_object, resume_generator_manager)
+            return
+
+        fast = parameters.get('fast_browser', False)
+        browser = init_browser(fast=fast)
         login_component = AIHawkAuthenticator(browser)
         apply_component = AIHawkJobManager(browser)
+        if parameters.get('scrape_ahead'):
+            apply_component.set_scrape_ahead_driver_factory(lambda: init_browser(derived_profile_path("scrape_ahead"), fast))
+        if search_plan is not None:
+            apply_component.set_search_plan(search_plan)
+        elif parameters.get('scrape_ahead'):
+            if resume_run:
+                logger.warning("--resume_run is not supported together with scrape_ahead, starting a new run.")
+        else:
+            apply_component.set_checkpoint(RunCheckpoint(Path(parameters['outputFileDirectory']) / "run_checkpoint.json",
+                                                         resume=resume_run))
         gpt_answerer_component = GPTAnswerer(parameters, llm_api_key)
         bot = AIHawkBotFacade(login_component, apply_component)
         bot.set_job_application_profile_and_resume(job_application_profile_object, resume_object)
@@ -187,9 +241,59 @@ def create_and_run_bot(parameters, llm_api_key):
         raise RuntimeError(f"Error running the bot: {str(e)}")
 
 
+def run_worker_pool(parameters, llm_api_key, workers, job_links, search_plan, resume_object,
+                    job_application_profile_object, resume_generator_manager):
+    from src.aihawk_authenticator import AIHawkAuthenticator
+    from src.aihawk_bot_facade import AIHawkBotFacade
+    from src.aihawk_job_manager import AIHawkJobManager
+
+    output_folder = Path(parameters['outputFileDirectory'])
+    ledger = ApplicationLedger(output_folder / "ledger.jsonl")
+    # One policy for all workers: the daily caps and submission pacing are per LinkedIn account
+    pacing = PacingPolicy.from_parameters(parameters, state_file=output_folder / "pacing_state.json")
+
+    def create_worker(worker_id):
+        browser = init_browser(derived_profile_path(f"worker_{worker_id}"), parameters.get('fast_browser', False))
+        try:
+            apply_component = AIHawkJobManager(browser)
+            bot = AIHawkBotFacade(AIHawkAuthenticator(browser), apply_component)
+            bot.set_job_application_profile_and_resume(job_application_profile_object, resume_object)
+            bot.set_gpt_answerer_and_resume_generator(GPTAnswerer(parameters, llm_api_key), resume_generator_manager)
+            bot.set_parameters(parameters)
+            apply_component.set_ledger(ledger)
+            if search_plan is not None:
+                apply_component.set_search_plan(search_plan)
+            apply_component.set_pacing(pacing)
+            bot.start_login()
+            apply_component.prepare_applier()
+        except Exception:
+            apply_component.close()
+            browser.quit()
+            raise
+
+        def close():
+            apply_component.close()
+            browser.quit()
+
+        return Worker(apply_component, close)
+
+    if job_links:
+        tasks = [JobLinkTask(link) for link in job_links]
+    elif search_plan is not None:
+        tasks = [SearchPlanTask() for _ in range(workers)]
+    else:
+        tasks = [SearchTask(position, location) for position, location in product(parameters['positions'], parameters['locations'])]
+        random.shuffle(tasks)
+    BrowserWorkerPool(workers, create_worker).run(tasks)
+
+
 @click.command()
 @click.option('--resume', type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path), help="Path to the resume PDF file")
-def main(resume: Path = None):
+@click.option('--workers', type=click.IntRange(min=1), default=1, show_default=True, help="Number of parallel browser workers")
+@click.option('--job_links', type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path), help="File with one LinkedIn job URL per line to apply to instead of searching")
+@click.option('--search_plan', type=click.Path(dir_okay=False, path_type=Path), help="SQLite file shared by cooperating processes to split the searches between them")
+@click.option('--resume_run', is_flag=True, help="Continue the previous run from its last checkpoint instead of starting over")
+def main(resume: Path = None, workers: int = 1, job_links: Path = None, search_plan: Path = None, resume_run: bool = False):
     try:
         data_folder = Path("data_folder")
         secrets_file, config_file, plain_text_resume_file, output_folder = FileManager.validate_data_folder(data_folder)
@@ -200,7 +304,10 @@ def main(resume: Path = None):
         parameters['uploads'] = FileManager.file_paths_to_dict(resume, plain_text_resume_file)
         parameters['outputFileDirectory'] = output_folder
         
-        create_and_run_bot(parameters, llm_api_key)
+        links = None
+        if job_links:
+            links = [line.strip() for line in job_links.read_text(encoding='utf-8').splitlines() if line.strip()]
+        create_and_run_bot(parameters, llm_api_key, workers, links, search_plan, resume_run)
     except ConfigError as ce:
         logger.error(f"Configuration error: {str(ce)}")
         logger.error(f"Refer to the configuration guide for troubleshooting: https://github.com/feder-cr/AIHawk_AIHawk_automatic_job_application/blob/main/readme.md#configuration {str(ce)}")
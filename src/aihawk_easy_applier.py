@@ -1,15 +1,14 @@
 import base64
+import copy
 import json
 import os
-import random
 import re
+import threading
 import time
 import traceback
 from typing import List, Optional, Any, Tuple
 
 from httpx import HTTPStatusError
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
@@ -19,12 +18,25 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
 import src.utils as utils
+from src.cover_letter_renderer import CoverLetterRenderer, Letterhead
+from src.document_prefetcher import DocumentPrefetcher
+from src.document_store import DocumentStore
+from src.form_filler import FormFiller
+from src.resume_projection import ResumeProjection
+from src.tailored_resume_cache import TailoredResumeCache
+from src.wait_policy import WaitPolicy
 from loguru import logger
 
+# answers.json is read-modify-written by every applier in a worker pool
+_answers_file_lock = threading.Lock()
+
 
 class AIHawkEasyApplier:
     def __init__(self, driver: Any, resume_dir: Optional[str], set_old_answers: List[Tuple[str, str, str]],
-                 gpt_answerer: Any, resume_generator_manager):
+                 gpt_answerer: Any, resume_generator_manager, wait_policy: Optional[WaitPolicy] = None,
+                 resume_projection: Optional[ResumeProjection] = None,
+                 resume_cache: Optional[TailoredResumeCache] = None,
+                 prefetcher: Optional[DocumentPrefetcher] = None, document_store: Optional[DocumentStore] = None):
         logger.debug("Initializing AIHawkEasyApplier")
         if resume_dir is None or not os.path.exists(resume_dir):
             resume_dir = None
@@ -33,6 +45,14 @@ class AIHawkEasyApplier:
         self.set_old_answers = set_old_answers
         self.gpt_answerer = gpt_answerer
         self.resume_generator_manager = resume_generator_manager
+        self.wait_policy = wait_policy or WaitPolicy(driver)
+        self.form_filler = FormFiller(driver)
+        self.resume_projection = resume_projection
+        self.resume_cache = resume_cache or TailoredResumeCache()
+        self.document_store = document_store or self.resume_cache.documents
+        self.prefetcher = prefetcher
+        letterhead = Letterhead.from_resume(resume_projection.fields) if resume_projection is not None else None
+        self.cover_letter_renderer = CoverLetterRenderer(letterhead=letterhead)
         self.all_data = self._load_questions_from_json()
 
         logger.debug("AIHawkEasyApplier initialized successfully")
@@ -68,8 +88,9 @@ class AIHawkEasyApplier:
             logger.warning("Redirected to AIHawk Premium page. Attempting to return to job page.")
             attempts += 1
 
+            self.wait_policy.reset_network_tracking()
             self.driver.get(job.link)
-            time.sleep(2)
+            self.wait_policy.page_ready()
             current_url = self.driver.current_url
 
         if "linkedin.com/premium" in current_url:
@@ -95,13 +116,14 @@ class AIHawkEasyApplier:
         logger.debug(f"Starting job application for job: {job}")
 
         try:
+            self.wait_policy.reset_network_tracking()
             self.driver.get(job.link)
             logger.debug(f"Navigated to job link: {job.link}")
         except Exception as e:
             logger.error(f"Failed to navigate to job link: {job.link}, error: {str(e)}")
             raise
 
-        time.sleep(random.uniform(3, 5))
+        self.wait_policy.page_ready()
         self.check_for_premium_redirect(job)
 
         try:
@@ -119,6 +141,8 @@ class AIHawkEasyApplier:
             job_description = self._get_job_description()
             job.set_job_description(job_description)
             logger.debug(f"Job description set: {job_description[:100]}")
+            if self.prefetcher is not None and self.resume_path is None:
+                self.prefetcher.schedule('resume', job.link, lambda: self._generate_resume_pdf(job))
 
             logger.debug("Retrieving recruiter link")
             recruiter_link = self._get_job_recruiter()
@@ -132,6 +156,10 @@ class AIHawkEasyApplier:
 
             logger.debug("Passing job information to GPT Answerer")
             self.gpt_answerer.set_job(job)
+            if self.prefetcher is not None:
+                # The form questions keep using gpt_answerer meanwhile; the copy keeps this job's state
+                answerer = copy.copy(self.gpt_answerer)
+                self.prefetcher.schedule('cover_letter', job.link, lambda: self._write_cover_letter(answerer))
 
             logger.debug("Filling out application form")
             self._fill_application_form(job)
@@ -146,6 +174,9 @@ class AIHawkEasyApplier:
             self._discard_application()
 
             raise Exception(f"Failed to apply to job! Original exception:\nTraceback:\n{tb_str}")
+        finally:
+            if self.prefetcher is not None:
+                self.prefetcher.forget(job.link)
 
     def _find_easy_apply_button(self, job: Any) -> WebElement:
         logger.debug("Searching for 'Easy Apply' button")
@@ -212,7 +243,7 @@ class AIHawkEasyApplier:
             if attempt == 0:
                 logger.debug("Refreshing page to retry finding 'Easy Apply' button")
                 self.driver.refresh()
-                time.sleep(random.randint(3, 5))
+                self.wait_policy.page_ready()
             attempt += 1
 
         page_source = self.driver.page_source
@@ -227,7 +258,7 @@ class AIHawkEasyApplier:
                                                            '//button[@aria-label="Click to see more description"]')
                 actions = ActionChains(self.driver)
                 actions.move_to_element(see_more_button).click().perform()
-                time.sleep(2)
+                self.wait_policy.dom_settled()
             except NoSuchElementException:
                 logger.debug("See more button not found, skipping")
 
@@ -287,13 +318,13 @@ class AIHawkEasyApplier:
         if 'submit application' in button_text:
             logger.debug("Submit button found, submitting application")
             self._unfollow_company()
-            time.sleep(random.uniform(1.5, 2.5))
+            self.wait_policy.element_ready(next_button, 'clickable')
             next_button.click()
-            time.sleep(random.uniform(1.5, 2.5))
+            self.wait_policy.dom_settled()
             return True
-        time.sleep(random.uniform(1.5, 2.5))
+        self.wait_policy.element_ready(next_button, 'clickable')
         next_button.click()
-        time.sleep(random.uniform(3.0, 5.0))
+        self.wait_policy.dom_settled()
         self._check_for_errors()
 
     def _unfollow_company(self) -> None:
@@ -316,9 +347,10 @@ class AIHawkEasyApplier:
         logger.debug("Discarding application")
         try:
             self.driver.find_element(By.CLASS_NAME, 'artdeco-modal__dismiss').click()
-            time.sleep(random.uniform(3, 5))
-            self.driver.find_elements(By.CLASS_NAME, 'artdeco-modal__confirm-dialog-btn')[0].click()
-            time.sleep(random.uniform(3, 5))
+            confirm_button = self.wait_policy.element_ready(
+                (By.CLASS_NAME, 'artdeco-modal__confirm-dialog-btn'), 'clickable')
+            confirm_button.click()
+            self.wait_policy.dom_settled()
         except Exception as e:
             logger.warning(f"Failed to discard application: {e}")
 
@@ -410,6 +442,7 @@ class AIHawkEasyApplier:
                 logger.debug("Uploading resume")
                 if self.resume_path is not None and self.resume_path.resolve().is_file():
                     element.send_keys(str(self.resume_path.resolve()))
+                    self.wait_policy.dom_settled()
                     logger.debug(f"Resume uploaded from path: {self.resume_path.resolve()}")
                 else:
                     logger.debug("Resume path not found or invalid, generating new resume")
@@ -422,29 +455,30 @@ class AIHawkEasyApplier:
 
     def _create_and_upload_resume(self, element, job):
         logger.debug("Starting the process of creating and uploading resume.")
-        folder_path = 'generated_cv'
+        file_path_pdf = self._prefetched('resume', job, lambda: self._generate_resume_pdf(job))
 
         try:
-            if not os.path.exists(folder_path):
-                logger.debug(f"Creating directory at path: {folder_path}")
-            os.makedirs(folder_path, exist_ok=True)
+            logger.debug(f"Uploading resume from path: {file_path_pdf}")
+            element.send_keys(os.path.abspath(file_path_pdf))
+            job.pdf_path = os.path.abspath(file_path_pdf)
+            self.wait_policy.dom_settled()
+            logger.debug(f"Resume created and uploaded successfully: {file_path_pdf}")
         except Exception as e:
-            logger.error(f"Failed to create directory: {folder_path}. Error: {e}")
-            raise
+            tb_str = traceback.format_exc()
+            logger.error(f"Resume upload failed: {tb_str}")
+            raise Exception(f"Upload failed: \nTraceback:\n{tb_str}")
 
-        while True:
-            try:
-                timestamp = int(time.time())
-                file_path_pdf = os.path.join(folder_path, f"CV_{timestamp}.pdf")
-                logger.debug(f"Generated file path for resume: {file_path_pdf}")
+    def _generate_resume_pdf(self, job) -> str:
+        """Returns the path of a resume tailored to the job, reusing one made for a near-identical description."""
+        cached_pdf = self.resume_cache.lookup(job.description)
+        file_path_pdf = str(cached_pdf) if cached_pdf else None
 
+        while file_path_pdf is None:
+            try:
                 logger.debug(f"Generating resume for job: {job.title} at {job.company}")
                 resume_pdf_base64 = self.resume_generator_manager.pdf_base64(job_description_text=job.description)
-                with open(file_path_pdf, "xb") as f:
-                    f.write(base64.b64decode(resume_pdf_base64))
+                file_path_pdf = str(self.resume_cache.store(job.description, base64.b64decode(resume_pdf_base64)))
                 logger.debug(f"Resume successfully generated and saved to: {file_path_pdf}")
-
-                break
             except HTTPStatusError as e:
                 if e.response.status_code == 429:
 
@@ -475,126 +509,38 @@ class AIHawkEasyApplier:
                     time.sleep(20)
                 else:
                     raise
+        return file_path_pdf
 
-        file_size = os.path.getsize(file_path_pdf)
-        max_file_size = 2 * 1024 * 1024  # 2 MB
-        logger.debug(f"Resume file size: {file_size} bytes")
-        if file_size > max_file_size:
-            logger.error(f"Resume file size exceeds 2 MB: {file_size} bytes")
-            raise ValueError("Resume file size exceeds the maximum limit of 2 MB.")
+    def _prefetched(self, kind: str, job, generate):
+        """Returns the document started in the background for this job, or generates it now."""
+        if self.prefetcher is None:
+            return generate()
+        return self.prefetcher.result(kind, job.link, generate)
 
-        allowed_extensions = {'.pdf', '.doc', '.docx'}
-        file_extension = os.path.splitext(file_path_pdf)[1].lower()
-        logger.debug(f"Resume file extension: {file_extension}")
-        if file_extension not in allowed_extensions:
-            logger.error(f"Invalid resume file format: {file_extension}")
-            raise ValueError("Resume file format is not allowed. Only PDF, DOC, and DOCX formats are supported.")
-
-        try:
-            logger.debug(f"Uploading resume from path: {file_path_pdf}")
-            element.send_keys(os.path.abspath(file_path_pdf))
-            job.pdf_path = os.path.abspath(file_path_pdf)
-            time.sleep(2)
-            logger.debug(f"Resume created and uploaded successfully: {file_path_pdf}")
-        except Exception as e:
-            tb_str = traceback.format_exc()
-            logger.error(f"Resume upload failed: {tb_str}")
-            raise Exception(f"Upload failed: \nTraceback:\n{tb_str}")
+    def _write_cover_letter(self, answerer=None) -> str:
+        return (answerer or self.gpt_answerer).answer_question_textual_wide_range("Write a cover letter")
 
     def _create_and_upload_cover_letter(self, element: WebElement, job) -> None:
         logger.debug("Starting the process of creating and uploading cover letter.")
 
-        cover_letter_text = self.gpt_answerer.answer_question_textual_wide_range("Write a cover letter")
-
-        folder_path = 'generated_cv'
+        cover_letter_text = self._prefetched('cover_letter', job, self._write_cover_letter)
 
         try:
-
-            if not os.path.exists(folder_path):
-                logger.debug(f"Creating directory at path: {folder_path}")
-            os.makedirs(folder_path, exist_ok=True)
+            file_path_pdf = str(self.document_store.put(self.cover_letter_renderer.render(cover_letter_text),
+                                                        "Cover_Letter"))
+            logger.debug(f"Cover letter successfully generated and saved to: {file_path_pdf}")
         except Exception as e:
-            logger.error(f"Failed to create directory: {folder_path}. Error: {e}")
+            logger.error(f"Failed to generate cover letter: {e}")
+            tb_str = traceback.format_exc()
+            logger.error(f"Traceback: {tb_str}")
             raise
 
-        while True:
-            try:
-                timestamp = int(time.time())
-                file_path_pdf = os.path.join(folder_path, f"Cover_Letter_{timestamp}.pdf")
-                logger.debug(f"Generated file path for cover letter: {file_path_pdf}")
-
-                c = canvas.Canvas(file_path_pdf, pagesize=A4)
-                page_width, page_height = A4
-                text_object = c.beginText(50, page_height - 50)
-                text_object.setFont("Helvetica", 12)
-
-                max_width = page_width - 100
-                bottom_margin = 50
-                available_height = page_height - bottom_margin - 50
-
-                def split_text_by_width(text, font, font_size, max_width):
-                    wrapped_lines = []
-                    for line in text.splitlines():
-
-                        if utils.stringWidth(line, font, font_size) > max_width:
-                            words = line.split()
-                            new_line = ""
-                            for word in words:
-                                if utils.stringWidth(new_line + word + " ", font, font_size) <= max_width:
-                                    new_line += word + " "
-                                else:
-                                    wrapped_lines.append(new_line.strip())
-                                    new_line = word + " "
-                            wrapped_lines.append(new_line.strip())
-                        else:
-                            wrapped_lines.append(line)
-                    return wrapped_lines
-
-                lines = split_text_by_width(cover_letter_text, "Helvetica", 12, max_width)
-
-                for line in lines:
-                    text_height = text_object.getY()
-                    if text_height > bottom_margin:
-                        text_object.textLine(line)
-                    else:
-
-                        c.drawText(text_object)
-                        c.showPage()
-                        text_object = c.beginText(50, page_height - 50)
-                        text_object.setFont("Helvetica", 12)
-                        text_object.textLine(line)
-
-                c.drawText(text_object)
-                c.save()
-                logger.debug(f"Cover letter successfully generated and saved to: {file_path_pdf}")
-
-                break
-            except Exception as e:
-                logger.error(f"Failed to generate cover letter: {e}")
-                tb_str = traceback.format_exc()
-                logger.error(f"Traceback: {tb_str}")
-                raise
-
-        file_size = os.path.getsize(file_path_pdf)
-        max_file_size = 2 * 1024 * 1024  # 2 MB
-        logger.debug(f"Cover letter file size: {file_size} bytes")
-        if file_size > max_file_size:
-            logger.error(f"Cover letter file size exceeds 2 MB: {file_size} bytes")
-            raise ValueError("Cover letter file size exceeds the maximum limit of 2 MB.")
-
-        allowed_extensions = {'.pdf', '.doc', '.docx'}
-        file_extension = os.path.splitext(file_path_pdf)[1].lower()
-        logger.debug(f"Cover letter file extension: {file_extension}")
-        if file_extension not in allowed_extensions:
-            logger.error(f"Invalid cover letter file format: {file_extension}")
-            raise ValueError("Cover letter file format is not allowed. Only PDF, DOC, and DOCX formats are supported.")
-
         try:
 
             logger.debug(f"Uploading cover letter from path: {file_path_pdf}")
             element.send_keys(os.path.abspath(file_path_pdf))
             job.cover_letter_path = os.path.abspath(file_path_pdf)
-            time.sleep(2)
+            self.wait_policy.dom_settled()
             logger.debug(f"Cover letter created and uploaded successfully: {file_path_pdf}")
         except Exception as e:
             tb_str = traceback.format_exc()
@@ -686,9 +632,19 @@ class AIHawkEasyApplier:
                         logger.debug(f"Found existing answer: {existing_answer}")
                         break
 
+            # Questions that are plainly a resume field ("Mobile phone number") need no LLM call
+            projected_answer = None
+            if self.resume_projection is not None and not is_cover_letter:
+                projected_answer = self.resume_projection.answer(question_text)
+                if is_numeric and projected_answer is not None and not projected_answer.replace('.', '', 1).isdigit():
+                    projected_answer = None
+
             if existing_answer and not is_cover_letter:
                 answer = existing_answer
                 logger.debug(f"Using existing answer: {answer}")
+            elif projected_answer is not None:
+                answer = projected_answer
+                logger.debug(f"Using resume field answer: {answer}")
             else:
                 if is_numeric:
                     answer = self.gpt_answerer.answer_question_numeric(question_text)
@@ -705,7 +661,7 @@ class AIHawkEasyApplier:
                 self._save_questions_to_json({'type': question_type, 'question': question_text, 'answer': answer})
                 logger.debug("Saved non-cover letter answer to JSON.")
 
-            time.sleep(1)
+            self.wait_policy.dom_settled()
             text_field.send_keys(Keys.ARROW_DOWN)
             text_field.send_keys(Keys.ENTER)
             logger.debug("Selected first option from the dropdown.")
@@ -801,8 +757,8 @@ class AIHawkEasyApplier:
 
     def _enter_text(self, element: WebElement, text: str) -> None:
         logger.debug(f"Entering text: {text}")
-        element.clear()
-        element.send_keys(text)
+        if not self.form_filler.fill_one(element, text):
+            raise Exception(f"Could not enter text {text[:30]!r} into the field")
 
     def _select_radio(self, radios: List[WebElement], answer: str) -> None:
         logger.debug(f"Selecting radio option: {answer}")
@@ -822,27 +778,31 @@ class AIHawkEasyApplier:
         question_data['question'] = self._sanitize_text(question_data['question'])
         logger.debug(f"Saving question data to JSON: {question_data}")
         try:
-            try:
-                with open(output_file, 'r') as f:
-                    try:
-                        data = json.load(f)
-                        if not isinstance(data, list):
-                            raise ValueError("JSON file format is incorrect. Expected a list of questions.")
-                    except json.JSONDecodeError:
-                        logger.error("JSON decoding failed")
-                        data = []
-            except FileNotFoundError:
-                logger.warning("JSON file not found, creating new file")
-                data = []
-            data.append(question_data)
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=4)
+            with _answers_file_lock:
+                self._append_question_to_file(output_file, question_data)
             logger.debug("Question data saved successfully to JSON")
         except Exception:
             tb_str = traceback.format_exc()
             logger.error(f"Error saving questions data to JSON file: {tb_str}")
             raise Exception(f"Error saving questions data to JSON file: \nTraceback:\n{tb_str}")
 
+    def _append_question_to_file(self, output_file: str, question_data: dict) -> None:
+        try:
+            with open(output_file, 'r') as f:
+                try:
+                    data = json.load(f)
+                    if not isinstance(data, list):
+                        raise ValueError("JSON file format is incorrect. Expected a list of questions.")
+                except json.JSONDecodeError:
+                    logger.error("JSON decoding failed")
+                    data = []
+        except FileNotFoundError:
+            logger.warning("JSON file not found, creating new file")
+            data = []
+        data.append(question_data)
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=4)
+
     def _sanitize_text(self, text: str) -> str:
         sanitized_text = text.lower().strip().replace('"', '').replace('\\', '')
         sanitized_text = re.sub(r'[\x00-\x1F\x7F]', '', sanitized_text).replace('\n', ' ').replace('\r', '').rstrip(',')
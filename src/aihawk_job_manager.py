@@ -1,20 +1,43 @@
 import json
 import os
 import random
-import time
+import threading
+from collections import Counter
+from datetime import date
 from itertools import product
 from pathlib import Path
 
-from inputimeout import inputimeout, TimeoutOccurred
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 
 import src.utils as utils
-from app_config import MINIMUM_WAIT_TIME
+from src.document_prefetcher import DocumentPrefetcher
 from src.job import Job
 from src.aihawk_easy_applier import AIHawkEasyApplier
+from src.job_pipeline import ScrapeAheadPipeline
+from src.pacing import PacingPolicy, PAGE, SUBMISSION
+from src.resume_loader import load_resume
+from src.search_plan import plan_name_for
+from src.tailored_resume_cache import TailoredResumeCache
+from src.wait_policy import WaitPolicy
 from loguru import logger
 
+# Output files are shared by every job manager in a worker pool
+_output_files_lock = threading.Lock()
+
+# Reads title, company and location from the top card of an open job posting in one round trip.
+POSTING_DETAILS_SCRIPT = """
+const text = (selector) => {
+    const el = document.querySelector(selector);
+    return el ? el.innerText.trim() : '';
+};
+return [
+    text('.job-details-jobs-unified-top-card__job-title, .jobs-unified-top-card__job-title, .top-card-layout__title'),
+    text('.job-details-jobs-unified-top-card__company-name, .jobs-unified-top-card__company-name, .topcard__org-name-link'),
+    text('.job-details-jobs-unified-top-card__primary-description-container .tvm__text, .jobs-unified-top-card__bullet, .topcard__flavor--bullet'),
+];
+"""
+
 
 class EnvironmentKeys:
     def __init__(self):
@@ -42,6 +65,16 @@ class AIHawkJobManager:
         self.driver = driver
         self.set_old_answers = set()
         self.easy_applier_component = None
+        self.wait_policy = WaitPolicy(driver)
+        self.pacing = None
+        self.applied_companies = None
+        self.scrape_ahead_driver_factory = None
+        self.ledger = None
+        self.search_plan = None
+        self.checkpoint = None
+        self.plain_text_resume_file = None
+        self.prefetch_documents = False
+        self.results = Counter()
         logger.debug("AIHawkJobManager initialized successfully")
 
     def set_parameters(self, parameters):
@@ -53,15 +86,19 @@ class AIHawkJobManager:
         self.apply_once_at_company = parameters.get('apply_once_at_company', False)
         self.base_search_url = self.get_base_search_url(parameters)
         self.seen_jobs = []
+        self.search_plan_settings = parameters.get('search_plan') or {}
 
         job_applicants_threshold = parameters.get('job_applicants_threshold', {})
         self.min_applicants = job_applicants_threshold.get('min_applicants', 0)
         self.max_applicants = job_applicants_threshold.get('max_applicants', float('inf'))
 
+        self.plain_text_resume_file = parameters.get('uploads', {}).get('plainTextResume')
+        self.prefetch_documents = bool(parameters.get('prefetch_documents', False))
         resume_path = parameters.get('uploads', {}).get('resume', None)
         self.resume_path = Path(resume_path) if resume_path and Path(resume_path).exists() else None
         self.output_file_directory = Path(parameters['outputFileDirectory'])
         self.env_config = EnvironmentKeys()
+        self.pacing = PacingPolicy.from_parameters(parameters, state_file=self.output_file_directory / 'pacing_state.json')
         logger.debug("Parameters set successfully")
 
     def set_gpt_answerer(self, gpt_answerer):
@@ -72,121 +109,234 @@ class AIHawkJobManager:
         logger.debug("Setting resume generator manager")
         self.resume_generator_manager = resume_generator_manager
 
+    def set_pacing(self, pacing):
+        logger.debug("Setting pacing policy")
+        self.pacing = pacing
+
+    def set_ledger(self, ledger):
+        logger.debug("Setting shared application ledger")
+        self.ledger = ledger
+
+    def set_search_plan(self, search_plan):
+        logger.debug(f"Setting shared search plan: {search_plan.path}")
+        self.search_plan = search_plan
+
+    def set_checkpoint(self, checkpoint):
+        logger.debug(f"Setting run checkpoint: {checkpoint.path}")
+        self.checkpoint = checkpoint
+
+    def set_scrape_ahead_driver_factory(self, driver_factory):
+        logger.debug("Setting scrape-ahead driver factory")
+        self.scrape_ahead_driver_factory = driver_factory
+
     def start_applying(self):
+        try:
+            self._start_applying()
+        finally:
+            self.close()
+
+    def close(self):
+        """Stops the document prefetch threads; call when the manager will not apply to more jobs."""
+        if self.easy_applier_component is not None and self.easy_applier_component.prefetcher is not None:
+            self.easy_applier_component.prefetcher.close()
+            self.easy_applier_component.prefetcher = None
+
+    def _start_applying(self):
         logger.debug("Starting job application process")
-        self.easy_applier_component = AIHawkEasyApplier(self.driver, self.resume_path, self.set_old_answers,
-                                                          self.gpt_answerer, self.resume_generator_manager)
+        self.prepare_applier()
         searches = list(product(self.positions, self.locations))
         random.shuffle(searches)
-        page_sleep = 0
-        minimum_time = MINIMUM_WAIT_TIME
-        minimum_page_time = time.time() + minimum_time
+        if self.search_plan is not None:
+            self.apply_search_plan()
+            logger.info(self.pacing.report())
+            return
+        if self.scrape_ahead_driver_factory is not None:
+            self.apply_with_scrape_ahead(searches)
+            logger.info(self.pacing.report())
+            return
+        if self.apply_once_at_company:
+            self.pacing.schedule_prefetch(self.load_applied_companies)
+
+        start_index = 0
+        if self.checkpoint is not None:
+            searches = self.checkpoint.start(plan_name_for(self.positions, self.locations, self.base_search_url),
+                                             searches)
+            start_index = self.checkpoint.search_index
+
+        completed = True
+        for index in range(start_index, len(searches)):
+            position, location = searches[index]
+            if self.checkpoint is None:
+                keep_going = self.apply_search(position, location)
+            else:
+                self.checkpoint.search_started(index)
+                keep_going = self.apply_search(position, location, start_page=self.checkpoint.page,
+                                               on_page_done=self.checkpoint.page_done)
+            if not keep_going:
+                completed = False
+                break
+        if completed and self.checkpoint is not None:
+            self.checkpoint.finish()
+
+        logger.info(self.pacing.report())
+
+    def prepare_applier(self):
+        if self.easy_applier_component is None:
+            resume_projection = None
+            resume_variant = ""
+            if self.plain_text_resume_file and Path(self.plain_text_resume_file).exists():
+                plain_text_resume = load_resume(self.plain_text_resume_file)
+                resume_projection = plain_text_resume.projection
+                # Tailored PDFs made from an older version of the resume are not reused
+                resume_variant = plain_text_resume.digest[:16]
+            self.easy_applier_component = AIHawkEasyApplier(self.driver, self.resume_path, self.set_old_answers,
+                                                              self.gpt_answerer, self.resume_generator_manager,
+                                                              wait_policy=self.wait_policy,
+                                                              resume_projection=resume_projection,
+                                                              resume_cache=TailoredResumeCache(variant=resume_variant),
+                                                              prefetcher=DocumentPrefetcher() if self.prefetch_documents else None)
+
+    def apply_search(self, position, location, start_page=0, end_page=None, on_page_done=None, raise_errors=False):
+        """
+        Applies to the pages [start_page, end_page) of one search (every page when end_page is None).
+        on_page_done(page_number) is called after each page. Returns False once a daily cap ends the run.
+        Unexpected errors (e.g. a dead browser) are logged, or re-raised when raise_errors is set.
+        """
+        self.prepare_applier()
+        location_url = "&location=" + location
+        job_page_number = start_page - 1
+        logger.debug(f"Starting the search for {position} in {location}.")
 
-        for position, location in searches:
-            location_url = "&location=" + location
-            job_page_number = -1
-            logger.debug(f"Starting the search for {position} in {location}.")
+        try:
+            while True:
+                job_page_number += 1
+                if end_page is not None and job_page_number >= end_page:
+                    break
+                if not self.pacing.acquire(PAGE):
+                    logger.info("Daily page load cap reached, stopping the run.")
+                    return False
+                logger.debug(f"Going to job page {job_page_number}")
+                self.wait_policy.reset_network_tracking()
+                self.next_job_page(position, location_url, job_page_number)
+                self.wait_policy.page_ready()
+                logger.debug("Starting the application process for this page...")
 
-            try:
-                while True:
-                    page_sleep += 1
-                    job_page_number += 1
-                    logger.debug(f"Going to job page {job_page_number}")
-                    self.next_job_page(position, location_url, job_page_number)
-                    time.sleep(random.uniform(1.5, 3.5))
-                    logger.debug("Starting the application process for this page...")
-
-                    try:
-                        jobs = self.get_jobs_from_page()
-                        if not jobs:
-                            logger.debug("No more jobs found on this page. Exiting loop.")
-                            break
-                    except Exception as e:
-                        logger.error(f"Failed to retrieve jobs: {e}")
+                try:
+                    jobs = self.get_jobs_from_page()
+                    if not jobs:
+                        logger.debug("No more jobs found on this page. Exiting loop.")
                         break
+                except Exception as e:
+                    logger.error(f"Failed to retrieve jobs: {e}")
+                    break
 
-                    try:
-                        self.apply_jobs()
-                    except Exception as e:
-                        logger.error(f"Error during job application: {e}")
-                        continue
-
-                    logger.debug("Applying to jobs on this page has been completed!")
-
-                    time_left = minimum_page_time - time.time()
-
-                    # Ask user if they want to skip waiting, with timeout
-                    if time_left > 0:
-                        try:
-                            user_input = inputimeout(
-                                prompt=f"Sleeping for {time_left} seconds. Press 'y' to skip waiting. Timeout 60 seconds : ",
-                                timeout=60).strip().lower()
-                        except TimeoutOccurred:
-                            user_input = ''  # No input after timeout
-                        if user_input == 'y':
-                            logger.debug("User chose to skip waiting.")
-                        else:
-                            logger.debug(f"Sleeping for {time_left} seconds as user chose not to skip.")
-                            time.sleep(time_left)
-
-                    minimum_page_time = time.time() + minimum_time
-
-                    if page_sleep % 5 == 0:
-                        sleep_time = random.randint(5, 34)
-                        try:
-                            user_input = inputimeout(
-                                prompt=f"Sleeping for {sleep_time / 60} minutes. Press 'y' to skip waiting. Timeout 60 seconds : ",
-                                timeout=60).strip().lower()
-                        except TimeoutOccurred:
-                            user_input = ''  # No input after timeout
-                        if user_input == 'y':
-                            logger.debug("User chose to skip waiting.")
-                        else:
-                            logger.debug(f"Sleeping for {sleep_time} seconds.")
-                            time.sleep(sleep_time)
-                        page_sleep += 1
+                try:
+                    self.apply_jobs()
+                except Exception as e:
+                    logger.error(f"Error during job application: {e}")
+                    continue
+                finally:
+                    if on_page_done is not None:
+                        on_page_done(job_page_number)
+
+                logger.debug("Applying to jobs on this page has been completed!")
+                if self.pacing.exhausted(SUBMISSION):
+                    logger.info("Daily submission cap reached, stopping the run.")
+                    return False
+        except Exception as e:
+            logger.error(f"Unexpected error during job search: {e}")
+            if raise_errors:
+                raise
+        return True
+
+    def apply_search_plan(self):
+        """
+        Registers this configuration's searches in the shared search plan and claims shards until none
+        are left. Returns False once a daily cap is hit. The plan belongs to one run, named by the
+        search_plan 'run' setting or else today's date, so finished shards do not block the next run.
+        """
+        search_plan = self.search_plan
+        run = str(self.search_plan_settings.get('run') or date.today().isoformat())
+        plan_name = plan_name_for(self.positions, self.locations, self.base_search_url, run)
+        search_plan.add_searches(plan_name, self.positions, self.locations, self.base_search_url,
+                                 pages_per_shard=self.search_plan_settings.get('pages_per_shard'),
+                                 max_pages=self.search_plan_settings.get('max_pages'))
+        while True:
+            shard = search_plan.claim(plan_name)
+            if shard is None:
+                logger.info(f"No shards left in search plan {plan_name}: {search_plan.counts(plan_name)}")
+                return True
+            logger.debug(f"Claimed shard {shard.id}: {shard.position} in {shard.location}, "
+                         f"pages {shard.next_page}-{shard.page_end}")
+            try:
+                keep_going = self.apply_search(shard.position, shard.location, start_page=shard.next_page,
+                                               end_page=shard.page_end,
+                                               on_page_done=lambda page: search_plan.record_progress(shard, page + 1),
+                                               raise_errors=True)
             except Exception as e:
-                logger.error(f"Unexpected error during job search: {e}")
+                logger.error(f"Shard {shard.id} failed: {e}")
+                search_plan.fail(shard)
                 continue
+            if not keep_going:
+                search_plan.release(shard)
+                return False
+            search_plan.complete(shard)
+
+    def apply_to_link(self, link):
+        """
+        Applies to a single job posting by URL. Title, company and location are read from the
+        posting, so the blacklists and the once-per-company policy apply as they do to search results.
+        """
+        self.prepare_applier()
+        if self.ledger is not None and self.ledger.is_done(link):
+            logger.debug(f"Job already in the ledger, skipping: {link}")
+            return True
+        job = self.read_posting(link)
+        skip_reason = self.get_skip_reason(job)
+        if skip_reason:
+            self.write_to_file(job, skip_reason)
+            return True
+        return self.apply_to_filtered_job(job)
+
+    def read_posting(self, link):
+        """Opens a job posting and returns it as a Job with the details shown on its top card."""
+        self.wait_policy.reset_network_tracking()
+        self.driver.get(link)
+        self.wait_policy.page_ready()
+        try:
+            title, company, location = self.driver.execute_script(POSTING_DETAILS_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Could not read the details of {link}: {e}")
+            title, company, location = "", "", ""
+        if not title or not company:
+            logger.warning(f"Job title or company missing on {link}, filters by them cannot apply.")
+        return Job(title=title, company=company, location=location, link=link, apply_method="")
+
+    def apply_with_scrape_ahead(self, searches):
+        """Applies to jobs harvested ahead of time by a second browser instead of scraping page by page."""
+        if self.apply_once_at_company:
+            self.load_applied_companies()
+        pipeline = ScrapeAheadPipeline(self, self.scrape_ahead_driver_factory)
+        for batch in pipeline.run(searches):
+            logger.debug(f"Applying to page {batch.page_number} of {batch.position} in {batch.location}")
+            for job, skip_reason in batch.skipped:
+                self.write_to_file(job, skip_reason)
+            for job in batch.jobs:
+                # Another job at the same company may have succeeded since the batch was filtered
+                if self.is_already_applied_to_company(job.company):
+                    self.write_to_file(job, "skipped")
+                    continue
+                if not self.apply_to_filtered_job(job):
+                    pipeline.stop()
+                    return
 
-            time_left = minimum_page_time - time.time()
-
-            if time_left > 0:
-                try:
-                    user_input = inputimeout(
-                        prompt=f"Sleeping for {time_left} seconds. Press 'y' to skip waiting. Timeout 60 seconds : ",
-                        timeout=60).strip().lower()
-                except TimeoutOccurred:
-                    user_input = ''  # No input after timeout
-                if user_input == 'y':
-                    logger.debug("User chose to skip waiting.")
-                else:
-                    logger.debug(f"Sleeping for {time_left} seconds as user chose not to skip.")
-                    time.sleep(time_left)
-
-            minimum_page_time = time.time() + minimum_time
-
-            if page_sleep % 5 == 0:
-                sleep_time = random.randint(50, 90)
-                try:
-                    user_input = inputimeout(
-                        prompt=f"Sleeping for {sleep_time / 60} minutes. Press 'y' to skip waiting: ",
-                        timeout=60).strip().lower()
-                except TimeoutOccurred:
-                    user_input = ''  # No input after timeout
-                if user_input == 'y':
-                    logger.debug("User chose to skip waiting.")
-                else:
-                    logger.debug(f"Sleeping for {sleep_time} seconds.")
-                    time.sleep(sleep_time)
-                page_sleep += 1
-
-    def get_jobs_from_page(self):
+    def get_jobs_from_page(self, driver=None):
+        driver = driver or self.driver
 
         try:
 
-            no_jobs_element = self.driver.find_element(By.CLASS_NAME, 'jobs-search-two-pane__no-results-banner--expand')
-            if 'No matching jobs found' in no_jobs_element.text or 'unfortunately, things aren' in self.driver.page_source.lower():
+            no_jobs_element = driver.find_element(By.CLASS_NAME, 'jobs-search-two-pane__no-results-banner--expand')
+            if 'No matching jobs found' in no_jobs_element.text or 'unfortunately, things aren' in driver.page_source.lower():
                 logger.debug("No matching jobs found on this page, skipping.")
                 return []
 
@@ -194,11 +344,11 @@ class AIHawkJobManager:
             pass
 
         try:
-            job_results = self.driver.find_element(By.CLASS_NAME, "jobs-search-results-list")
-            utils.scroll_slow(self.driver, job_results)
-            utils.scroll_slow(self.driver, job_results, step=300, reverse=True)
+            job_results = driver.find_element(By.CLASS_NAME, "jobs-search-results-list")
+            utils.scroll_slow(driver, job_results)
+            utils.scroll_slow(driver, job_results, step=300, reverse=True)
 
-            job_list_elements = self.driver.find_elements(By.CLASS_NAME, 'scaffold-layout__list-container')[
+            job_list_elements = driver.find_elements(By.CLASS_NAME, 'scaffold-layout__list-container')[
                 0].find_elements(By.CLASS_NAME, 'jobs-search-results__list-item')
             if not job_list_elements:
                 logger.debug("No job class elements found on page, skipping.")
@@ -230,6 +380,23 @@ class AIHawkJobManager:
             logger.debug("No job class elements found on page, skipping")
             return
 
+        job_list = self.jobs_from_tiles(job_list_elements)
+
+        for job in job_list:
+            if self.checkpoint is not None and self.checkpoint.should_skip(job.link):
+                logger.debug(f"Already handled before the restart: {job.title} at {job.company}")
+                continue
+            logger.debug(f"Starting applicant for job: {job.title} at {job.company}")
+
+            skip_reason = self.get_skip_reason(job)
+            if skip_reason:
+                self.write_to_file(job, skip_reason)
+            elif not self.apply_to_filtered_job(job):
+                return
+            if self.checkpoint is not None:
+                self.checkpoint.job_done(job.link)
+
+    def jobs_from_tiles(self, job_list_elements):
         job_list = []
         for job_element in job_list_elements:
             job_info = self.extract_job_information_from_tile(job_element)
@@ -244,39 +411,53 @@ class AIHawkJobManager:
                 applicants_count=job_info[5]
             )
             job_list.append(job)
-
-        for job in job_list:
-            logger.debug(f"Starting applicant for job: {job.title} at {job.company}")
-
-            if job.applicants_count is not None:
-                if job.applicants_count < self.min_applicants or job.applicants_count > self.max_applicants:
-                    logger.debug(f"Skipping {job.title} at {job.company}, applicants count: {job.applicants_count}")
-                    self.write_to_file(job, "skipped_due_to_applicants")
-                    continue
-                else:
-                    logger.debug(f"Applicants count {job.applicants_count} is within the threshold")
+        return job_list
+
+    def get_skip_reason(self, job):
+        """Returns the output file name a filtered-out job is recorded in, or None if it should be applied to."""
+        if job.applicants_count is not None:
+            if job.applicants_count < self.min_applicants or job.applicants_count > self.max_applicants:
+                logger.debug(f"Skipping {job.title} at {job.company}, applicants count: {job.applicants_count}")
+                return "skipped_due_to_applicants"
             else:
-                logger.warning(f"Applicants count not found for {job.title} at {job.company}, continuing with application.")
-
-            if self.is_blacklisted(job.title, job.company, job.link):
-                logger.debug(f"Job blacklisted: {job.title} at {job.company}")
-                self.write_to_file(job, "skipped")
-                continue
-            if self.is_already_applied_to_job(job.title, job.company, job.link):
-                self.write_to_file(job, "skipped")
-                continue
-            if self.is_already_applied_to_company(job.company):
-                self.write_to_file(job, "skipped")
-                continue
-            try:
-                if job.apply_method not in {"Continue", "Applied", "Apply"}:
-                    self.easy_applier_component.job_apply(job)
-                    self.write_to_file(job, "success")
-                    logger.debug(f"Applied to job: {job.title} at {job.company}")
-            except Exception as e:
-                logger.error(f"Failed to apply for {job.title} at {job.company}: {e}")
-                self.write_to_file(job, "failed")
-                continue
+                logger.debug(f"Applicants count {job.applicants_count} is within the threshold")
+        else:
+            logger.warning(f"Applicants count not found for {job.title} at {job.company}, continuing with application.")
+
+        if self.is_blacklisted(job.title, job.company, job.link):
+            logger.debug(f"Job blacklisted: {job.title} at {job.company}")
+            return "skipped"
+        if self.is_already_applied_to_job(job.title, job.company, job.link):
+            return "skipped"
+        if self.is_already_applied_to_company(job.company):
+            return "skipped"
+        return None
+
+    def apply_to_filtered_job(self, job):
+        """Applies to a job that passed the filters. Returns False once the daily submission cap is reached."""
+        if job.apply_method in {"Continue", "Applied", "Apply"}:
+            return True
+        if self.ledger is not None and not self.ledger.claim(job.link):
+            logger.debug(f"Job already handled by another worker: {job.link}")
+            return True
+        if self.pacing is not None and not self.pacing.acquire(SUBMISSION):
+            logger.info("Daily submission cap reached, not applying to the remaining jobs.")
+            if self.ledger is not None:
+                self.ledger.release(job.link)
+            return False
+        if self.checkpoint is not None:
+            self.checkpoint.job_started(job)
+        try:
+            self.easy_applier_component.job_apply(job)
+            status = "success"
+            logger.debug(f"Applied to job: {job.title} at {job.company}")
+        except Exception as e:
+            logger.error(f"Failed to apply for {job.title} at {job.company}: {e}")
+            status = "failed"
+        self.write_to_file(job, status)
+        if self.ledger is not None:
+            self.ledger.record(job.link, status, company=job.company, title=job.title)
+        return True
 
     def write_to_file(self, job, file_name):
         logger.debug(f"Writing job application result to file: {file_name}")
@@ -290,7 +471,14 @@ class AIHawkJobManager:
             "job_location": job.location,
             "pdf_path": pdf_path
         }
+        self.results[file_name] += 1
+        if file_name == "success" and self.applied_companies is not None:
+            self.applied_companies.add(job.company.strip().lower())
         file_path = self.output_file_directory / f"{file_name}.json"
+        with _output_files_lock:
+            self._append_to_output_file(file_path, file_name, data)
+
+    def _append_to_output_file(self, file_path, file_name, data):
         if not file_path.exists():
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump([data], f, indent=4)
@@ -334,9 +522,9 @@ class AIHawkJobManager:
         logger.debug(f"Base search URL constructed: {full_url}")
         return full_url
 
-    def next_job_page(self, position, location, job_page):
+    def next_job_page(self, position, location, job_page, driver=None):
         logger.debug(f"Navigating to next job page: {position} in {location}, page {job_page}")
-        self.driver.get(
+        (driver or self.driver).get(
             f"https://www.linkedin.com/jobs/search/{self.base_search_url}&keywords={position}{location}&start={job_page * 25}")
 
     def extract_job_information_from_tile(self, job_tile):
@@ -415,18 +603,22 @@ class AIHawkJobManager:
         if not self.apply_once_at_company:
             return False
 
-        output_files = ["success.json"]
-        for file_name in output_files:
-            file_path = self.output_file_directory / file_name
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    try:
-                        existing_data = json.load(f)
-                        for applied_job in existing_data:
-                            if applied_job['company'].strip().lower() == company.strip().lower():
-                                logger.debug(
-                                    f"Already applied at {company} (once per company policy), skipping...")
-                                return True
-                    except json.JSONDecodeError:
-                        continue
+        if self.applied_companies is None:
+            self.load_applied_companies()
+        if company.strip().lower() in self.applied_companies or (
+                self.ledger is not None and self.ledger.has_success_at(company)):
+            logger.debug(f"Already applied at {company} (once per company policy), skipping...")
+            return True
         return False
+
+    def load_applied_companies(self):
+        """Reads the companies already applied to from success.json; cheap enough to run as pacing prefetch."""
+        applied_companies = set()
+        file_path = self.output_file_directory / "success.json"
+        if file_path.exists():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                try:
+                    applied_companies = {applied_job['company'].strip().lower() for applied_job in json.load(f)}
+                except json.JSONDecodeError:
+                    logger.error(f"JSON decode error in file: {file_path}")
+        self.applied_companies = applied_companies
@@ -0,0 +1,92 @@
+import json
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+# Outcomes after which a key is never worked on again; any other outcome (a failed application)
+# is kept for the record but the key may be claimed again.
+FINAL_STATUSES = frozenset({"success", "submitted"})
+
+
+class ApplicationLedger:
+    """
+    Append-only record of application outcomes shared by concurrent workers.
+
+    Workers claim a key (a job or portal URL) before working on it, so two workers never handle the
+    same posting, and record the outcome when they are done. Outcomes are appended to a JSON-lines
+    file and reloaded on start, so postings completed in earlier runs are skipped as well. Postings
+    whose outcome is not final (a failed attempt) and claims that were never recorded (the worker
+    crashed) are retried on the next run.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._claimed = set()
+        self._recorded = {}
+        self._successful_companies = set()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt ledger line {line_number} in {self.path}")
+                    continue
+                self._remember(entry)
+        logger.debug(f"Loaded {len(self._recorded)} ledger entries from {self.path}")
+
+    def _remember(self, entry: dict) -> None:
+        self._recorded[entry['key']] = entry['status']
+        if entry['status'] == 'success' and entry.get('company'):
+            self._successful_companies.add(entry['company'].strip().lower())
+
+    def claim(self, key: str) -> bool:
+        """Returns True if the caller now owns key, False if it is already claimed or has a final outcome."""
+        with self._lock:
+            if key in self._claimed or self._recorded.get(key) in FINAL_STATUSES:
+                return False
+            self._claimed.add(key)
+            return True
+
+    def release(self, key: str) -> None:
+        """Gives up a claim without recording an outcome, so another worker may pick the key up."""
+        with self._lock:
+            self._claimed.discard(key)
+
+    def record(self, key: str, status: str, **details) -> None:
+        entry = {'key': key, 'status': status, 'time': datetime.now().isoformat(timespec='seconds'), **details}
+        with self._lock:
+            self._claimed.discard(key)
+            self._remember(entry)
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def is_recorded(self, key: str) -> bool:
+        with self._lock:
+            return key in self._recorded
+
+    def is_done(self, key: str) -> bool:
+        """Whether key has a final outcome and will not be claimed again."""
+        with self._lock:
+            return self._recorded.get(key) in FINAL_STATUSES
+
+    def has_success_at(self, company: str) -> bool:
+        with self._lock:
+            return company.strip().lower() in self._successful_companies
+
+    def counts(self) -> Counter:
+        with self._lock:
+            return Counter(self._recorded.values())
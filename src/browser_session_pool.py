@@ -0,0 +1,175 @@
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+
+from loguru import logger
+
+
+@dataclass
+class _Session:
+    driver: object
+    slot: int
+    idle_since: float = field(default_factory=time.monotonic)
+
+
+class BrowserSessionPool:
+    """
+    Keeps warm Chrome sessions for portal applications instead of launching one per task.
+
+    factory(slot) starts a browser; the slot number (0 .. max_size - 1) is unique among live
+    sessions, so the factory can give each session its own Chrome profile. acquire() hands out an
+    idle session or starts a new one while fewer than max_size exist, and otherwise waits for a
+    release. release() resets the session before it is handed out again: extra windows are closed,
+    all cookies and the open page's storage are cleared and about:blank is loaded, while the HTTP
+    cache stays warm. A session that fails to reset is quit. A reaper thread quits sessions that
+    stayed idle longer than idle_timeout seconds.
+    """
+
+    def __init__(self, factory: Callable[[int], object], max_size: int = 2, idle_timeout: float = 300,
+                 reap_interval: float = 30):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._condition = threading.Condition()
+        self._idle: List[_Session] = []
+        self._busy: Dict[int, _Session] = {}
+        self._starting: Set[int] = set()
+        self._closed = False
+        self._reaper: Optional[threading.Thread] = None
+
+    @property
+    def size(self) -> int:
+        with self._condition:
+            return len(self._idle) + len(self._busy) + len(self._starting)
+
+    def acquire(self, timeout: Optional[float] = None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser session pool is closed.")
+                if self._idle:
+                    session = self._idle.pop()
+                    self._busy[id(session.driver)] = session
+                    logger.debug(f"Reusing warm browser session in slot {session.slot}")
+                    return session.driver
+                if len(self._busy) + len(self._starting) < self.max_size:
+                    slot = self._free_slot()
+                    self._starting.add(slot)
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No browser session became free within {timeout}s.")
+                self._condition.wait(remaining)
+
+        try:
+            logger.debug(f"Starting browser session in slot {slot}")
+            driver = self.factory(slot)
+        except Exception:
+            with self._condition:
+                self._starting.discard(slot)
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._starting.discard(slot)
+            self._busy[id(driver)] = _Session(driver, slot)
+            self._start_reaper()
+        return driver
+
+    def release(self, driver, discard: bool = False) -> None:
+        with self._condition:
+            session = self._busy.pop(id(driver), None)
+        if session is None:
+            logger.warning("Released a browser that does not belong to the pool")
+            return
+        if not discard and not self._closed and self._reset(driver):
+            session.idle_since = time.monotonic()
+            with self._condition:
+                if not self._closed:
+                    self._idle.append(session)
+                    self._condition.notify()
+                    return
+        self._quit(session)
+        with self._condition:
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None):
+        """Acquires a session for the with block; it is discarded instead of reused if the block raises."""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except BaseException:
+            self.release(driver, discard=True)
+            raise
+        self.release(driver)
+
+    def reap_idle(self) -> int:
+        now = time.monotonic()
+        with self._condition:
+            expired = [session for session in self._idle if now - session.idle_since >= self.idle_timeout]
+            self._idle = [session for session in self._idle if session not in expired]
+            if expired:
+                self._condition.notify_all()
+        for session in expired:
+            logger.debug(f"Closing browser session in slot {session.slot} after {self.idle_timeout}s idle")
+            self._quit(session)
+        return len(expired)
+
+    def close(self) -> None:
+        """Quits idle sessions now; sessions still in use are quit when they are released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for session in idle:
+            self._quit(session)
+
+    def _free_slot(self) -> int:
+        taken = {session.slot for session in self._idle + list(self._busy.values())} | self._starting
+        return next(slot for slot in itertools.count() if slot not in taken)
+
+    def _start_reaper(self) -> None:
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = threading.Thread(target=self._reap_loop, name="browser-session-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed or not (self._idle or self._busy or self._starting):
+                    return
+                self._condition.wait(self.reap_interval)
+            self.reap_idle()
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception as e:
+                logger.debug(f"Could not clear page storage: {e}")
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"Browser session could not be reset, closing it: {e}")
+            return False
+
+    @staticmethod
+    def _quit(session: _Session) -> None:
+        try:
+            session.driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit browser session in slot {session.slot}: {e}")
@@ -1,6 +1,7 @@
 
 from langchain_core.prompts import PromptTemplate
 from src.llm.llm_manager import AIAdapter
+from src.resume_loader import load_resume
 from loguru import logger
 import yaml
 
@@ -14,9 +15,7 @@ class CoverLetterGenerator:
 
         resume_content = ""
         try:
-            with open(resume_path, "r") as f:
-                resume_data = yaml.safe_load(f)
-                resume_content = yaml.dump(resume_data)
+            resume_content = yaml.dump(load_resume(resume_path).data)
         except Exception as e:
             logger.error(f"Could not load resume data: {e}")
             return "Error: Could not load resume data."
@@ -0,0 +1,177 @@
+import io
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+
+
+@lru_cache(maxsize=65536)
+def word_width(word: str, font: str, font_size: float) -> float:
+    """Width of a word in points; cover letters reuse most words, so widths are cached."""
+    return pdfmetrics.stringWidth(word, font, font_size)
+
+
+@dataclass(frozen=True)
+class LetterStyle:
+    font: str = "Helvetica"
+    font_size: float = 11
+    leading: float = 15
+    heading_font: str = "Helvetica-Bold"
+    heading_size: float = 16
+    margin: float = 56
+    page_size: Tuple[float, float] = A4
+
+    @property
+    def text_width(self) -> float:
+        return self.page_size[0] - 2 * self.margin
+
+
+@dataclass(frozen=True)
+class Letterhead:
+    name: str = ""
+    contact: Sequence[str] = ()
+
+    @classmethod
+    def from_resume(cls, fields) -> "Letterhead":
+        """Builds the letterhead from the fields of a ResumeProjection."""
+        location = ", ".join(str(fields[key]) for key in ("personal_information.city", "personal_information.country")
+                             if fields.get(key))
+        contact = [str(fields[key]) for key in ("personal_information.email", "personal_information.phone_formatted",
+                                                 "personal_information.linkedin") if fields.get(key)]
+        return cls(str(fields.get("personal_information.full_name", "")), ([location] if location else []) + contact)
+
+
+def _split_long_word(word: str, font: str, font_size: float, max_width: float) -> List[str]:
+    pieces, piece = [], ""
+    for char in word:
+        if piece and word_width(piece + char, font, font_size) > max_width:
+            pieces.append(piece)
+            piece = ""
+        piece += char
+    return pieces + [piece]
+
+
+def wrap_paragraph(text: str, font: str, font_size: float, max_width: float, balanced: bool = False) -> List[str]:
+    """
+    Breaks a paragraph into lines no wider than max_width.
+
+    The greedy fill measures every word once. balanced=True minimizes the squared slack of all
+    lines but the last instead, which avoids a very short line in the middle of a paragraph.
+    """
+    words = []
+    for word in text.split():
+        if word_width(word, font, font_size) > max_width:
+            words.extend(_split_long_word(word, font, font_size, max_width))
+        else:
+            words.append(word)
+    if not words:
+        return [""]
+    widths = [word_width(word, font, font_size) for word in words]
+    space = word_width(" ", font, font_size)
+    if balanced:
+        return _wrap_balanced(words, widths, space, max_width)
+
+    lines, start, line_width = [], 0, widths[0]
+    for index in range(1, len(words)):
+        if line_width + space + widths[index] > max_width:
+            lines.append(" ".join(words[start:index]))
+            start, line_width = index, widths[index]
+        else:
+            line_width += space + widths[index]
+    lines.append(" ".join(words[start:]))
+    return lines
+
+
+def _wrap_balanced(words: List[str], widths: List[float], space: float, max_width: float) -> List[str]:
+    count = len(words)
+    # cost[i] is the least total badness of setting words[i:]; breaks[i] where its first line ends
+    cost = [0.0] * (count + 1)
+    breaks = [count] * (count + 1)
+    for start in range(count - 1, -1, -1):
+        cost[start] = float("inf")
+        line_width = -space
+        for end in range(start + 1, count + 1):
+            line_width += space + widths[end - 1]
+            if line_width > max_width and end > start + 1:
+                break
+            badness = 0.0 if end == count else (max_width - line_width) ** 2
+            if badness + cost[end] < cost[start]:
+                cost[start], breaks[start] = badness + cost[end], end
+    lines, start = [], 0
+    while start < count:
+        lines.append(" ".join(words[start:breaks[start]]))
+        start = breaks[start]
+    return lines
+
+
+class CoverLetterRenderer:
+    """
+    Renders cover letter text to a PDF in memory.
+
+    Paragraphs are wrapped with ReportLab's font metrics for the standard fonts, the letterhead
+    (name, location and contact details, date) is drawn on the first page, and further pages
+    are started when the text reaches the bottom margin.
+    """
+
+    def __init__(self, style: LetterStyle = LetterStyle(), letterhead: Optional[Letterhead] = None,
+                 balanced: bool = False):
+        self.style = style
+        self.letterhead = letterhead
+        self.balanced = balanced
+
+    def wrap(self, text: str) -> List[str]:
+        style = self.style
+        lines = []
+        for paragraph in text.strip().splitlines():
+            lines.extend(wrap_paragraph(paragraph, style.font, style.font_size, style.text_width, self.balanced))
+        return lines
+
+    def render(self, text: str, letter_date: Optional[date] = None) -> bytes:
+        style = self.style
+        page_width, page_height = style.page_size
+        buffer = io.BytesIO()
+        pdf = canvas.Canvas(buffer, pagesize=style.page_size, pageCompression=1)
+        pdf.setTitle("Cover Letter")
+        if self.letterhead and self.letterhead.name:
+            pdf.setAuthor(self.letterhead.name)
+
+        top = page_height - style.margin
+        y = self._draw_letterhead(pdf, top, letter_date or date.today())
+        text_object = pdf.beginText(style.margin, y)
+        text_object.setFont(style.font, style.font_size, style.leading)
+        for line in self.wrap(text):
+            if text_object.getY() < style.margin:
+                pdf.drawText(text_object)
+                pdf.showPage()
+                text_object = pdf.beginText(style.margin, top)
+                text_object.setFont(style.font, style.font_size, style.leading)
+            text_object.textLine(line)
+        pdf.drawText(text_object)
+        pdf.save()
+        return buffer.getvalue()
+
+    def _draw_letterhead(self, pdf, y: float, letter_date: date) -> float:
+        style = self.style
+        if self.letterhead is not None:
+            if self.letterhead.name:
+                y -= style.heading_size
+                pdf.setFont(style.heading_font, style.heading_size)
+                pdf.drawString(style.margin, y, self.letterhead.name)
+                y -= style.leading * 0.5
+            if self.letterhead.contact:
+                pdf.setFont(style.font, style.font_size - 1)
+                for line in wrap_paragraph(" · ".join(self.letterhead.contact), style.font, style.font_size - 1,
+                                           style.text_width):
+                    y -= style.leading
+                    pdf.drawString(style.margin, y, line)
+            y -= style.leading
+            pdf.setLineWidth(0.5)
+            pdf.line(style.margin, y, style.page_size[0] - style.margin, y)
+        y -= style.leading * 2
+        pdf.setFont(style.font, style.font_size)
+        pdf.drawString(style.margin, y, letter_date.strftime("%B %d, %Y").replace(" 0", " "))
+        return y - style.leading * 2
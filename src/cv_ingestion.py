@@ -0,0 +1,125 @@
+import json
+import re
+import shutil
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import yaml
+from loguru import logger
+
+from app_config import CV_INGEST_WORKERS
+
+INGESTED = "ingested"
+PARTIAL = "partial"
+ERROR = "error"
+
+
+@dataclass
+class IngestionOutcome:
+    cv: str
+    status: str
+    seconds: float
+    extract_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    profile: Optional[str] = None
+    error: Optional[str] = None
+
+
+def list_cvs(folder: Path) -> List[Path]:
+    """The PDF files directly inside folder, in name order."""
+    return sorted(path for path in Path(folder).iterdir() if path.is_file() and path.suffix.lower() == ".pdf")
+
+
+def profile_name(cv_path: Path) -> str:
+    return re.sub(r"[^\w.-]+", "_", cv_path.stem).strip("._") or "candidate"
+
+
+class CVIngestionRunner:
+    """
+    Turns a batch of CV PDFs into one profile directory per candidate.
+
+    Each CV is parsed by parser (a CVParser, whose cache makes re-ingesting unchanged CVs cheap)
+    on a pool of at most workers threads. Its profile directory, named after the PDF, receives
+    plain_text_resume.yaml and a copy of the PDF as resume.pdf, the same layout as data_folder,
+    so a candidate's directory can be used as a data folder. The outcome of every CV, with the
+    time spent extracting text and in the LLM, is appended to results_file (JSON lines). A CV with
+    sections the LLM could not structure is reported as partial, with the missing sections as its
+    error, and no profile is written for it; a CV that fails does not stop the batch.
+    """
+
+    def __init__(self, parser, profiles_folder: Path, results_file: Path, workers: int = CV_INGEST_WORKERS):
+        self.parser = parser
+        self.profiles_folder = Path(profiles_folder)
+        self.results_file = Path(results_file)
+        self.workers = workers
+        self._lock = threading.Lock()
+
+    def run(self, cv_paths: Iterable[Path]) -> List[IngestionOutcome]:
+        started_at = time.monotonic()
+        jobs, names = [], set()
+        for cv_path in cv_paths:
+            name = base = profile_name(Path(cv_path))
+            suffix = 2
+            while name.lower() in names:
+                name, suffix = f"{base}_{suffix}", suffix + 1
+            names.add(name.lower())
+            jobs.append((Path(cv_path), self.profiles_folder / name))
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs)), thread_name_prefix="cv-ingest") as pool:
+            outcomes = list(pool.map(lambda job: self._ingest(*job), jobs))
+        logger.info(self.summary(outcomes, time.monotonic() - started_at))
+        return outcomes
+
+    @staticmethod
+    def summary(outcomes: List[IngestionOutcome], elapsed: float) -> str:
+        results = Counter(outcome.status for outcome in outcomes)
+        return f"CV ingestion finished in {elapsed:.0f}s: {dict(results)}"
+
+    def _ingest(self, cv_path: Path, profile_folder: Path) -> IngestionOutcome:
+        started_at = time.monotonic()
+        outcome = IngestionOutcome(str(cv_path), ERROR, 0.0)
+        try:
+            text = self.parser.extract_text_from_pdf(str(cv_path))
+            outcome.extract_seconds = time.monotonic() - started_at
+            result = self.parser.parse_cv(text)
+            outcome.parse_seconds = time.monotonic() - started_at - outcome.extract_seconds
+            if not isinstance(yaml.safe_load(result.yaml or ""), dict):
+                raise ValueError("the LLM did not return a YAML resume")
+            if not result.complete:
+                # A resume missing sections is not written: it would overwrite a complete profile
+                outcome.status = PARTIAL
+                outcome.error = f"sections not parsed: {', '.join(result.failed_sections)}"
+                logger.warning(f"{cv_path.name}: {outcome.error}")
+            else:
+                profile_folder.mkdir(parents=True, exist_ok=True)
+                self.parser.save_to_yaml(result.yaml, str(profile_folder / "plain_text_resume.yaml"))
+                shutil.copyfile(cv_path, profile_folder / "resume.pdf")
+                outcome.profile = str(profile_folder)
+                outcome.status = INGESTED
+        except Exception as e:
+            logger.error(f"Could not ingest {cv_path}: {e}")
+            outcome.error = str(e)
+        outcome.seconds = time.monotonic() - started_at
+        logger.info(f"{outcome.status}: {cv_path.name} ({outcome.seconds:.1f}s)")
+        self._write(outcome)
+        return outcome
+
+    def _write(self, outcome: IngestionOutcome) -> None:
+        entry = {'time': datetime.now().isoformat(timespec='seconds'), **asdict(outcome)}
+        for key in ('seconds', 'extract_seconds', 'parse_seconds'):
+            entry[key] = round(entry[key], 2)
+        with self._lock:
+            try:
+                self.results_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.results_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.error(f"Could not write CV ingestion outcome to {self.results_file}: {e}")
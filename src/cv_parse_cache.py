@@ -0,0 +1,60 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from loguru import logger
+
+
+def sha256_hex(data: Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class CVParseCache:
+    """
+    Remembers the results of both CV parsing stages on disk.
+
+    The text extracted from a PDF is stored under the SHA-256 of the PDF bytes (and the extractor
+    settings), and the YAML the LLM produced under the SHA-256 of the text together with the
+    prompt's example structure, so uploading an unchanged CV again needs neither pdfminer nor an
+    LLM call, and a changed example structure is parsed afresh.
+    """
+
+    def __init__(self, folder: Union[str, Path]):
+        self.folder = Path(folder)
+
+    def text(self, pdf_digest: str) -> Optional[str]:
+        return self._read(f"{pdf_digest}.txt")
+
+    def store_text(self, pdf_digest: str, text: str) -> None:
+        self._write(f"{pdf_digest}.txt", text)
+
+    def yaml(self, text_digest: str) -> Optional[str]:
+        return self._read(f"{text_digest}.yaml")
+
+    def store_yaml(self, text_digest: str, content: str) -> None:
+        self._write(f"{text_digest}.yaml", content)
+
+    def _read(self, name: str) -> Optional[str]:
+        path = self.folder / name
+        try:
+            content = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable CV cache entry {path}: {e}")
+            return None
+        logger.debug(f"CV cache hit: {name}")
+        return content
+
+    def _write(self, name: str, content: str) -> None:
+        path = self.folder / name
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write CV cache entry {path}: {e}")
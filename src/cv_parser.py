@@ -1,27 +1,79 @@
 
 import yaml
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from langchain_core.prompts import PromptTemplate
-from pdfminer.high_level import extract_text
 from src.llm.llm_manager import AIAdapter
+from src.cv_parse_cache import CVParseCache, sha256_hex
+from src.cv_sections import SECTION_KEYS, split_cv_sections
+from src.pdf_extractor import PdfExtractor
+from src.resume_schema import load_resume_schema, validate_resume
 from loguru import logger
 
+# LLM calls per CV section before the section is left out of the parsed YAML.
+SECTION_ATTEMPTS = 2
+
+
+@dataclass
+class CVParseResult:
+    """The parsed YAML and the CV sections the LLM gave no usable YAML for ("resume" when parsed in one call)."""
+    yaml: str
+    failed_sections: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed_sections
+
+
 class CVParser:
-    def __init__(self, ai_adapter: AIAdapter):
+    def __init__(self, ai_adapter: AIAdapter, cache: Optional[CVParseCache] = None,
+                 extractor: Optional[PdfExtractor] = None, workers: Optional[int] = None):
         self.ai_adapter = ai_adapter
+        self.cache = cache
+        self.extractor = extractor or PdfExtractor()
+        self.workers = workers
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extracts raw text from a PDF file."""
+        """Extracts raw text from a PDF file. With a cache, an unchanged PDF is not parsed again."""
         logger.info(f"Extracting text from {pdf_path}")
         try:
-            text = extract_text(pdf_path)
+            with open(pdf_path, "rb") as f:
+                pdf_bytes = f.read()
+            pdf_digest = f"{sha256_hex(pdf_bytes)}-{self.extractor.variant}"
+            if self.cache is not None:
+                cached = self.cache.text(pdf_digest)
+                if cached is not None:
+                    return cached
+            text = self.extractor.extract(pdf_bytes)
+            if self.cache is not None:
+                self.cache.store_text(pdf_digest, text)
             return text
         except Exception as e:
             logger.error(f"Failed to extract text from PDF: {e}")
             raise
 
     def parse_cv_to_yaml_structure(self, cv_text: str) -> str:
-        """Uses LLM to parse raw CV text into the expected YAML structure."""
+        """
+        Uses LLM to parse raw CV text into the expected YAML structure.
+        Raises ValueError when a section could not be parsed, so a partial resume is never saved.
+        """
+        result = self.parse_cv(cv_text)
+        if not result.complete:
+            raise ValueError(f"CV sections could not be parsed: {', '.join(result.failed_sections)}")
+        return result.yaml
+
+    def parse_cv(self, cv_text: str) -> CVParseResult:
+        """
+        Parses raw CV text into the expected YAML structure, reporting sections that could not be parsed.
+
+        The text is split into sections (contact, experience, education, projects, skills) and
+        each is structured by its own, concurrent LLM call that sees only its part of the example
+        structure and of assets/resume_schema.yaml; a section whose reply is not valid YAML is
+        asked for again on its own, as is one whose LLM call raised. Text without recognizable
+        headings is parsed in one call.
+        """
         logger.info("Parsing CV text using LLM...")
 
         # Load the example structure to guide the LLM
@@ -33,6 +85,26 @@ class CVParser:
             logger.warning(f"Could not load example structure: {e}")
             # Fallback prompt logic if needed, but for now rely on the example file being present
 
+        text_digest = sha256_hex(cv_text + "\0" + example_structure)
+        if self.cache is not None:
+            cached = self.cache.yaml(text_digest)
+            if cached is not None:
+                logger.info("CV text unchanged, using the previously parsed YAML.")
+                return CVParseResult(cached)
+
+        sections = split_cv_sections(cv_text)
+        example = self._load_mapping(example_structure)
+        if len(sections) < 2 or not example:
+            content = self._parse_whole(cv_text, example_structure)
+            result = CVParseResult(content, [] if self._is_yaml_mapping(content) else ["resume"])
+        else:
+            result = self._parse_sections(sections, example)
+
+        if self.cache is not None and result.complete:
+            self.cache.store_yaml(text_digest, result.yaml)
+        return result
+
+    def _parse_whole(self, cv_text: str, example_structure: str) -> str:
         prompt = f"""
             You are an expert resume parser. I will provide you with the raw text of a resume and an example YAML structure.
             Your task is to extract information from the resume and populate the YAML structure accordingly.
@@ -47,18 +119,102 @@ class CVParser:
 
             Parsed YAML:
             """
+        return self._reply_text(self.ai_adapter.invoke(prompt))
+
+    def _parse_sections(self, sections: Dict[str, str], example: dict) -> CVParseResult:
+        """Structures every section concurrently and merges them in the example's key order."""
+        schema = load_resume_schema()
+        logger.info(f"Structuring CV sections concurrently: {', '.join(sections)}")
+        with ThreadPoolExecutor(max_workers=self.workers or len(sections), thread_name_prefix="cv-section") as pool:
+            futures = {name: pool.submit(self._parse_section, name, text, example, schema)
+                       for name, text in sections.items()}
+            parts = {}
+            for name, future in futures.items():
+                try:
+                    parts[name] = future.result()
+                except Exception as e:
+                    logger.error(f"The {name} section of the CV could not be parsed: {e}")
+                    parts[name] = None
+
+        merged = {}
+        for part in parts.values():
+            merged.update(part or {})
+        resume = {key: merged[key] for key in example if key in merged}
+        resume.update((key, value) for key, value in merged.items() if key not in resume)
+        failed = [name for name, part in parts.items() if part is None]
+        if not resume:
+            logger.error("No section of the CV could be parsed.")
+            return CVParseResult("", failed)
+        for error in validate_resume(resume):
+            logger.warning(f"Parsed CV does not match the resume schema: {error}")
+        return CVParseResult(yaml.safe_dump(resume, allow_unicode=True, sort_keys=False).strip(), failed)
 
-        response = self.ai_adapter.invoke(prompt)
+    def _parse_section(self, name: str, text: str, example: dict, schema: dict) -> Optional[dict]:
+        """The top-level keys of one section, or None when the LLM gave no usable YAML."""
+        keys = [key for key in SECTION_KEYS[name] if key in example or key in schema]
+        example_yaml = yaml.safe_dump({key: example[key] for key in keys if key in example},
+                                      allow_unicode=True, sort_keys=False)
+        schema_yaml = yaml.safe_dump({key: schema[key] for key in keys if key in schema}, sort_keys=False)
+        section_digest = sha256_hex("\0".join((name, text, example_yaml, schema_yaml)))
+        if self.cache is not None:
+            cached = self._load_mapping(self.cache.yaml(section_digest) or "")
+            if cached:
+                return cached
 
+        prompt = f"""
+            You are an expert resume parser. I will provide you with the {name} section of a resume, an example of the
+            YAML it should become and the schema that YAML must satisfy.
+            Your task is to extract information from the text into YAML with exactly the top-level keys {", ".join(keys)}.
+            Use an empty string for fields the text does not mention and an empty list when it lists nothing.
+
+            Return ONLY the valid YAML string. Do not include markdown code blocks (```yaml ... ```).
+
+            Example YAML:
+            {example_yaml}
+            Schema:
+            {schema_yaml}
+            Resume Text:
+            {text}
+
+            Parsed YAML:
+            """
+        for attempt in range(1, SECTION_ATTEMPTS + 1):
+            try:
+                reply = self.ai_adapter.invoke(prompt)
+            except Exception as e:
+                logger.warning(f"The LLM call for the {name} section failed (attempt {attempt}/{SECTION_ATTEMPTS}): {e}")
+                continue
+            part = self._load_mapping(self._reply_text(reply))
+            part = {key: value for key, value in part.items() if key in keys}
+            if part:
+                if self.cache is not None:
+                    self.cache.store_yaml(section_digest, yaml.safe_dump(part, allow_unicode=True, sort_keys=False))
+                return part
+            logger.warning(f"The {name} section of the CV could not be parsed (attempt {attempt}/{SECTION_ATTEMPTS}).")
+        return None
+
+    @staticmethod
+    def _reply_text(response) -> str:
         # Cleanup response if it contains markdown
         content = response.content if hasattr(response, 'content') else str(response)
         if "```yaml" in content:
             content = content.split("```yaml")[1].split("```")[0]
         elif "```" in content:
             content = content.split("```")[1].split("```")[0]
-
         return content.strip()
 
+    @staticmethod
+    def _load_mapping(content: str) -> dict:
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @classmethod
+    def _is_yaml_mapping(cls, content: str) -> bool:
+        return bool(cls._load_mapping(content))
+
     def save_to_yaml(self, yaml_content: str, output_path: str = "data_folder/plain_text_resume.yaml"):
         """Saves the parsed YAML content to a file."""
         logger.info(f"Saving parsed CV to {output_path}")
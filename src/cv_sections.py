@@ -0,0 +1,62 @@
+import re
+from typing import Dict
+
+# Headings that open each CV section, after lowercasing and dropping punctuation. Text before
+# the first heading (name, address, links) belongs to "contact", as do summaries and other
+# headings the LLM needs no schema fragment for.
+SECTION_HEADINGS = {
+    "contact": ("contact", "contact information", "contact details", "personal information", "personal details",
+                "personal data", "summary", "professional summary", "profile", "professional profile", "about me",
+                "objective", "career objective", "references"),
+    "experience": ("experience", "work experience", "professional experience", "relevant experience",
+                   "employment", "employment history", "work history", "career history", "internships",
+                   "volunteer experience"),
+    "education": ("education", "education and training", "education & training", "academic background",
+                  "academic qualifications", "qualifications"),
+    "projects": ("projects", "personal projects", "key projects", "selected projects", "portfolio"),
+    "skills": ("skills", "technical skills", "key skills", "core competencies", "competencies",
+               "skills & abilities", "skills and abilities", "languages", "language skills", "certifications",
+               "certificates", "licenses & certifications", "courses", "training", "trainings", "awards",
+               "achievements", "honors", "honors & awards", "interests", "hobbies", "hobbies & interests"),
+}
+
+# The top-level keys of plain_text_resume.yaml each section is structured into.
+SECTION_KEYS = {
+    "contact": ("personal_information", "availability", "salary_expectations", "self_identification",
+                "legal_authorization", "work_preferences"),
+    "experience": ("experience_details",),
+    "education": ("education_details",),
+    "projects": ("projects",),
+    "skills": ("achievements", "certifications", "languages", "interests"),
+}
+
+MAX_HEADING_LENGTH = 40
+
+_HEADING_SECTION = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+
+
+def heading_section(line: str) -> str:
+    """The section a line opens, or "" when it is not a known heading."""
+    line = line.strip()
+    if not line or len(line) > MAX_HEADING_LENGTH:
+        return ""
+    heading = " ".join(re.sub(r"[^a-z& ]+", " ", line.lower()).split())
+    return _HEADING_SECTION.get(heading, "")
+
+
+def split_cv_sections(cv_text: str) -> Dict[str, str]:
+    """Splits CV text into the text of each section, in order of first appearance; empty sections are left out."""
+    lines: Dict[str, list] = {"contact": []}
+    current = "contact"
+    for line in cv_text.replace("\f", "\n").splitlines():
+        section = heading_section(line)
+        if section:
+            current = section
+            lines.setdefault(current, [])
+        lines[current].append(line.rstrip())
+    sections = {}
+    for section, section_lines in lines.items():
+        text = "\n".join(section_lines).strip()
+        if text and any(not heading_section(line) for line in section_lines if line.strip()):
+            sections[section] = text
+    return sections
@@ -0,0 +1,55 @@
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+from loguru import logger
+
+
+class DocumentPrefetcher:
+    """
+    Generates application documents on background threads while the browser keeps working.
+
+    A job's tailored resume and cover letter can be started as soon as its description is known;
+    by the time the Easy Apply form reaches its upload step they are usually ready, so the modal
+    no longer sits idle for the whole LLM and render time. Documents are keyed by (kind, job link).
+    result() waits for a scheduled document, or generates it in the calling thread when none was
+    scheduled or the background attempt failed.
+    """
+
+    def __init__(self, workers: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="document-prefetch")
+        self._futures: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+
+    def schedule(self, kind: str, job_link: str, generate: Callable[[], Any]) -> None:
+        with self._lock:
+            if (kind, job_link) not in self._futures:
+                logger.debug(f"Prefetching {kind} for {job_link}")
+                self._futures[(kind, job_link)] = self._executor.submit(generate)
+
+    def result(self, kind: str, job_link: str, generate: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._futures.pop((kind, job_link), None)
+        if future is not None:
+            started_at = time.monotonic()
+            try:
+                value = future.result()
+                logger.debug(f"Prefetched {kind} ready after waiting {time.monotonic() - started_at:.1f}s")
+                return value
+            except CancelledError:
+                pass
+            except Exception as e:
+                logger.warning(f"Prefetching {kind} failed, generating it again: {e}")
+        return generate()
+
+    def forget(self, job_link: str) -> None:
+        """Drops the documents of a finished job; ones that have not started yet are cancelled."""
+        with self._lock:
+            for key in [key for key in self._futures if key[1] == job_link]:
+                self._futures.pop(key).cancel()
+
+    def close(self) -> None:
+        with self._lock:
+            self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,71 @@
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+from loguru import logger
+
+# LinkedIn and most portals reject uploads above 2 MB
+MAX_UPLOAD_BYTES = 2 * 1024 * 1024
+# Leading bytes of each allowed upload type (.docx files are zip archives)
+FILE_SIGNATURES = {'.pdf': b'%PDF', '.doc': b'\xd0\xcf\x11\xe0', '.docx': b'PK\x03\x04'}
+
+
+@dataclass(frozen=True)
+class Document:
+    data: bytes
+    kind: str
+    extension: str = '.pdf'
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.data).hexdigest()[:20]
+
+    @property
+    def file_name(self) -> str:
+        return f"{self.kind}_{self.digest}{self.extension}"
+
+
+class DocumentStore:
+    """
+    Keeps generated documents as bytes and writes each distinct one to disk once.
+
+    Documents are checked (size, extension and file signature) before anything is written, and
+    are named after a hash of their content: identical documents share one file, and two
+    threads writing different documents can never pick the same name. Files are written to a
+    temporary name and renamed, so a reader never sees a half-written upload.
+    """
+
+    def __init__(self, folder: Union[str, Path] = "generated_cv", max_bytes: int = MAX_UPLOAD_BYTES):
+        self.folder = Path(folder)
+        self.max_bytes = max_bytes
+
+    def document(self, data: bytes, kind: str, extension: str = '.pdf') -> Document:
+        """Validates generated bytes; raises ValueError for documents that cannot be uploaded."""
+        extension = extension.lower()
+        if extension not in FILE_SIGNATURES:
+            raise ValueError(f"{kind} file format is not allowed. Only PDF, DOC, and DOCX formats are supported.")
+        if not data:
+            raise ValueError(f"{kind} is empty.")
+        if len(data) > self.max_bytes:
+            raise ValueError(f"{kind} file size exceeds the maximum limit of {self.max_bytes // (1024 * 1024)} MB.")
+        if not data.startswith(FILE_SIGNATURES[extension]):
+            raise ValueError(f"{kind} is not a valid {extension} file.")
+        return Document(data, kind, extension)
+
+    def put(self, data: bytes, kind: str, extension: str = '.pdf') -> Path:
+        """Validates and materializes a document; returns the path to pass to an upload field."""
+        return self.materialize(self.document(data, kind, extension))
+
+    def materialize(self, document: Document) -> Path:
+        path = self.folder / document.file_name
+        if not (path.exists() and path.stat().st_size == len(document.data)):
+            self.folder.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.folder / f".{document.file_name}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(document.data)
+            os.replace(tmp_path, path)
+            logger.debug(f"Wrote {document.kind} to {path} ({len(document.data)} bytes)")
+        return path
@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from loguru import logger
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+DRIVER_CACHE_FILE = Path.home() / ".cache" / "aihawk" / "chromedriver.json"
+
+# Browsers of one process (workers, scrape-ahead) start concurrently and share the cache file
+_resolve_lock = threading.Lock()
+
+
+def installed_chrome_version() -> Optional[str]:
+    try:
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logger.debug(f"Could not read the installed Chrome version: {e}")
+        return None
+
+
+@dataclass
+class StartupTiming:
+    source: str = ""
+    chrome_version: Optional[str] = None
+    version_check: float = 0.0
+    driver_resolution: float = 0.0
+    browser_launch: float = 0.0
+
+    def summary(self) -> str:
+        total = self.version_check + self.driver_resolution + self.browser_launch
+        return (f"Browser started in {total:.2f}s: Chrome {self.chrome_version or 'version unknown'} "
+                f"check {self.version_check:.2f}s, chromedriver from {self.source} {self.driver_resolution:.2f}s, "
+                f"launch {self.browser_launch:.2f}s")
+
+
+class ChromeDriverResolver:
+    """
+    Finds a chromedriver matching the installed Chrome without a network round trip on every start.
+
+    The resolved driver path is cached per Chrome version together with the file's size and mtime.
+    As long as Chrome is not updated and the cached driver is still on disk unchanged, it is used
+    as is; webdriver-manager (and the network) is only consulted when the version changes. If the
+    download fails, a cached driver for the same major version is used instead.
+    """
+
+    def __init__(self, cache_file: Path = DRIVER_CACHE_FILE, installer: Callable[[], str] = None,
+                 version_reader: Callable[[], Optional[str]] = installed_chrome_version):
+        self.cache_file = Path(cache_file)
+        self.installer = installer or (lambda: ChromeDriverManager().install())
+        self.version_reader = version_reader
+
+    def resolve(self, timing: Optional[StartupTiming] = None) -> str:
+        timing = timing or StartupTiming()
+        started_at = time.perf_counter()
+        version = self.version_reader()
+        timing.chrome_version = version
+        timing.version_check = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        with _resolve_lock:
+            path, timing.source = self._resolve_locked(version)
+        timing.driver_resolution = time.perf_counter() - started_at
+        return path
+
+    def _resolve_locked(self, version: Optional[str]):
+        cache = self._load()
+        entry = cache.get(version) if version else None
+        if entry and self._is_valid(entry):
+            return entry['path'], "cache"
+
+        try:
+            path = self.installer()
+        except Exception as e:
+            fallback = self._fallback(cache, version)
+            if fallback is None:
+                raise
+            logger.warning(f"Could not download chromedriver ({e}), using cached {fallback}")
+            return fallback, "cache (offline fallback)"
+
+        if version:
+            stat = os.stat(path)
+            cache[version] = {'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime}
+            self._save(cache)
+        return path, "webdriver-manager"
+
+    @staticmethod
+    def _is_valid(entry: dict) -> bool:
+        try:
+            stat = os.stat(entry['path'])
+        except (OSError, KeyError):
+            return False
+        return (stat.st_size == entry.get('size') and stat.st_mtime == entry.get('mtime')
+                and os.access(entry['path'], os.X_OK))
+
+    def _fallback(self, cache: dict, version: Optional[str]) -> Optional[str]:
+        major = version.split('.')[0] if version else None
+        newest_first = sorted(cache.items(), key=lambda item: [int(part) for part in item[0].split('.') if part.isdigit()],
+                              reverse=True)
+        for cached_version, entry in newest_first:
+            if (major is None or cached_version.split('.')[0] == major) and self._is_valid(entry):
+                return entry['path']
+        return None
+
+    def _load(self) -> dict:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable chromedriver cache {self.cache_file}: {e}")
+            return {}
+
+    def _save(self, cache: dict) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=4)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write chromedriver cache {self.cache_file}: {e}")
@@ -0,0 +1,114 @@
+from typing import Any, List, Sequence, Tuple
+
+from selenium.webdriver.support.ui import Select
+from loguru import logger
+
+# Values that mean a checkbox should be ticked.
+CHECKED_VALUES = {"yes", "true", "1", "on", "checked", "y"}
+
+# Sets the value of many fields in one round trip. Values go through the native prototype setter so
+# React/Angular value trackers notice the change, then input/change/blur are dispatched as a user
+# would. Returns one boolean per field; false means the field needs real keystrokes or clicks: file
+# inputs, checkboxes and radio buttons (the value setter would rewrite their submitted value instead
+# of checking them), read-only or autocomplete fields (their suggestions only open on key events),
+# selects without a matching option and fields whose framework rejected or reformatted the value.
+FILL_FIELDS_SCRIPT = """
+const fields = arguments[0];
+const setters = new Map([
+    [HTMLInputElement, Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set],
+    [HTMLTextAreaElement, Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set],
+    [HTMLSelectElement, Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, 'value').set],
+]);
+function fill(el, value) {
+    const type = (el.getAttribute('type') || '').toLowerCase();
+    if (el.readOnly || el.disabled || ['file', 'checkbox', 'radio'].includes(type)) return false;
+    if (el.getAttribute('role') === 'combobox' || el.hasAttribute('aria-autocomplete')) return false;
+    let setter = null;
+    for (const [cls, set] of setters) {
+        if (el instanceof cls) setter = set;
+    }
+    if (!setter) return false;
+    if (el instanceof HTMLSelectElement) {
+        const option = Array.from(el.options).find(o => o.text.trim() === value || o.value === value);
+        if (!option) return false;
+        value = option.value;
+    }
+    el.focus();
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.dispatchEvent(new FocusEvent('blur'));
+    el.blur();
+    return el.value === value;
+}
+return fields.map(([el, value]) => {
+    try {
+        return fill(el, value);
+    } catch (e) {
+        return false;
+    }
+});
+"""
+
+
+class FormFiller:
+    """
+    Fills form fields with one execute_script call instead of clear() + send_keys() per field.
+
+    send_keys types a value character by character over the wire, which makes long answers such
+    as cover letters slow. Fields the script cannot fill are typed (or selected) the usual way,
+    so the result is the same as before, only faster for the fields that allow it.
+    """
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+
+    def fill(self, fields: Sequence[Tuple[Any, Any]]) -> List[bool]:
+        """Fills (element, value) pairs; returns whether each field was filled by either means."""
+        fields = [(element, str(value)) for element, value in fields]
+        if not fields:
+            return []
+        try:
+            filled = self.driver.execute_script(FILL_FIELDS_SCRIPT, [list(field) for field in fields])
+        except Exception as e:
+            logger.debug(f"Native fill failed, typing all {len(fields)} fields instead: {e}")
+            filled = None
+        if not isinstance(filled, list):
+            filled = []
+        results = []
+        for index, (element, value) in enumerate(fields):
+            done = index < len(filled) and filled[index]
+            results.append(done or self._fill_with_keystrokes(element, value))
+        return results
+
+    def fill_one(self, element: Any, value: Any) -> bool:
+        return self.fill([(element, value)])[0]
+
+    def _fill_with_keystrokes(self, element: Any, value: str) -> bool:
+        try:
+            field_type = (element.get_attribute("type") or "").lower()
+            if field_type in ("checkbox", "radio"):
+                return self._check(element, field_type, value)
+            if element.tag_name.lower() == "select":
+                Select(element).select_by_visible_text(value)
+            else:
+                element.clear()
+                element.send_keys(value)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to fill field with {value[:30]!r}: {e}")
+            return False
+
+    @staticmethod
+    def _check(element: Any, field_type: str, value: str) -> bool:
+        """Clicks a checkbox into the state value asks for, or a radio button whose value or a yes answer selects it."""
+        wanted = value.strip().lower()
+        if field_type == "radio":
+            should_check = wanted in CHECKED_VALUES or wanted == (element.get_attribute("value") or "").strip().lower()
+        else:
+            should_check = wanted in CHECKED_VALUES
+        if element.is_selected() != should_check:
+            if field_type == "radio" and not should_check:
+                return False
+            element.click()
+        return element.is_selected() == should_check
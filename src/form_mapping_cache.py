@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+
+# Parts of a field that describe what it asks for; ids are left out because ATS forms generate them
+SIGNATURE_KEYS = ("tag", "type", "name", "label", "placeholder")
+# Applicant tracking systems that serve many companies' forms from subdomains or paths of one domain
+ATS_DOMAINS = ("myworkdayjobs.com", "greenhouse.io", "lever.co", "smartrecruiters.com", "icims.com", "taleo.net",
+               "successfactors.com", "successfactors.eu", "oraclecloud.com", "ashbyhq.com", "workable.com",
+               "bamboohr.com", "jobvite.com", "recruitee.com", "breezy.hr", "teamtailor.com", "personio.de",
+               "applytojob.com")
+
+
+def ats_domain(url: str) -> str:
+    """
+    Collapses per-company hosts of a known ATS (acme.wd5.myworkdayjobs.com, boards.greenhouse.io) to
+    the ATS domain. Any other host is kept whole, so careers.acme.co.uk and careers.other.co.uk stay apart.
+    """
+    host = (urlparse(url).hostname or "").lower()
+    for domain in ATS_DOMAINS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return host[4:] if host.startswith("www.") else host
+
+
+def _normalize(value) -> str:
+    text = re.sub(r"\d+", "", str(value or "").lower())
+    return re.sub(r"[\s_\-\[\]]+", " ", text).strip(" *:")
+
+
+def field_signature(field: dict) -> str:
+    return "|".join(_normalize(field.get(key)) for key in SIGNATURE_KEYS)
+
+
+def form_fingerprint(domain: str, fields: List[dict]) -> str:
+    signatures = sorted(field_signature(field) for field in fields)
+    return hashlib.sha256(json.dumps([domain, signatures]).encode("utf-8")).hexdigest()[:16]
+
+
+class FormMappingCache:
+    """
+    Remembers which resume key each form field maps to, per ATS domain.
+
+    Fields are identified by a normalized signature (tag, type, name, label, placeholder with
+    digits stripped), so the same question on another company's form of the same ATS is
+    recognized. Fields the LLM left unmapped are remembered as None, so a form made only of known
+    fields needs no LLM call at all. The cache is a JSON file shared by the threads of a process.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._domains: Dict[str, Dict[str, Optional[str]]] = {}
+        self._load()
+
+    def lookup(self, domain: str, fields: List[dict]) -> Dict[int, Optional[str]]:
+        """Returns {field index: resume key or None} for the fields whose mapping is known."""
+        with self._lock:
+            known_fields = self._domains.get(domain, {})
+            known = {field["index"]: known_fields[field_signature(field)]
+                     for field in fields if field_signature(field) in known_fields}
+        logger.debug(f"Form {form_fingerprint(domain, fields)} on {domain}: "
+                     f"{len(known)}/{len(fields)} field mappings cached")
+        return known
+
+    def store(self, domain: str, fields: List[dict], mapping: Dict[int, str]) -> None:
+        """Stores the mapping of fields; fields missing from mapping are remembered as unmapped."""
+        with self._lock:
+            known_fields = self._domains.setdefault(domain, {})
+            for field in fields:
+                known_fields[field_signature(field)] = mapping.get(field["index"])
+            self._save()
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._domains = data.get("domains", {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable form mapping cache {self.path}: {e}")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"domains": self._domains}, f, indent=4)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write form mapping cache {self.path}: {e}")
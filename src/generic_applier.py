@@ -3,115 +3,189 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
 from src.llm.llm_manager import AIAdapter
+from src.wait_policy import WaitPolicy
+from src.form_filler import FormFiller
+from src.form_mapping_cache import FormMappingCache, ats_domain
+from src.resume_projection import ResumeProjection
+from app_config import PORTAL_MAX_PAGES, READINESS_TIMEOUT
 from loguru import logger
-import time
 import json
 
+# Returns every visible, fillable input/textarea/select with its label resolved the way assistive
+# technology would (aria-labelledby, aria-label, label[for], wrapping label), so the page is
+# analyzed in one round trip instead of several chromedriver calls per field. Elements are
+# returned as references and come back to Python as WebElements.
+HARVEST_FIELDS_SCRIPT = """
+const skippedTypes = new Set(['hidden', 'submit', 'button', 'image', 'reset']);
+const text = (node) => (node ? node.innerText || node.textContent || '' : '').trim();
+function isVisible(el) {
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+}
+function labelOf(el) {
+    const labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy) {
+        const label = labelledBy.split(/\\s+/).map(id => text(document.getElementById(id))).join(' ').trim();
+        if (label) return label;
+    }
+    if (el.getAttribute('aria-label')) return el.getAttribute('aria-label').trim();
+    if (el.id) {
+        const label = document.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+        if (label && text(label)) return text(label);
+    }
+    return text(el.closest('label')) || null;
+}
+const fields = [];
+for (const el of document.querySelectorAll('input, textarea, select')) {
+    const tag = el.tagName.toLowerCase();
+    const type = (el.getAttribute('type') || 'text').toLowerCase();
+    if (tag === 'input' && skippedTypes.has(type)) continue;
+    if (el.disabled || !isVisible(el)) continue;
+    const field = {tag: tag, name: el.getAttribute('name'), id: el.id || null, label: labelOf(el),
+                   required: el.required || el.getAttribute('aria-required') === 'true', element: el};
+    if (tag === 'input') {
+        field.type = type;
+        field.placeholder = el.getAttribute('placeholder');
+    }
+    if (tag === 'select') {
+        field.options = Array.from(el.options).slice(0, 10).map(option => option.text.trim());
+    }
+    fields.push(field);
+}
+return fields;
+"""
+
+# Outcomes returned by GenericPortalApplier.apply
+SUBMITTED = "submitted"
+NO_NEXT_PAGE = "no_next_page"
+PAGE_LIMIT = "page_limit"
+
 class GenericPortalApplier:
-    def __init__(self, driver: webdriver.Chrome, ai_adapter: AIAdapter, resume_data: dict):
+    def __init__(self, driver: webdriver.Chrome, ai_adapter: AIAdapter, resume_data, wait_policy: WaitPolicy = None,
+                 max_pages: int = PORTAL_MAX_PAGES, page_timeout: float = READINESS_TIMEOUT,
+                 mapping_cache: FormMappingCache = None):
         self.driver = driver
         self.ai_adapter = ai_adapter
-        self.resume_data = resume_data
-
-    def apply(self, url: str):
-        """Attempts to apply to a job on a generic portal."""
+        # A ResumeProjection also lets fields be matched by label before the cache and the LLM are asked
+        self.resume_projection = resume_data if isinstance(resume_data, ResumeProjection) else None
+        self.resume_data = resume_data.fields if self.resume_projection else resume_data
+        self.wait_policy = wait_policy or WaitPolicy(driver, timeout=page_timeout)
+        self.max_pages = max_pages
+        self.mapping_cache = mapping_cache
+        self.form_filler = FormFiller(driver)
+        self.pages_processed = 0
+
+    def apply(self, url: str) -> str:
+        """Attempts to apply to a job on a generic portal. Returns SUBMITTED, NO_NEXT_PAGE or PAGE_LIMIT."""
         logger.info(f"Navigating to {url}")
+        self.wait_policy.reset_network_tracking()
         self.driver.get(url)
-        time.sleep(5) # Wait for load
+        self.wait_policy.page_ready()
 
         # Iterate through pages (simple heuristic)
-        max_pages = 5
-        for page in range(max_pages):
+        for page in range(self.max_pages):
             logger.info(f"Processing page {page + 1}...")
+            self.pages_processed = page + 1
             if self.process_page():
                 logger.info("Application seemingly submitted or finished.")
-                break
+                return SUBMITTED
 
             # Try to go to next page
             if not self.go_to_next_page():
                 logger.info("No next page found. Stopping.")
-                break
-            time.sleep(3)
+                return NO_NEXT_PAGE
+            self.wait_policy.page_ready()
+        return PAGE_LIMIT
 
     def process_page(self) -> bool:
         """
         Analyzes and fills the current page.
         Returns True if it thinks it submitted the application.
         """
-        # 1. Analyze inputs, selects, textareas
-        elements_info = []
-        valid_elements = []
-
-        # Find Inputs
-        inputs = self.driver.find_elements(By.TAG_NAME, "input")
-        for i, inp in enumerate(inputs):
-            if inp.get_attribute("type") in ["hidden", "submit", "button", "image", "reset"]:
-                continue
-            if not inp.is_displayed():
-                continue
-
-            info = {
-                "tag": "input",
-                "index": len(valid_elements),
-                "type": inp.get_attribute("type"),
-                "name": inp.get_attribute("name"),
-                "id": inp.get_attribute("id"),
-                "placeholder": inp.get_attribute("placeholder")
-            }
-            # Label heuristic
-            try:
-                labels = self.driver.find_elements(By.CSS_SELECTOR, f"label[for='{inp.get_attribute('id')}']")
-                if labels:
-                    info["label"] = labels[0].text
-            except: pass
-
-            elements_info.append(info)
-            valid_elements.append(inp)
-
-        # Find Textareas
-        textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
-        for ta in textareas:
-            if not ta.is_displayed(): continue
-            info = {
-                "tag": "textarea",
-                "index": len(valid_elements),
-                "name": ta.get_attribute("name"),
-                "id": ta.get_attribute("id")
-            }
-            try:
-                labels = self.driver.find_elements(By.CSS_SELECTOR, f"label[for='{ta.get_attribute('id')}']")
-                if labels:
-                    info["label"] = labels[0].text
-            except: pass
-            elements_info.append(info)
-            valid_elements.append(ta)
-
-        # Find Selects
-        selects = self.driver.find_elements(By.TAG_NAME, "select")
-        for sel in selects:
-            if not sel.is_displayed(): continue
-            info = {
-                "tag": "select",
-                "index": len(valid_elements),
-                "name": sel.get_attribute("name"),
-                "id": sel.get_attribute("id"),
-                "options": [o.text for o in sel.find_elements(By.TAG_NAME, "option")[:10]] # limit options
-            }
-            try:
-                labels = self.driver.find_elements(By.CSS_SELECTOR, f"label[for='{sel.get_attribute('id')}']")
-                if labels:
-                    info["label"] = labels[0].text
-            except: pass
-            elements_info.append(info)
-            valid_elements.append(sel)
+        # 1. Analyze inputs, selects, textareas (one script round trip for the whole page)
+        elements_info, valid_elements = self.harvest_fields()
 
         if not elements_info:
             logger.info("No fillable fields found on this page.")
             return False
 
-        # 2. LLM Mapping
+        # 2. Map fields to resume keys (cached mappings first, the LLM for the rest)
+        mapping = self.map_fields(elements_info)
+
+        # 3. Fill Fields (one script call; fields that need keystrokes are typed)
+        fields = [(valid_elements[idx], self.resume_data[key]) for idx, key in mapping.items()
+                  if 0 <= idx < len(valid_elements) and self.resume_data.get(key)]
+        filled = self.form_filler.fill(fields)
+        logger.debug(f"Filled {sum(filled)}/{len(fields)} mapped fields")
+
+        # 4. Check for Submit
+        # Heuristic: Button with text "Submit", "Apply", "Complete"
+        buttons = self.driver.find_elements(By.TAG_NAME, "button") + \
+                  self.driver.find_elements(By.CSS_SELECTOR, "input[type='submit']")
+
+        for btn in buttons:
+            try:
+                text = btn.text.lower() if btn.tag_name == "button" else btn.get_attribute("value").lower()
+                if any(x in text for x in ["submit", "apply", "complete application", "send"]):
+                    logger.info(f"Found submit button: {text}")
+                    # btn.click() # Uncomment to actually submit. For safety in this demo, we might skip or prompt.
+                    # For agentic request, we should click.
+                    btn.click()
+                    return True
+            except: pass
+
+        return False
+
+    def harvest_fields(self):
+        """Returns the field descriptions sent to the mapper and the matching WebElements, in the same order."""
+        try:
+            fields = self.driver.execute_script(HARVEST_FIELDS_SCRIPT) or []
+        except Exception as e:
+            logger.error(f"Failed to analyze the form fields: {e}")
+            return [], []
+        elements_info, valid_elements = [], []
+        for field in fields:
+            valid_elements.append(field.pop("element"))
+            field["index"] = len(elements_info)
+            elements_info.append({key: value for key, value in field.items() if value is not None})
+        return elements_info, valid_elements
+
+    def map_fields(self, elements_info: list) -> dict:
+        """
+        Returns {field index: resume key}. Fields are matched by label against the resume projection first,
+        then looked up in the mapping cache; only the rest are sent to the LLM.
+        """
+        matched = {}
+        if self.resume_projection:
+            matched = {info["index"]: self.resume_projection.match(info) for info in elements_info}
+            matched = {idx: key for idx, key in matched.items() if key is not None}
+            elements_info = [info for info in elements_info if info["index"] not in matched]
+            if not elements_info:
+                return matched
+
+        domain = ats_domain(self.driver.current_url)
+        known = self.mapping_cache.lookup(domain, elements_info) if self.mapping_cache else {}
+        # A cached key the current resume does not have is asked again
+        known = {idx: key for idx, key in known.items() if key is None or key in self.resume_data}
+        mapping = {**matched, **{idx: key for idx, key in known.items() if key is not None}}
+        unknown = [info for info in elements_info if info["index"] not in known]
+        if not unknown:
+            logger.info("All fields of this form were mapped from the cache.")
+            return mapping
+
+        llm_mapping = self.map_fields_with_llm(unknown)
+        if llm_mapping is None:
+            return mapping
+        unknown_indexes = {info["index"] for info in unknown}
+        validated = {idx: key for idx, key in llm_mapping.items() if idx in unknown_indexes and key in self.resume_data}
+        if self.mapping_cache:
+            self.mapping_cache.store(domain, unknown, validated)
+        mapping.update(validated)
+        return mapping
+
+    def map_fields_with_llm(self, elements_info: list):
+        """Asks the LLM to map fields to resume keys. Returns {field index: resume key}, or None if the call failed."""
         prompt = f"""
         I have a web form with these fields:
         {json.dumps(elements_info, indent=2)}
@@ -130,47 +204,10 @@ class GenericPortalApplier:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
                 content = content.split("```")[1].split("```")[0]
-            mapping = json.loads(content.strip())
+            return {int(idx): key for idx, key in json.loads(content.strip()).items()}
         except Exception as e:
             logger.error(f"LLM Mapping failed: {e}")
-            mapping = {}
-
-        # 3. Fill Fields
-        for idx_str, key in mapping.items():
-            try:
-                idx = int(idx_str)
-                if 0 <= idx < len(valid_elements):
-                    element = valid_elements[idx]
-                    tag = elements_info[idx]["tag"]
-                    value = self.resume_data.get(key)
-
-                    if not value: continue
-
-                    if tag in ["input", "textarea"]:
-                        element.clear()
-                        element.send_keys(str(value))
-                    elif tag == "select":
-                        Select(element).select_by_visible_text(str(value)) # Simplified
-            except Exception as e:
-                logger.warning(f"Failed to fill field {idx_str}: {e}")
-
-        # 4. Check for Submit
-        # Heuristic: Button with text "Submit", "Apply", "Complete"
-        buttons = self.driver.find_elements(By.TAG_NAME, "button") + \
-                  self.driver.find_elements(By.CSS_SELECTOR, "input[type='submit']")
-
-        for btn in buttons:
-            try:
-                text = btn.text.lower() if btn.tag_name == "button" else btn.get_attribute("value").lower()
-                if any(x in text for x in ["submit", "apply", "complete application", "send"]):
-                    logger.info(f"Found submit button: {text}")
-                    # btn.click() # Uncomment to actually submit. For safety in this demo, we might skip or prompt.
-                    # For agentic request, we should click.
-                    btn.click()
-                    return True
-            except: pass
-
-        return False
+            return None
 
     def go_to_next_page(self) -> bool:
         """Finds and clicks a Next button."""
@@ -1,22 +1,141 @@
-
+import json
 import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
 from loguru import logger
 import os
 
+from app_config import GMAIL_DAILY_LIMIT, GMAIL_MESSAGES_PER_MINUTE
+from src.pacing import TokenBucket
+
+SENT = "sent"
+FAILED = "failed"
+DEFERRED = "deferred"
+
+# Attempts per message; a dropped connection is re-opened between attempts.
+MAX_SEND_ATTEMPTS = 2
+
+
+@dataclass
+class OutgoingEmail:
+    to_email: str
+    subject: str
+    body: str
+    attachment_path: Optional[str] = None
+
+
+@dataclass
+class SendOutcome:
+    to_email: str
+    status: str
+    error: Optional[str] = None
+
+
+class SendRateLimiter:
+    """
+    Keeps email applications within Gmail's sending limits.
+
+    Messages are spaced evenly to at most per_minute, and at most per_day are sent per calendar
+    day. With a state_file the day's count survives restarts, so separate runs share the limit.
+    """
+
+    def __init__(self, per_minute: float = GMAIL_MESSAGES_PER_MINUTE, per_day: Optional[int] = GMAIL_DAILY_LIMIT,
+                 state_file: Optional[Path] = None, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep, now: Callable[[], datetime] = datetime.now):
+        self.bucket = TokenBucket(per_minute / 60, 1, clock)
+        self.per_day = per_day
+        self.state_file = Path(state_file) if state_file else None
+        self.sleep = sleep
+        self.now = now
+        self._counts = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """Waits until the next message may be sent; returns False, without waiting, once today's limit is reached."""
+        with self._lock:
+            if self.per_day is not None and self.sent_today() >= self.per_day:
+                return False
+            wait_time = self.bucket.time_until_available()
+            if wait_time > 0:
+                logger.debug(f"Email rate limit: waiting {wait_time:.1f} seconds")
+                self.sleep(wait_time)
+            self.bucket.consume()
+            return True
+
+    def record(self) -> None:
+        """Counts a message that was sent."""
+        with self._lock:
+            self._load_counts()['sent'] += 1
+            self._save_counts()
+
+    def sent_today(self) -> int:
+        return self._load_counts()['sent']
+
+    def _load_counts(self) -> dict:
+        today = self.now().strftime("%Y-%m-%d")
+        if self._counts is not None and self._counts['date'] == today:
+            return self._counts
+        counts = {'date': today, 'sent': 0}
+        if self.state_file and self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                if saved.get('date') == today:
+                    counts['sent'] = saved.get('sent', 0)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Could not read email rate limit state {self.state_file}: {e}")
+        self._counts = counts
+        return counts
+
+    def _save_counts(self) -> None:
+        if not self.state_file:
+            return
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._counts, f)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            logger.warning(f"Could not write email rate limit state {self.state_file}: {e}")
+
+
 class GmailAgent:
-    def __init__(self, email: str, password: str):
+    """
+    Sends emails through Gmail SMTP over one authenticated connection.
+
+    The connection is opened (STARTTLS and login) on the first message and kept for the next
+    ones, so a batch of applications pays for a single handshake; if the server drops it, it is
+    opened again and the message retried. Every message waits for rate_limiter first. Use the
+    agent as a context manager, or call close(), to end the session.
+    """
+
+    def __init__(self, email: str, password: str, smtp_server: str = "smtp.gmail.com", smtp_port: int = 587,
+                 rate_limiter: Optional[SendRateLimiter] = None, starttls: bool = True, timeout: float = 30):
         self.email = email
         self.password = password
-        self.smtp_server = "smtp.gmail.com"
-        self.smtp_port = 587
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.rate_limiter = rate_limiter or SendRateLimiter()
+        self.starttls = starttls
+        self.timeout = timeout
+        self._connection: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
 
-    def send_email(self, to_email: str, subject: str, body: str, attachment_path: str = None):
-        """Sends an email using Gmail SMTP."""
-        logger.info(f"Sending email to {to_email}...")
+    def __enter__(self) -> 'GmailAgent':
+        return self
 
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def build_message(self, to_email: str, subject: str, body: str, attachment_path: str = None) -> MIMEMultipart:
         msg = MIMEMultipart()
         msg['From'] = self.email
         msg['To'] = to_email
@@ -33,14 +152,87 @@ class GmailAgent:
             except Exception as e:
                 logger.error(f"Failed to attach file: {e}")
                 raise
+        return msg
 
+    def send_email(self, to_email: str, subject: str, body: str, attachment_path: str = None):
+        """Sends an email using Gmail SMTP."""
+        logger.info(f"Sending email to {to_email}...")
+        msg = self.build_message(to_email, subject, body, attachment_path)
+        if not self.rate_limiter.acquire():
+            raise RuntimeError(f"Daily limit of {self.rate_limiter.per_day} emails reached, try again tomorrow.")
         try:
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email, self.password)
-            server.send_message(msg)
-            server.quit()
+            self._send(msg)
             logger.success("Email sent successfully.")
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
             raise
+
+    def send_batch(self, emails: Iterable[OutgoingEmail]) -> List[SendOutcome]:
+        """
+        Sends emails one after another over the kept connection. A message that cannot be built
+        or is refused fails on its own; once today's limit is reached the rest are deferred.
+        A login failure stops the batch.
+        """
+        outcomes = []
+        limit_reached = False
+        for email in emails:
+            if limit_reached or not self.rate_limiter.acquire():
+                limit_reached = True
+                outcomes.append(SendOutcome(email.to_email, DEFERRED, "daily email limit reached"))
+                continue
+            try:
+                self._send(self.build_message(email.to_email, email.subject, email.body, email.attachment_path))
+            except smtplib.SMTPAuthenticationError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to send email to {email.to_email}: {e}")
+                outcomes.append(SendOutcome(email.to_email, FAILED, str(e)))
+                continue
+            logger.info(f"Email sent to {email.to_email}")
+            outcomes.append(SendOutcome(email.to_email, SENT))
+        return outcomes
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _send(self, msg: MIMEMultipart) -> None:
+        with self._lock:
+            for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+                try:
+                    self._connect().send_message(msg)
+                    break
+                except smtplib.SMTPResponseException as e:
+                    # 421: the server is closing the session, e.g. Gmail's "try again later"
+                    if e.smtp_code != 421:
+                        raise
+                    error = e
+                except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError) as e:
+                    error = e
+                self._disconnect()
+                if attempt == MAX_SEND_ATTEMPTS:
+                    raise error
+                logger.warning(f"SMTP connection lost ({error}), reconnecting")
+        self.rate_limiter.record()
+
+    def _connect(self) -> smtplib.SMTP:
+        if self._connection is None:
+            connection = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout)
+            try:
+                if self.starttls:
+                    connection.starttls()
+                connection.login(self.email, self.password)
+            except Exception:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _disconnect(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.quit()
+        except (smtplib.SMTPException, OSError):
+            self._connection.close()
+        self._connection = None
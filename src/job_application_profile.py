@@ -63,10 +63,11 @@ class JobApplicationProfile:
     availability: Availability
     salary_expectations: SalaryExpectations
 
-    def __init__(self, yaml_str: str):
+    def __init__(self, yaml_str):
+        """yaml_str is the resume YAML, or the mapping it was already parsed into (see src/resume_loader.py)."""
         logger.debug("Initializing JobApplicationProfile with provided YAML string")
         try:
-            data = yaml.safe_load(yaml_str)
+            data = yaml_str if isinstance(yaml_str, dict) else yaml.safe_load(yaml_str)
             logger.debug(f"YAML data successfully parsed: {data}")
         except yaml.YAMLError as e:
             logger.error(f"Error parsing YAML file: {e}")
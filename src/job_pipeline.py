@@ -0,0 +1,154 @@
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from src.job import Job
+from src.pacing import PAGE
+from src.wait_policy import WaitPolicy
+
+LINKEDIN_HOME = "https://www.linkedin.com"
+
+
+@dataclass
+class PageBatch:
+    position: str
+    location: str
+    page_number: int
+    jobs: List[Job] = field(default_factory=list)
+    skipped: List[Tuple[Job, str]] = field(default_factory=list)
+
+
+class ScrapeAheadPipeline:
+    """
+    Producer/consumer pipeline over LinkedIn search pages.
+
+    A harvester thread drives its own browser through the upcoming search pages, extracts the job
+    tiles, filters and deduplicates them, and puts one PageBatch per page on a bounded queue. The
+    caller consumes the batches on the main browser, so scrolling, tile extraction and filtering of
+    the next page happen while the current page's forms are being filled.
+
+    WebDriver sessions are not thread-safe, so the harvester never touches the main driver; it gets
+    the main session's cookies instead so it is logged in as the same user.
+    """
+
+    _DONE = object()
+
+    def __init__(self, job_manager, driver_factory: Callable[[], object], queue_size: int = 2):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1.")
+        self.job_manager = job_manager
+        self.driver_factory = driver_factory
+        self.batches = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.error: Optional[BaseException] = None
+        self._seen_links = set()
+        self._thread = None
+
+    def run(self, searches: Iterable[Tuple[str, str]]) -> Iterator[PageBatch]:
+        cookies = self.job_manager.driver.get_cookies()
+        self._thread = threading.Thread(target=self._produce, args=(list(searches), cookies),
+                                        name="scrape-ahead", daemon=True)
+        self._thread.start()
+        try:
+            while True:
+                batch = self.batches.get()
+                if batch is self._DONE:
+                    break
+                yield batch
+        finally:
+            self.stop()
+        if self.error is not None:
+            logger.error(f"Scrape-ahead harvester stopped early: {self.error}")
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        # Unblock a producer waiting on a full queue
+        try:
+            while True:
+                self.batches.get_nowait()
+        except queue.Empty:
+            pass
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=30)
+
+    def _put(self, item) -> bool:
+        while not self.stop_event.is_set():
+            try:
+                self.batches.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, searches: List[Tuple[str, str]], cookies: List[dict]) -> None:
+        driver = None
+        try:
+            driver = self.driver_factory()
+            self._share_session(driver, cookies)
+            wait_policy = WaitPolicy(driver)
+            for position, location in searches:
+                if not self._harvest_search(driver, wait_policy, position, location):
+                    break
+        except Exception as e:
+            self.error = e
+        finally:
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.debug(f"Failed to quit scrape-ahead browser: {e}")
+            # Always deliver the end marker, even if the consumer is not currently reading
+            while True:
+                try:
+                    self.batches.put(self._DONE, timeout=0.5)
+                    break
+                except queue.Full:
+                    if self.stop_event.is_set():
+                        break
+
+    def _share_session(self, driver, cookies: List[dict]) -> None:
+        driver.get(LINKEDIN_HOME)
+        for cookie in cookies:
+            cookie = {key: value for key, value in cookie.items() if key != 'sameSite'}
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug(f"Could not copy cookie {cookie.get('name')}: {e}")
+
+    def _harvest_search(self, driver, wait_policy: WaitPolicy, position: str, location: str) -> bool:
+        """Harvests every page of one search. Returns False when the whole run should stop."""
+        manager = self.job_manager
+        location_url = "&location=" + location
+        page_number = 0
+        while not self.stop_event.is_set():
+            if manager.pacing is not None and not manager.pacing.acquire(PAGE):
+                logger.info("Daily page load cap reached, scrape-ahead harvester stopping.")
+                return False
+            wait_policy.reset_network_tracking()
+            manager.next_job_page(position, location_url, page_number, driver=driver)
+            wait_policy.page_ready()
+            tiles = manager.get_jobs_from_page(driver=driver)
+            if not tiles:
+                logger.debug(f"Scrape-ahead: no more jobs for {position} in {location}")
+                return True
+
+            batch = PageBatch(position, location, page_number)
+            for job in manager.jobs_from_tiles(tiles):
+                if job.link and job.link in self._seen_links:
+                    logger.debug(f"Scrape-ahead: duplicate job {job.link}")
+                    continue
+                self._seen_links.add(job.link)
+                skip_reason = manager.get_skip_reason(job)
+                if skip_reason:
+                    batch.skipped.append((job, skip_reason))
+                else:
+                    batch.jobs.append(job)
+            logger.debug(f"Scrape-ahead: page {page_number} of {position} in {location} queued "
+                         f"with {len(batch.jobs)} jobs, {len(batch.skipped)} skipped")
+            if not self._put(batch):
+                return False
+            page_number += 1
+        return False
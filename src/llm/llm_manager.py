@@ -1,26 +1,28 @@
+from __future__ import annotations
+
 import json
 import os
 import re
 import textwrap
+import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 from typing import Union
 
-import httpx
-from Levenshtein import distance
 from dotenv import load_dotenv
-from langchain_core.messages import BaseMessage
-from langchain_core.messages.ai import AIMessage
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompt_values import StringPromptValue
-from langchain_core.prompts import ChatPromptTemplate
 
 import src.strings as strings
 from loguru import logger
 
+# LangChain, httpx and Levenshtein are imported where they are used, so importing this module
+# (e.g. for AIAdapter alone) does not load the whole GPTAnswerer stack
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_core.messages.ai import AIMessage
+
 load_dotenv()
 
 
@@ -132,6 +134,9 @@ class AIAdapter:
         return self.model.invoke(prompt)
 
 
+_calls_log_lock = threading.Lock()
+
+
 class LLMLogger:
 
     def __init__(self, llm: Union[OpenAIModel, OllamaModel, ClaudeModel, GeminiModel]):
@@ -152,6 +157,8 @@ class LLMLogger:
             logger.error(f"Error determining the log path: {str(e)}")
             raise
 
+        from langchain_core.prompt_values import StringPromptValue
+
         if isinstance(prompts, StringPromptValue):
             logger.debug("Prompts are of type StringPromptValue")
             prompts = prompts.text
@@ -230,9 +237,10 @@ class LLMLogger:
             raise
 
         try:
-            with open(calls_log, "a", encoding="utf-8") as f:
-                json_string = json.dumps(
-                    log_entry, ensure_ascii=False, indent=4)
+            json_string = json.dumps(
+                log_entry, ensure_ascii=False, indent=4)
+            # Prefetch threads log calls too; keep each multi-line entry in one piece
+            with _calls_log_lock, open(calls_log, "a", encoding="utf-8") as f:
                 f.write(json_string + "\n")
                 logger.debug(f"Log entry written to file: {calls_log}")
         except Exception as e:
@@ -247,6 +255,8 @@ class LoggerChatModel:
         logger.debug(f"LoggerChatModel successfully initialized with LLM: {llm}")
 
     def __call__(self, messages: List[Dict[str, str]]) -> str:
+        import httpx
+
         logger.debug(f"Entering __call__ method with messages: {messages}")
         while True:
             try:
@@ -366,6 +376,8 @@ class GPTAnswerer:
 
     @staticmethod
     def find_best_match(text: str, options: list[str]) -> str:
+        from Levenshtein import distance
+
         logger.debug(f"Finding best match for text: '{text}' in options: {options}")
         distances = [
             (option, distance(text.lower(), option.lower())) for option in options
@@ -404,14 +416,15 @@ class GPTAnswerer:
         strings.summarize_prompt_template = self._preprocess_template_string(
             strings.summarize_prompt_template
         )
-        prompt = ChatPromptTemplate.from_template(
-            strings.summarize_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        chain = self._create_chain(strings.summarize_prompt_template)
         output = chain.invoke({"text": text})
         logger.debug(f"Summary generated: {output}")
         return output
 
     def _create_chain(self, template: str):
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         logger.debug(f"Creating chain with template: {template}")
         prompt = ChatPromptTemplate.from_template(template)
         return prompt | self.llm_cheap | StrOutputParser()
@@ -520,8 +533,7 @@ class GPTAnswerer:
 
         Provide only the exact name of the section from the list above with no additional text.
         """
-        prompt = ChatPromptTemplate.from_template(section_prompt)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        chain = self._create_chain(section_prompt)
         output = chain.invoke({"question": question})
 
         match = re.search(
@@ -560,8 +572,7 @@ class GPTAnswerer:
         logger.debug(f"Answering numeric question: {question}")
         func_template = self._preprocess_template_string(
             strings.numeric_question_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        chain = self._create_chain(func_template)
         output_str = chain.invoke(
             {"resume_educations": self.resume.education_details, "resume_jobs": self.resume.experience_details,
              "resume_projects": self.resume.projects, "question": question})
@@ -589,8 +600,7 @@ class GPTAnswerer:
         logger.debug(f"Answering question from options: {question}")
         func_template = self._preprocess_template_string(
             strings.options_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        chain = self._create_chain(func_template)
         output_str = chain.invoke(
             {"resume": self.resume, "question": question, "options": options})
         logger.debug(f"Raw output for options question: {output_str}")
@@ -609,8 +619,7 @@ class GPTAnswerer:
 
                 phrase: {phrase}
                 """
-        prompt = ChatPromptTemplate.from_template(prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        chain = self._create_chain(prompt_template)
         response = chain.invoke({"phrase": phrase})
         logger.debug(f"Response for resume_or_cover: {response}")
         if "resume" in response:
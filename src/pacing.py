@@ -0,0 +1,232 @@
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from app_config import MINIMUM_WAIT_TIME
+from loguru import logger
+
+PAGE = 'page'
+SUBMISSION = 'submission'
+
+DEFAULT_PACING = {
+    'page_loads_per_minute': 60 / MINIMUM_WAIT_TIME,
+    'submissions_per_hour': 30,
+    'burst': 1,
+    'daily_page_cap': None,
+    'daily_submission_cap': None,
+    'quiet_hours': None,
+    'break_every_pages': 5,
+    'break_seconds': [5, 34],
+}
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate_per_second <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive.")
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated_at = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def time_until_available(self, tokens: float = 1) -> float:
+        self._refill()
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    def consume(self, tokens: float = 1) -> None:
+        self._refill()
+        self.tokens -= tokens
+
+
+def parse_quiet_hours(value: Optional[str]):
+    """Parses 'HH:MM-HH:MM' into a (start, end) pair of datetime.time; windows may wrap midnight."""
+    if not value:
+        return None
+    try:
+        start, end = (datetime.strptime(part.strip(), "%H:%M").time() for part in value.split('-'))
+    except ValueError as e:
+        raise ValueError(f"Invalid quiet_hours '{value}', expected 'HH:MM-HH:MM'") from e
+    return start, end
+
+
+class PacingPolicy:
+    """
+    Non-interactive scheduler for search page loads and application submissions.
+
+    Each kind of action draws from its own token bucket, is capped per calendar day and is
+    suspended during quiet hours. While the policy waits, queued prefetch tasks are run so the
+    idle time does useful work; the remaining idle time is recorded in the stats.
+
+    The policy may be shared between threads: waits for different kinds run concurrently,
+    waits for the same kind are serialized.
+    """
+
+    def __init__(self, page_loads_per_minute: float, submissions_per_hour: float, burst: float = 1,
+                 daily_page_cap: Optional[int] = None, daily_submission_cap: Optional[int] = None,
+                 quiet_hours: Optional[str] = None, break_every_pages: int = 0, break_seconds=(0, 0),
+                 state_file: Optional[Path] = None, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep, now: Callable[[], datetime] = datetime.now):
+        self.buckets = {
+            PAGE: TokenBucket(page_loads_per_minute / 60, burst, clock),
+            SUBMISSION: TokenBucket(submissions_per_hour / 3600, burst, clock),
+        }
+        self.daily_caps = {PAGE: daily_page_cap, SUBMISSION: daily_submission_cap}
+        self.quiet_hours = parse_quiet_hours(quiet_hours)
+        self.break_every_pages = break_every_pages
+        self.break_seconds = tuple(break_seconds)
+        self.state_file = Path(state_file) if state_file else None
+        self.clock = clock
+        self.sleep = sleep
+        self.now = now
+        self.prefetch_tasks = deque()
+        self.stats = {'idle_seconds': 0.0, 'prefetch_seconds': 0.0, 'quiet_hours_seconds': 0.0, 'waits': 0}
+        self._counts = None
+        self._pages_since_break = 0
+        self._kind_locks = {PAGE: threading.Lock(), SUBMISSION: threading.Lock()}
+        self._state_lock = threading.RLock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict, state_file: Optional[Path] = None, **kwargs) -> 'PacingPolicy':
+        settings = dict(DEFAULT_PACING)
+        for key, value in (parameters.get('pacing') or {}).items():
+            if key in DEFAULT_PACING:
+                settings[key] = value
+            else:
+                logger.warning(f"Ignoring unknown pacing setting '{key}', expected one of: {', '.join(DEFAULT_PACING)}")
+        return cls(state_file=state_file, **settings, **kwargs)
+
+    def schedule_prefetch(self, task: Callable[[], None]) -> None:
+        """Queues work to be done the next time the policy has to wait."""
+        self.prefetch_tasks.append(task)
+
+    def acquire(self, kind: str) -> bool:
+        """
+        Blocks until an action of the given kind is allowed.
+        Returns False, without waiting, if today's cap for that kind has been reached.
+        """
+        with self._kind_locks[kind]:
+            if self.exhausted(kind):
+                logger.info(f"Daily {kind} cap of {self.daily_caps[kind]} reached")
+                return False
+
+            self._wait_out_quiet_hours()
+            wait_time = self.buckets[kind].time_until_available()
+            if kind == PAGE and self.break_every_pages and self._pages_since_break >= self.break_every_pages:
+                wait_time = max(wait_time, random.uniform(*self.break_seconds))
+                self._pages_since_break = 0
+            if wait_time > 0:
+                logger.debug(f"Pacing {kind}: waiting {wait_time:.1f} seconds")
+                self._idle(wait_time)
+
+            self.buckets[kind].consume()
+            if kind == PAGE:
+                self._pages_since_break += 1
+            with self._state_lock:
+                self._load_counts()[kind] += 1
+                self._save_counts()
+            return True
+
+    def exhausted(self, kind: str) -> bool:
+        cap = self.daily_caps.get(kind)
+        with self._state_lock:
+            return cap is not None and self._load_counts()[kind] >= cap
+
+    def _idle(self, seconds: float, idle_stat: Optional[str] = 'idle_seconds') -> None:
+        """
+        Spends the given time running prefetch tasks first and sleeping for whatever is left, which
+        is added to idle_stat unless the caller accounts for the wait itself.
+        """
+        self._record('waits', 1)
+        deadline = self.clock() + seconds
+        while self.clock() < deadline:
+            try:
+                task = self.prefetch_tasks.popleft()
+            except IndexError:
+                break
+            started_at = self.clock()
+            try:
+                task()
+            except Exception as e:
+                logger.warning(f"Prefetch task failed: {e}")
+            self._record('prefetch_seconds', self.clock() - started_at)
+        remaining = deadline - self.clock()
+        if remaining > 0:
+            if idle_stat:
+                self._record(idle_stat, remaining)
+            self.sleep(remaining)
+
+    def _record(self, stat: str, value: float) -> None:
+        with self._state_lock:
+            self.stats[stat] += value
+
+    def _wait_out_quiet_hours(self) -> None:
+        if not self.quiet_hours:
+            return
+        start, end = self.quiet_hours
+        now = self.now()
+        current = now.time()
+        if start <= end:
+            in_quiet = start <= current < end
+        else:
+            in_quiet = current >= start or current < end
+        if not in_quiet:
+            return
+        resume_at = datetime.combine(now.date(), end)
+        if resume_at <= now:
+            resume_at += timedelta(days=1)
+        seconds = (resume_at - now).total_seconds()
+        logger.info(f"Quiet hours: pausing until {resume_at:%H:%M}")
+        self._record('quiet_hours_seconds', seconds)
+        self._idle(seconds, idle_stat=None)
+
+    def _today(self) -> str:
+        return self.now().strftime("%Y-%m-%d")
+
+    def _load_counts(self) -> dict:
+        today = self._today()
+        if self._counts is not None and self._counts['date'] == today:
+            return self._counts
+        counts = {'date': today, PAGE: 0, SUBMISSION: 0}
+        if self.state_file and self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                if saved.get('date') == today:
+                    counts.update({PAGE: saved.get(PAGE, 0), SUBMISSION: saved.get(SUBMISSION, 0)})
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Could not read pacing state {self.state_file}: {e}")
+        self._counts = counts
+        return counts
+
+    def _save_counts(self) -> None:
+        if not self.state_file:
+            return
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({**self._counts, 'stats': self.stats}, f, indent=4)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            logger.warning(f"Could not write pacing state {self.state_file}: {e}")
+
+    def report(self) -> str:
+        with self._state_lock:
+            counts = dict(self._load_counts())
+        return (f"Pacing: {counts[PAGE]} page loads and {counts[SUBMISSION]} submissions today, "
+                f"{self.stats['idle_seconds']:.0f}s idle, {self.stats['prefetch_seconds']:.0f}s spent on prefetch, "
+                f"{self.stats['quiet_hours_seconds']:.0f}s in quiet hours over {self.stats['waits']} waits")
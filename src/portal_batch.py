@@ -0,0 +1,121 @@
+import json
+import queue
+import statistics
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+from urllib.parse import urldefrag
+
+from loguru import logger
+
+from src.generic_applier import SUBMITTED
+
+ERROR = "error"
+
+
+@dataclass
+class PortalOutcome:
+    url: str
+    status: str
+    seconds: float
+    pages: int = 0
+    error: Optional[str] = None
+
+
+class PortalBatchRunner:
+    """
+    Applies to a stream of portal URLs on a bounded number of warm browsers.
+
+    URLs are read lazily, so a file with hundreds of links (or stdin) is never held in memory at
+    once. Blank lines, '#' comments, duplicates within the batch and URLs the ledger already has
+    are skipped. One worker thread per browser session takes URLs from a small queue, runs the
+    applier built by applier_factory(driver), and appends the outcome with its timing to
+    results_file (JSON lines). Submitted applications are recorded in the ledger; URLs that raised
+    or stopped before submitting are released again so the next batch retries them.
+    """
+
+    _DONE = object()
+
+    def __init__(self, session_pool, applier_factory: Callable[[object], object], ledger, results_file: Path,
+                 workers: Optional[int] = None):
+        self.session_pool = session_pool
+        self.applier_factory = applier_factory
+        self.ledger = ledger
+        self.results_file = Path(results_file)
+        self.workers = workers or session_pool.max_size
+        self.urls = queue.Queue(maxsize=self.workers * 2)
+        self.results = Counter()
+        self.durations: List[float] = []
+        self._lock = threading.Lock()
+
+    def run(self, urls: Iterable[str]) -> Counter:
+        started_at = time.monotonic()
+        threads = [threading.Thread(target=self._work, name=f"portal-worker-{index}") for index in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            seen = set()
+            for line in urls:
+                url = urldefrag(line.strip())[0]
+                if not url or url.startswith('#'):
+                    continue
+                if url in seen or not self.ledger.claim(url):
+                    logger.debug(f"Skipping already handled portal URL: {url}")
+                    self.results['skipped'] += 1
+                    continue
+                seen.add(url)
+                self.urls.put(url)
+        finally:
+            for _ in threads:
+                self.urls.put(self._DONE)
+            for thread in threads:
+                thread.join()
+        logger.info(self.summary(time.monotonic() - started_at))
+        return self.results
+
+    def summary(self, elapsed: float) -> str:
+        median = f", median {statistics.median(self.durations):.1f}s per URL" if self.durations else ""
+        return f"Portal batch finished in {elapsed:.0f}s: {dict(self.results)}{median}"
+
+    def _work(self) -> None:
+        while True:
+            url = self.urls.get()
+            if url is self._DONE:
+                return
+            outcome = self._apply(url)
+            logger.info(f"{outcome.status}: {url} ({outcome.seconds:.1f}s)")
+            with self._lock:
+                self.results[outcome.status] += 1
+                self.durations.append(outcome.seconds)
+                self._write(outcome)
+
+    def _apply(self, url: str) -> PortalOutcome:
+        started_at = time.monotonic()
+        try:
+            with self.session_pool.session() as driver:
+                applier = self.applier_factory(driver)
+                status = applier.apply(url)
+        except Exception as e:
+            self.ledger.release(url)
+            return PortalOutcome(url, ERROR, time.monotonic() - started_at, error=str(e))
+        outcome = PortalOutcome(url, status, time.monotonic() - started_at, pages=applier.pages_processed)
+        if status == SUBMITTED:
+            self.ledger.record(url, status, seconds=round(outcome.seconds, 1), pages=outcome.pages)
+        else:
+            # The unsubmitted form is lost when the session is reset, so the next batch tries again
+            self.ledger.release(url)
+        return outcome
+
+    def _write(self, outcome: PortalOutcome) -> None:
+        entry = {'time': datetime.now().isoformat(timespec='seconds'), **asdict(outcome),
+                 'seconds': round(outcome.seconds, 1)}
+        try:
+            self.results_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.results_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.error(f"Could not write portal outcome to {self.results_file}: {e}")
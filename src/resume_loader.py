@@ -0,0 +1,70 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+from loguru import logger
+
+from src.resume_projection import ResumeProjection, project_resume
+from src.resume_schema import validate_resume
+
+
+@dataclass(frozen=True)
+class LoadedResume:
+    """
+    One parse of plain_text_resume.yaml, shared by every consumer until the file changes.
+
+    text is the YAML as written (lib_resume_builder_AIHawk's Resume parses it itself), data the
+    parsed mapping, which consumers must not modify, digest the SHA-256 of the file and errors
+    its violations of assets/resume_schema.yaml.
+    """
+    path: Path
+    text: str
+    data: Dict[str, Any]
+    digest: str
+    errors: Tuple[str, ...]
+    projection: ResumeProjection
+
+
+_cache: Dict[str, Tuple[Tuple[int, int], LoadedResume]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_resume(path) -> LoadedResume:
+    """
+    Returns the parsed and validated resume at path, read again only when its mtime or size
+    changed and parsed again only when its content did.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        cached = _cache.get(str(path))
+        if cached and cached[0] == signature:
+            return cached[1]
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if cached and cached[1].digest == digest:
+            _cache[str(path)] = (signature, cached[1])
+            return cached[1]
+        resume = _parse(path, raw, digest)
+        _cache[str(path)] = (signature, resume)
+    return resume
+
+
+def _parse(path: Path, raw: bytes, digest: str) -> LoadedResume:
+    text = raw.decode("utf-8")
+    try:
+        # An empty file is an empty resume, as it was before the shared loader
+        data = yaml.safe_load(text) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"{path} is not valid YAML: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a YAML mapping of resume sections.")
+    errors = tuple(validate_resume(data))
+    for error in errors:
+        logger.warning(f"{path.name} does not match the resume schema: {error}")
+    logger.debug(f"Loaded {path.name} ({len(errors)} schema violations)")
+    return LoadedResume(path, text, data, digest, errors, project_resume(data))
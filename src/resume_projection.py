@@ -0,0 +1,182 @@
+import re
+from dataclasses import dataclass
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# The phrases a form may use for a catalog key. A personal_information key's own last part ("email",
+# "zip code") always matches, so only the phrasings that differ from it are listed. Other keys match
+# only the phrases listed here: a bare "Location", "Start date" or "Company" is ambiguous between
+# the candidate and one of their jobs, schools or projects and is left to the LLM.
+SYNONYMS = {
+    "personal_information.full_name": ("full name", "name", "your name", "legal name", "full legal name"),
+    "personal_information.name": ("first name", "given name", "firstname", "fname", "preferred name"),
+    "personal_information.surname": ("last name", "family name", "lastname", "lname"),
+    "personal_information.email": ("email address", "e mail", "e mail address", "your email"),
+    # LinkedIn and most ATS forms ask for the country code separately next to the phone number
+    "personal_information.phone": ("phone number", "mobile", "mobile number", "mobile phone number", "telephone",
+                                   "cell phone", "contact number"),
+    "personal_information.phone_formatted": ("international phone number", "phone number with country code",
+                                             "full phone number"),
+    "personal_information.phone_prefix": ("country code", "phone country code"),
+    "personal_information.zip_code": ("zip", "postal code", "postcode", "zip postal code"),
+    "personal_information.address": ("street address", "address line", "address line 1", "street"),
+    "personal_information.linkedin": ("linkedin profile", "linkedin url", "linkedin profile url"),
+    "personal_information.github": ("github profile", "github url"),
+    "personal_information.city": ("current city", "town", "location", "current location"),
+    "personal_information.country": ("country of residence", "current country"),
+    "experience.current_title": ("current title", "job title", "current job title", "current position"),
+    "experience.current_company": ("current company", "current employer", "employer", "company name"),
+    "experience.years": ("years of experience", "total years of experience", "years of work experience"),
+    "education.institution": ("school", "university", "college", "school name"),
+    "education.field_of_study": ("major", "discipline", "field of study", "area of study"),
+    "education.education_level": ("degree", "highest degree", "level of education", "education level"),
+    "education.year_of_completion": ("graduation year", "year of graduation"),
+    "availability.notice_period": ("notice period", "availability"),
+    "salary_expectations.salary_range_usd": ("salary expectations", "desired salary", "expected salary"),
+    "skills": ("skills", "key skills"),
+}
+
+_PRESENT = ("present", "current", "now", "today")
+
+
+@dataclass(frozen=True)
+class ResumeProjection:
+    """
+    A flat catalog of every form-fillable fact in plain_text_resume.yaml.
+
+    fields maps dotted keys to values: every scalar of every section (education.1.institution,
+    experience.2.position, ...), the most recent entry again without its index (education.*,
+    experience.*, project.*, the keys forms were mapped to so far) and derived values such as
+    personal_information.full_name, experience.years and experience.current_title. match() finds
+    the key for a form field by its label, name or placeholder without asking the LLM; only
+    personal information and the phrases in SYNONYMS are matched.
+    """
+
+    fields: Mapping[str, Any]
+    phrases: Mapping[str, str]
+
+    def match(self, field: dict) -> Optional[str]:
+        """Returns the catalog key for a harvested form field, or None if no phrase matches exactly."""
+        for attribute in ("label", "name", "placeholder"):
+            key = self.phrases.get(normalize_phrase(field.get(attribute)))
+            if key is not None:
+                return key
+        return None
+
+    def answer(self, question: str) -> Optional[str]:
+        """Returns the value for a question that is exactly a known phrase ("Mobile phone number")."""
+        key = self.phrases.get(normalize_phrase(question))
+        return None if key is None else str(self.fields[key])
+
+
+def normalize_phrase(text) -> str:
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", str(text or "").lower()).split())
+
+
+def _scalars(prefix: str, data: dict) -> Iterable[Tuple[str, Any]]:
+    for key, value in (data or {}).items():
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool) and str(value).strip():
+            yield f"{prefix}.{key}", value
+
+
+def _months(text: str, today: date) -> Optional[int]:
+    if text.strip().lower() in _PRESENT:
+        return today.year * 12 + today.month - 1
+    found = re.search(r"(?:(\d{1,2})\s*/\s*)?(\d{4})", text)
+    if not found:
+        return None
+    month = int(found.group(1)) if found.group(1) else 1
+    return int(found.group(2)) * 12 + min(max(month, 1), 12) - 1
+
+
+def _period(employment_period, today: date) -> Optional[Tuple[int, int, bool]]:
+    parts = re.split(r"\s+[-–—]\s+|\s+to\s+", str(employment_period or ""), maxsplit=1)
+    if len(parts) != 2:
+        return None
+    start, end = _months(parts[0], today), _months(parts[1], today)
+    if start is None or end is None or end < start:
+        return None
+    return start, end, parts[1].strip().lower() in _PRESENT
+
+
+def years_of_experience(experiences: List[dict], today: Optional[date] = None) -> Optional[int]:
+    """Whole years covered by the employment periods, overlapping jobs counted once."""
+    today = today or date.today()
+    periods = sorted(filter(None, (_period(exp.get("employment_period"), today) for exp in experiences)))
+    if not periods:
+        return None
+    months, current_start, current_end = 0, periods[0][0], periods[0][1]
+    for start, end, _ in periods[1:]:
+        if start > current_end + 1:
+            months += current_end - current_start + 1
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    months += current_end - current_start + 1
+    return months // 12
+
+
+def project_resume(resume_data: dict, today: Optional[date] = None) -> ResumeProjection:
+    """Builds the field catalog of a parsed plain_text_resume.yaml."""
+    resume_data = resume_data or {}
+    today = today or date.today()
+    fields: Dict[str, Any] = {}
+
+    personal = resume_data.get("personal_information") or {}
+    fields.update(_scalars("personal_information", personal))
+    full_name = " ".join(str(personal[key]).strip() for key in ("name", "surname") if personal.get(key))
+    if full_name:
+        fields["personal_information.full_name"] = full_name
+    if personal.get("phone"):
+        fields["personal_information.phone_formatted"] = f"{personal.get('phone_prefix') or ''} {personal['phone']}".strip()
+
+    lists = (("education", "education_details"), ("experience", "experience_details"), ("project", "projects"),
+             ("achievement", "achievements"), ("language", "languages"))
+    for prefix, section in lists:
+        entries = [entry for entry in resume_data.get(section) or [] if isinstance(entry, dict)]
+        for index, entry in enumerate(entries):
+            fields.update(_scalars(f"{prefix}.{index}", entry))
+        if entries and prefix in ("education", "experience", "project"):
+            fields.update(_scalars(prefix, entries[0]))
+
+    experiences = [exp for exp in resume_data.get("experience_details") or [] if isinstance(exp, dict)]
+    if experiences:
+        ongoing = [exp for exp in experiences if (_period(exp.get("employment_period"), today) or (0, 0, False))[2]]
+        current = ongoing[0] if ongoing else experiences[0]
+        if current.get("position"):
+            fields["experience.current_title"] = current["position"]
+        if current.get("company"):
+            fields["experience.current_company"] = current["company"]
+        years = years_of_experience(experiences, today)
+        if years is not None:
+            fields["experience.years"] = years
+        skills = list(dict.fromkeys(skill for exp in experiences for skill in exp.get("skills_acquired") or []))
+        if skills:
+            fields["skills"] = ", ".join(skills)
+
+    if resume_data.get("languages"):
+        fields["languages"] = ", ".join(l.get("language", "") for l in resume_data["languages"] if isinstance(l, dict))
+    if resume_data.get("interests"):
+        fields["interests"] = ", ".join(str(interest) for interest in resume_data["interests"])
+
+    for section, value in resume_data.items():
+        if section != "personal_information" and isinstance(value, dict):
+            fields.update(_scalars(section, value))
+
+    phrases: Dict[str, str] = {}
+    for key in fields:
+        if key.startswith("personal_information."):
+            phrases.setdefault(normalize_phrase(key.rsplit(".", 1)[-1]), key)
+    for key, synonyms in SYNONYMS.items():
+        if key in fields:
+            for phrase in synonyms:
+                phrases[normalize_phrase(phrase)] = key
+    return ResumeProjection(MappingProxyType(fields), MappingProxyType(phrases))
+
+
+def load_resume_projection(path) -> ResumeProjection:
+    """Returns the projection of a resume YAML file from the shared resume loader's cache."""
+    from src.resume_loader import load_resume
+
+    return load_resume(path).projection
@@ -0,0 +1,34 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+from jsonschema import Draft7Validator
+
+RESUME_SCHEMA_PATH = Path(__file__).resolve().parent.parent / "assets" / "resume_schema.yaml"
+
+
+@lru_cache(maxsize=None)
+def load_resume_schema(path: str = str(RESUME_SCHEMA_PATH)) -> Dict[str, dict]:
+    """The schema fragment of every top-level resume section, keyed by section name."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@lru_cache(maxsize=None)
+def _resume_validator(path: str) -> Draft7Validator:
+    schema = {"type": "object", "properties": load_resume_schema(path)}
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
+
+def validate_resume(data: Any, path: str = str(RESUME_SCHEMA_PATH)) -> List[str]:
+    """
+    Schema violations of a parsed resume as "section.field: message" lines, checked by a validator
+    compiled once per schema file. Sections the schema does not know are not checked.
+    """
+    errors = []
+    for error in sorted(_resume_validator(path).iter_errors(data), key=lambda e: list(map(str, e.absolute_path))):
+        location = ".".join(str(part) for part in error.absolute_path) or "resume"
+        errors.append(f"{location}: {error.message}")
+    return errors
@@ -0,0 +1,112 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from loguru import logger
+
+
+class RunCheckpoint:
+    """
+    Progress of a sequential application run, rewritten atomically after every job.
+
+    It holds the search order of the run, the search and results page being worked on, the links
+    already handled on that page and the job whose application was in flight. A run started with
+    resume=True continues from there instead of reshuffling the searches and starting over. A job
+    that was in flight when the process died is retried once; if the retry dies as well it is skipped.
+    """
+
+    MAX_IN_FLIGHT_ATTEMPTS = 2
+
+    def __init__(self, path: Path, resume: bool = False):
+        self.path = Path(path)
+        self.resume = resume
+        self.state = None
+
+    def start(self, run_key: str, searches: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Returns the search order to work through, restoring the saved one when resuming a matching run."""
+        saved = self._load() if self.resume else None
+        if saved is not None and saved.get('run_key') != run_key:
+            logger.warning("Checkpoint was written for different searches or filters, starting a new run.")
+            saved = None
+        if saved is not None:
+            self.state = saved
+            logger.info(f"Resuming run from search {self.search_index + 1}/{len(saved['searches'])}, "
+                        f"page {self.page}, {len(saved['processed'])} jobs already handled on that page")
+        else:
+            self.state = {'run_key': run_key, 'searches': [list(search) for search in searches], 'search_index': 0,
+                          'page': 0, 'processed': [], 'in_flight': None}
+            self._save()
+        return [tuple(search) for search in self.state['searches']]
+
+    @property
+    def search_index(self) -> int:
+        return self.state['search_index']
+
+    @property
+    def page(self) -> int:
+        return self.state['page']
+
+    def search_started(self, index: int) -> None:
+        if index != self.state['search_index']:
+            self.state.update(search_index=index, page=0, processed=[])
+            self._save()
+
+    def page_done(self, page: int) -> None:
+        self.state.update(page=page + 1, processed=[])
+        self._save()
+
+    def job_started(self, job) -> None:
+        in_flight = self.state['in_flight']
+        attempts = in_flight['attempts'] + 1 if in_flight and in_flight['link'] == job.link else 1
+        self.state['in_flight'] = {'link': job.link, 'title': job.title, 'company': job.company, 'attempts': attempts}
+        self._save()
+
+    def job_done(self, link: str) -> None:
+        self.state['processed'].append(link)
+        in_flight = self.state['in_flight']
+        if in_flight and in_flight['link'] == link:
+            self.state['in_flight'] = None
+        self._save()
+
+    def should_skip(self, link: str) -> bool:
+        """True for jobs handled before the restart, and for an in-flight job that already crashed the run twice."""
+        if link in self.state['processed']:
+            return True
+        in_flight = self.state['in_flight']
+        if in_flight and in_flight['link'] == link and in_flight['attempts'] >= self.MAX_IN_FLIGHT_ATTEMPTS:
+            logger.warning(f"Skipping {in_flight['title']} at {in_flight['company']}: "
+                           f"the run stopped while applying to it {in_flight['attempts']} times")
+            return True
+        return False
+
+    def finish(self) -> None:
+        """Removes the checkpoint once every search has been worked through."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load(self) -> Optional[dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            logger.info("No run checkpoint found, starting a new run.")
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read run checkpoint {self.path}, starting a new run: {e}")
+        return None
+
+    def _save(self) -> None:
+        self.state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write run checkpoint {self.path}: {e}")
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from loguru import logger
+
+PENDING = 'pending'
+CLAIMED = 'claimed'
+DONE = 'done'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS shards (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    plan TEXT NOT NULL,
+    position TEXT NOT NULL,
+    location TEXT NOT NULL,
+    page_start INTEGER NOT NULL,
+    page_end INTEGER,
+    filters TEXT NOT NULL,
+    priority REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    next_page INTEGER NOT NULL,
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL,
+    UNIQUE (plan, position, location, page_start, filters)
+);
+CREATE INDEX IF NOT EXISTS shards_claimable ON shards (plan, status, priority);
+"""
+
+
+@dataclass
+class Shard:
+    id: int
+    plan: str
+    position: str
+    location: str
+    page_start: int
+    page_end: Optional[int]
+    filters: str
+    next_page: int
+    attempts: int
+
+
+def default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def plan_name_for(positions: Iterable[str], locations: Iterable[str], filters: str, run: str = "") -> str:
+    """
+    Names a plan after its searches, filters and run key, so identically configured processes of the
+    same run share it and a new run gets fresh shards instead of the finished ones.
+    """
+    key = json.dumps([sorted(positions), sorted(locations), filters, run])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+class SearchPlan:
+    """
+    Shared queue of search work units backed by a SQLite file.
+
+    A unit (shard) is one search (position, location, filters) over a page range. Any number of
+    processes, or hosts mounting the file on a filesystem with working POSIX locks, can claim shards:
+    claims are leases written inside an immediate transaction, so no two owners hold the same shard,
+    and a lease that is not renewed (the owner crashed) expires and the shard is picked up again
+    from the last page its owner reported.
+    """
+
+    def __init__(self, path: Path, lease_seconds: float = 7200, max_attempts: int = 3, owner: Optional[str] = None):
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.owner = owner
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _owner(self) -> str:
+        return self.owner or default_owner()
+
+    def add_searches(self, plan: str, positions, locations, filters: str, pages_per_shard: Optional[int] = None,
+                     max_pages: Optional[int] = None) -> int:
+        """
+        Adds one shard per search and page range. Safe to call from every process at start-up:
+        shards that already exist are left untouched. Returns the number of shards added.
+        """
+        if pages_per_shard is not None and max_pages is None:
+            raise ValueError("max_pages is required when splitting searches into page ranges.")
+        ranges = [(0, max_pages)]
+        if pages_per_shard:
+            ranges = [(start, min(start + pages_per_shard, max_pages)) for start in range(0, max_pages, pages_per_shard)]
+        rows = [(plan, position, location, start, end, filters, random.random(), PENDING, start)
+                for position in positions for location in locations for start, end in ranges]
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO shards (plan, position, location, page_start, page_end, filters, priority, "
+                "status, next_page) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            added = connection.total_changes - before
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+        logger.debug(f"Search plan {plan}: {added} new shards, {len(rows) - added} already present")
+        return added
+
+    def claim(self, plan: str) -> Optional[Shard]:
+        """Leases the next pending or abandoned shard of the plan, or returns None when none is left."""
+        now = time.time()
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT * FROM shards WHERE plan = ? AND attempts < ? AND "
+                "(status = ? OR (status = ? AND lease_expires < ?)) ORDER BY priority LIMIT 1",
+                (plan, self.max_attempts, PENDING, CLAIMED, now)).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            if row['status'] == CLAIMED:
+                logger.warning(f"Reclaiming shard {row['id']} abandoned by {row['owner']}")
+            connection.execute(
+                "UPDATE shards SET status = ?, owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ?", (CLAIMED, self._owner(), now + self.lease_seconds, now, row['id']))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+        return Shard(row['id'], row['plan'], row['position'], row['location'], row['page_start'], row['page_end'],
+                     row['filters'], row['next_page'], row['attempts'] + 1)
+
+    def record_progress(self, shard: Shard, next_page: int) -> None:
+        """Stores the page to resume from and renews the lease."""
+        shard.next_page = next_page
+        self._update(shard, "next_page = ?, lease_expires = ?", (next_page, time.time() + self.lease_seconds))
+
+    def complete(self, shard: Shard) -> None:
+        self._update(shard, "status = ?, lease_expires = NULL", (DONE,))
+
+    def release(self, shard: Shard) -> None:
+        """Hands a shard back unfinished (e.g. a daily cap was hit) without counting it as an attempt."""
+        self._update(shard, "status = ?, owner = NULL, lease_expires = NULL, attempts = attempts - 1", (PENDING,))
+
+    def fail(self, shard: Shard) -> None:
+        status = FAILED if shard.attempts >= self.max_attempts else PENDING
+        self._update(shard, "status = ?, owner = NULL, lease_expires = NULL", (status,))
+
+    def _update(self, shard: Shard, assignments: str, values: tuple) -> None:
+        with closing(self._connect()) as connection:
+            updated = connection.execute(
+                f"UPDATE shards SET {assignments}, updated_at = ? WHERE id = ? AND owner = ?",
+                (*values, time.time(), shard.id, self._owner())).rowcount
+        if not updated:
+            logger.warning(f"Shard {shard.id} is no longer owned by {self._owner()}; its lease probably expired")
+
+    def counts(self, plan: str) -> dict:
+        with closing(self._connect()) as connection:
+            rows = connection.execute("SELECT status, COUNT(*) FROM shards WHERE plan = ? GROUP BY status", (plan,))
+            return {status: count for status, count in rows}
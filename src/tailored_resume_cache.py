@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from loguru import logger
+
+from app_config import GENERATED_CV_MAX_MB, TAILORED_RESUME_MAX_DISTANCE
+from src.document_store import DocumentStore
+
+# Descriptions shorter than this are too generic to tell roles apart, so they are never shared
+MIN_DESCRIPTION_WORDS = 30
+SHINGLE_SIZE = 2
+INDEX_FILE = "tailored_resumes.json"
+RESUME_PREFIX = "CV"
+
+# generated_cv/ and its index are shared by every applier in a worker pool
+_index_lock = threading.Lock()
+
+
+def description_words(text: str) -> List[str]:
+    """Lower-cased words of a job description without links, numbers and punctuation."""
+    text = re.sub(r"https?://\S+|\S+@\S+", " ", (text or "").lower())
+    return re.findall(r"[a-z][a-z+#]+", text)
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash over word bigrams; None for descriptions too short to fingerprint."""
+    words = description_words(text)
+    if len(words) < MIN_DESCRIPTION_WORDS:
+        return None
+    weights = [0] * 64
+    for index in range(len(words) - SHINGLE_SIZE + 1):
+        shingle = " ".join(words[index:index + SHINGLE_SIZE]).encode("utf-8")
+        value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class TailoredResumeCache:
+    """
+    Reuses tailored resume PDFs for job descriptions that are nearly the same.
+
+    Reposts and the same role advertised in several cities differ in a few words, so their SimHash
+    fingerprints differ in at most max_distance of 64 bits and the PDF generated for the first one
+    is uploaded again. variant identifies the base resume: PDFs made from another version of
+    plain_text_resume.yaml never match. After every new PDF the least recently used tailored resumes
+    are deleted until they take less than max_bytes; other files in the folder are never touched.
+    """
+
+    def __init__(self, folder="generated_cv", variant: str = "", max_distance: int = TAILORED_RESUME_MAX_DISTANCE,
+                 max_bytes: int = GENERATED_CV_MAX_MB * 1024 * 1024, documents: Optional[DocumentStore] = None):
+        self.folder = Path(folder)
+        self.documents = documents or DocumentStore(self.folder)
+        self.variant = variant
+        self.max_distance = max_distance
+        self.max_bytes = max_bytes
+        self.index_path = self.folder / INDEX_FILE
+
+    def lookup(self, description: str) -> Optional[Path]:
+        """Returns the PDF generated for the closest similar description, or None."""
+        fingerprint = simhash(description)
+        if fingerprint is None:
+            return None
+        with _index_lock:
+            entries = self._load()
+            candidates = [(hamming_distance(fingerprint, int(entry["fingerprint"], 16)), entry) for entry in entries
+                          if entry.get("variant") == self.variant and (self.folder / entry["file"]).exists()]
+            candidates = [candidate for candidate in candidates if candidate[0] <= self.max_distance]
+            if not candidates:
+                return None
+            distance, entry = min(candidates, key=lambda candidate: candidate[0])
+            entry["last_used"] = time.time()
+            self._save(entries)
+        logger.info(f"Reusing tailored resume {entry['file']} (SimHash distance {distance})")
+        return self.folder / entry["file"]
+
+    def store(self, description: str, pdf: bytes, prefix: str = RESUME_PREFIX) -> Path:
+        """Writes the PDF and remembers it for similar descriptions. Returns its path."""
+        fingerprint = simhash(description)
+        path = self.documents.put(pdf, prefix)
+        with _index_lock:
+            entries = [entry for entry in self._load() if entry["file"] != path.name]
+            if fingerprint is not None:
+                entries.append({"fingerprint": f"{fingerprint:016x}", "variant": self.variant, "file": path.name,
+                                "size": len(pdf), "last_used": time.time()})
+            entries = self._evict(entries, keep=path)
+            self._save(entries)
+        return path
+
+    def get_or_create(self, description: str, generate: Callable[[], bytes], prefix: str = RESUME_PREFIX) -> Path:
+        return self.lookup(description) or self.store(description, generate(), prefix)
+
+    def _evict(self, entries: List[dict], keep: Path) -> List[dict]:
+        # Only resumes this cache wrote are counted and deleted; cover letters and user files are left alone
+        last_used = {entry["file"]: entry["last_used"] for entry in entries}
+        names = set(last_used) | {path.name for path in self.folder.glob(f"{RESUME_PREFIX}_*.pdf")}
+        files = [self.folder / name for name in names if (self.folder / name).is_file()]
+        total = sum(path.stat().st_size for path in files)
+        for path in sorted(files, key=lambda path: last_used.get(path.name, path.stat().st_mtime)):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            size = path.stat().st_size
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Could not evict {path}: {e}")
+                continue
+            total -= size
+            logger.debug(f"Evicted {path.name} from {self.folder}")
+        return [entry for entry in entries if (self.folder / entry["file"]).exists()]
+
+    def _load(self) -> List[dict]:
+        if not self.index_path.exists():
+            return []
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("entries", [])
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable tailored resume index {self.index_path}: {e}")
+            return []
+
+    def _save(self, entries: List[dict]) -> None:
+        try:
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": entries}, f, indent=4)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not write tailored resume index {self.index_path}: {e}")
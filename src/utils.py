@@ -4,7 +4,6 @@ import random
 import sys
 import time
 
-from selenium import webdriver
 from loguru import logger
 
 from app_config import MINIMUM_LOG_LEVEL
@@ -22,16 +21,35 @@ else:
 
 chromeProfilePath = os.path.join(os.getcwd(), "chrome_profile", "linkedin_profile")
 
-def ensure_chrome_profile():
-    logger.debug(f"Ensuring Chrome profile exists at path: {chromeProfilePath}")
-    profile_dir = os.path.dirname(chromeProfilePath)
+# Requests dropped in fast mode: nothing the bot reads or clicks depends on them
+FAST_MODE_BLOCKED_URLS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*ads.linkedin.com*", "*px.ads.linkedin.com*", "*snap.licdn.com*",
+    "*linkedin.com/li/track*", "*linkedin.com/sensorCollect*", "*bing.com/bat*", "*hotjar.com*",
+]
+FAST_MODE_WINDOW_SIZE = "1280,800"
+
+def ensure_chrome_profile(profile_path=chromeProfilePath):
+    logger.debug(f"Ensuring Chrome profile exists at path: {profile_path}")
+    profile_dir = os.path.dirname(profile_path)
     if not os.path.exists(profile_dir):
         os.makedirs(profile_dir)
         logger.debug(f"Created directory for Chrome profile: {profile_dir}")
-    if not os.path.exists(chromeProfilePath):
-        os.makedirs(chromeProfilePath)
-        logger.debug(f"Created Chrome profile directory: {chromeProfilePath}")
-    return chromeProfilePath
+    if not os.path.exists(profile_path):
+        os.makedirs(profile_path)
+        logger.debug(f"Created Chrome profile directory: {profile_path}")
+    return profile_path
+
+
+def derived_profile_path(name):
+    """
+    Returns a profile path for a browser that runs alongside the main one. Chrome locks the whole
+    user data dir, so the derived profile gets its own sibling user data dir.
+    """
+    user_data_dir = os.path.dirname(chromeProfilePath)
+    return os.path.join(f"{user_data_dir}_{name}", os.path.basename(chromeProfilePath))
 
 
 def is_scrollable(element):
@@ -111,11 +129,22 @@ def scroll_slow(driver, scrollable_element, start=0, end=3600, step=300, reverse
         logger.error(f"Exception occurred during scrolling: {e}")
 
 
-def chrome_browser_options():
-    logger.debug("Setting Chrome browser options")
-    ensure_chrome_profile()
+def chrome_browser_options(profile_path=chromeProfilePath, fast=False):
+    """
+    Chrome options for the bot. fast=True runs headless with a small fixed viewport; pair it with
+    enable_fast_mode once the driver is started so fonts, media and trackers are not downloaded.
+    """
+    from selenium import webdriver
+
+    logger.debug(f"Setting Chrome browser options (fast mode: {fast})")
+    ensure_chrome_profile(profile_path)
     options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")
+    if fast:
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={FAST_MODE_WINDOW_SIZE}")
+        options.add_argument("--mute-audio")
+    else:
+        options.add_argument("--start-maximized")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--ignore-certificate-errors")
@@ -134,6 +163,9 @@ def chrome_browser_options():
     options.add_argument("--disable-animations")
     options.add_argument("--disable-cache")
     options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+    # Network events feed the network-idle check in src/wait_policy.py
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
 
     prefs = {
         "profile.default_content_setting_values.images": 2,
@@ -141,12 +173,12 @@ def chrome_browser_options():
     }
     options.add_experimental_option("prefs", prefs)
 
-    if len(chromeProfilePath) > 0:
-        initial_path = os.path.dirname(chromeProfilePath)
-        profile_dir = os.path.basename(chromeProfilePath)
+    if len(profile_path) > 0:
+        initial_path = os.path.dirname(profile_path)
+        profile_dir = os.path.basename(profile_path)
         options.add_argument('--user-data-dir=' + initial_path)
         options.add_argument("--profile-directory=" + profile_dir)
-        logger.debug(f"Using Chrome profile directory: {chromeProfilePath}")
+        logger.debug(f"Using Chrome profile directory: {profile_path}")
     else:
         options.add_argument("--incognito")
         logger.debug("Using Chrome in incognito mode")
@@ -154,6 +186,18 @@ def chrome_browser_options():
     return options
 
 
+def enable_fast_mode(driver):
+    """Blocks FAST_MODE_BLOCKED_URLS and bypasses service workers for every request of the session, via CDP."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": FAST_MODE_BLOCKED_URLS})
+        driver.execute_cdp_cmd("Network.setBypassServiceWorker", {"bypass": True})
+        logger.debug(f"Fast mode enabled, blocking {len(FAST_MODE_BLOCKED_URLS)} URL patterns")
+    except Exception as e:
+        logger.warning(f"Could not enable fast mode request blocking: {e}")
+    return driver
+
+
 def printred(text):
     red = "\033[91m"
     reset = "\033[0m"
@@ -168,5 +212,7 @@ def printyellow(text):
     print(f"{yellow}{text}{reset}")
 
 def stringWidth(text, font, font_size):
-    bbox = font.getbbox(text)
-    return bbox[2] - bbox[0]
\ No newline at end of file
+    """Width in points of text set in one of ReportLab's fonts, given by name (e.g. "Helvetica")."""
+    from reportlab.pdfbase import pdfmetrics
+
+    return pdfmetrics.stringWidth(text, font, font_size)
\ No newline at end of file
@@ -0,0 +1,207 @@
+import json
+import random
+import time
+from typing import Any, Optional, Tuple, Union
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from app_config import MINIMUM_HUMAN_DELAY, MAXIMUM_HUMAN_DELAY, READINESS_TIMEOUT
+from loguru import logger
+
+# Resolves with true once no childList/characterData mutation has been seen for quietMs,
+# or with false once timeoutMs has elapsed. Attribute mutations are ignored on purpose:
+# spinners and CSS animations keep toggling classes long after the content is usable.
+DOM_QUIET_SCRIPT = """
+const quietMs = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+let quietTimer = null;
+let hardTimer = null;
+const root = document.documentElement || document;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quietMs);
+});
+function finish(quiet) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(hardTimer);
+    done(quiet);
+}
+observer.observe(root, {subtree: true, childList: true, characterData: true});
+quietTimer = setTimeout(() => finish(true), quietMs);
+hardTimer = setTimeout(() => finish(false), timeoutMs);
+"""
+
+RESOURCE_COUNT_SCRIPT = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+ELEMENT_STATES = {
+    'present': EC.presence_of_element_located,
+    'visible': EC.visibility_of_element_located,
+    'clickable': EC.element_to_be_clickable,
+    'invisible': EC.invisibility_of_element_located,
+}
+
+
+class WaitPolicy:
+    """
+    Waits on concrete readiness signals instead of fixed sleeps.
+
+    Every public wait finishes with a human-like pause that is counted from the moment
+    the wait started, so a slow page never pays the delay twice.
+
+    Reading the performance log consumes it, so every component driving the same browser
+    must share one policy; otherwise they take each other's network events.
+    """
+
+    def __init__(self, driver: Any, min_delay: float = MINIMUM_HUMAN_DELAY, max_delay: float = MAXIMUM_HUMAN_DELAY,
+                 timeout: float = READINESS_TIMEOUT, quiet_period: float = 0.3, poll_interval: float = 0.1,
+                 max_request_age: float = 5.0):
+        if min_delay < 0 or max_delay < min_delay:
+            raise ValueError("Human delay bounds must satisfy 0 <= min_delay <= max_delay.")
+        self.driver = driver
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+        self.max_request_age = max_request_age
+        self._inflight_requests = {}
+        self._performance_log_available = True
+
+    def pause(self, started_at: Optional[float] = None) -> None:
+        """Sleeps for the remainder of a random human-like delay measured from started_at."""
+        delay = random.uniform(self.min_delay, self.max_delay)
+        if started_at is not None:
+            delay -= time.monotonic() - started_at
+        if delay > 0:
+            logger.debug(f"Human-like pause for {delay:.2f} seconds")
+            time.sleep(delay)
+
+    def page_ready(self, timeout: Optional[float] = None) -> bool:
+        """Waits for document load, network idle and DOM quiescence after a navigation."""
+        started_at = time.monotonic()
+        timeout = self.timeout if timeout is None else timeout
+        deadline = started_at + timeout
+        ready = self.wait_for_network_idle(timeout=timeout)
+        ready = self.wait_for_dom_quiet(timeout=max(0.0, deadline - time.monotonic())) and ready
+        logger.debug(f"Page ready={ready} after {time.monotonic() - started_at:.2f} seconds")
+        self.pause(started_at)
+        return ready
+
+    def dom_settled(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the DOM to stop changing after an in-page interaction (click, upload, expand)."""
+        started_at = time.monotonic()
+        settled = self.wait_for_dom_quiet(timeout=timeout)
+        self.pause(started_at)
+        return settled
+
+    def element_ready(self, target: Union[WebElement, Tuple[str, str]], state: str = 'clickable',
+                      timeout: Optional[float] = None):
+        """
+        Waits until target reaches state ('present', 'visible', 'clickable' or 'invisible').
+        target is either a located WebElement or a (By, value) locator.
+        """
+        if state not in ELEMENT_STATES:
+            raise ValueError(f"Unknown element state: {state}")
+        started_at = time.monotonic()
+        timeout = self.timeout if timeout is None else timeout
+        if isinstance(target, WebElement):
+            if state == 'present':
+                self.pause(started_at)
+                return target
+            condition = {
+                'visible': EC.visibility_of,
+                'clickable': EC.element_to_be_clickable,
+                'invisible': EC.invisibility_of_element,
+            }[state](target)
+        else:
+            condition = ELEMENT_STATES[state](target)
+        result = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        self.pause(started_at)
+        return result
+
+    def wait_for_dom_quiet(self, timeout: Optional[float] = None) -> bool:
+        timeout = self.timeout if timeout is None else timeout
+        if timeout <= 0:
+            return False
+        try:
+            quiet = self.driver.execute_async_script(DOM_QUIET_SCRIPT, int(self.quiet_period * 1000),
+                                                     int(timeout * 1000))
+            return bool(quiet)
+        except WebDriverException as e:
+            logger.debug(f"DOM quiescence check unavailable: {e}")
+            return False
+
+    def wait_for_network_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the document is loaded and no request has been in flight for quiet_period.
+        In-flight requests are tracked from the CDP Network events in Chrome's performance log
+        when it is enabled; otherwise the resource timing buffer is polled until it stops growing.
+        Requests open for longer than max_request_age (long polling, streaming) are not waited on.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        idle_since = None
+        last_count = None
+        while time.monotonic() < deadline:
+            try:
+                ready_state, resource_count = self.driver.execute_script(RESOURCE_COUNT_SCRIPT)
+            except (WebDriverException, TypeError, ValueError) as e:
+                logger.debug(f"Network idle check unavailable: {e}")
+                return False
+
+            inflight = self._drain_performance_log()
+            if inflight is None:
+                busy = resource_count != last_count
+                last_count = resource_count
+            else:
+                busy = inflight > 0
+
+            now = time.monotonic()
+            if ready_state != 'complete' or busy:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = now
+            elif now - idle_since >= self.quiet_period:
+                return True
+            time.sleep(self.poll_interval)
+
+        logger.debug(f"Network did not go idle within {timeout} seconds")
+        return False
+
+    def _drain_performance_log(self) -> Optional[int]:
+        if not self._performance_log_available:
+            return None
+        try:
+            entries = list(self.driver.get_log('performance'))
+        except (WebDriverException, AttributeError, TypeError, ValueError):
+            logger.debug("Performance log not enabled, falling back to resource timing")
+            self._performance_log_available = False
+            return None
+
+        now = time.monotonic()
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get('method')
+            request_id = message.get('params', {}).get('requestId')
+            if method == 'Network.requestWillBeSent':
+                self._inflight_requests.setdefault(request_id, now)
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                self._inflight_requests.pop(request_id, None)
+        return sum(1 for seen_at in self._inflight_requests.values() if now - seen_at < self.max_request_age)
+
+    def reset_network_tracking(self) -> None:
+        """
+        Forgets every request seen so far, including events still queued in the performance log.
+        Call it right before navigating: requests the old page never finished must not hold up
+        the next page_ready.
+        """
+        self._drain_performance_log()
+        self._inflight_requests.clear()
@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional, Union
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class SearchTask:
+    position: str
+    location: str
+
+
+@dataclass(frozen=True)
+class JobLinkTask:
+    link: str
+
+
+@dataclass(frozen=True)
+class SearchPlanTask:
+    """Makes a worker claim shards from its job manager's shared search plan until none are left."""
+
+
+@dataclass
+class WorkerReport:
+    worker_id: int
+    tasks_done: int = 0
+    results: Counter = field(default_factory=Counter)
+    errors: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+@dataclass
+class PoolReport:
+    workers: List[WorkerReport] = field(default_factory=list)
+
+    @property
+    def results(self) -> Counter:
+        total = Counter()
+        for worker in self.workers:
+            total.update(worker.results)
+        return total
+
+    def summary(self) -> str:
+        lines = [f"Worker pool finished: {dict(self.results)}"]
+        for worker in self.workers:
+            lines.append(f"  worker {worker.worker_id}: {worker.tasks_done} tasks in {worker.elapsed:.0f}s, "
+                         f"{dict(worker.results)}, {len(worker.errors)} errors")
+        return "\n".join(lines)
+
+
+@dataclass
+class Worker:
+    """What a worker factory hands back: a ready job manager and how to tear its browser down."""
+    job_manager: object
+    close: Callable[[], None]
+
+
+class BrowserWorkerPool:
+    """
+    Runs searches or individual job links on N isolated browser workers.
+
+    Each worker thread builds its own browser and AIHawkJobManager through worker_factory (so every
+    worker has a separate Chrome profile and WebDriver session), then pulls tasks from a shared
+    queue until it is empty. Workers are expected to share an ApplicationLedger so a posting found
+    by several searches is only applied to once. A task that raises is logged and the worker moves on;
+    a worker whose browser cannot be started drops out and leaves its tasks to the others.
+    """
+
+    def __init__(self, worker_count: int, worker_factory: Callable[[int], Worker]):
+        if worker_count < 1:
+            raise ValueError("worker_count must be at least 1.")
+        self.worker_count = worker_count
+        self.worker_factory = worker_factory
+        self.tasks = queue.Queue()
+        self.stop_event = threading.Event()
+
+    def run(self, tasks: Iterable[Union[SearchTask, JobLinkTask, SearchPlanTask]]) -> PoolReport:
+        for task in tasks:
+            self.tasks.put(task)
+        reports = [WorkerReport(worker_id) for worker_id in range(self.worker_count)]
+        threads = [threading.Thread(target=self._work, args=(report,), name=f"browser-worker-{report.worker_id}")
+                   for report in reports]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pool_report = PoolReport(reports)
+        logger.info(pool_report.summary())
+        return pool_report
+
+    def _work(self, report: WorkerReport) -> None:
+        started_at = time.monotonic()
+        worker: Optional[Worker] = None
+        try:
+            worker = self.worker_factory(report.worker_id)
+        except Exception as e:
+            logger.error(f"Worker {report.worker_id} failed to start: {e}")
+            report.errors.append(f"startup: {e}")
+            return
+
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    task = self.tasks.get_nowait()
+                except queue.Empty:
+                    break
+                logger.debug(f"Worker {report.worker_id} picked up {task}")
+                try:
+                    if not self._run_task(worker.job_manager, task):
+                        logger.info(f"Worker {report.worker_id} reached its daily cap, stopping")
+                        break
+                except Exception as e:
+                    logger.error(f"Worker {report.worker_id} failed on {task}: {e}")
+                    report.errors.append(f"{task}: {e}")
+                report.tasks_done += 1
+        finally:
+            report.results.update(getattr(worker.job_manager, 'results', Counter()))
+            report.elapsed = time.monotonic() - started_at
+            try:
+                worker.close()
+            except Exception as e:
+                logger.debug(f"Worker {report.worker_id} failed to close its browser: {e}")
+
+    @staticmethod
+    def _run_task(job_manager, task) -> bool:
+        if isinstance(task, SearchTask):
+            return job_manager.apply_search(task.position, task.location)
+        if isinstance(task, JobLinkTask):
+            return job_manager.apply_to_link(task.link)
+        if isinstance(task, SearchPlanTask):
+            return job_manager.apply_search_plan()
+        raise TypeError(f"Unknown task type: {type(task).__name__}")
@@ -95,3 +95,11 @@ def test_check_for_premium_redirect_with_redirect(mocker, easy_applier):
 
     # Verify that it attempted to return to the job page 3 times
     assert easy_applier.driver.get.call_count == 3
+
+
+def test_enter_text_raises_when_the_field_stays_empty(easy_applier, mocker):
+    """Test that a field the form filler could not fill is reported instead of silently skipped."""
+    mocker.patch.object(easy_applier.form_filler, 'fill_one', return_value=False)
+
+    with pytest.raises(Exception, match="Could not enter text"):
+        easy_applier._enter_text(mocker.Mock(), "Kabul")
@@ -166,3 +166,67 @@ def test_apply_jobs_with_jobs(mocker, job_manager):
     # Called for each job element
     assert job_manager.easy_applier_component.job_apply.call_count == 2
     mock_open.assert_called()  # Ensure that the open function was called
+
+
+def test_apply_to_link_filters_by_the_posting(mocker, job_manager):
+    """Test that a job applied to by URL is checked against the blacklists using its posting's details."""
+    mocker.patch.object(job_manager, 'prepare_applier')
+    write_to_file = mocker.patch.object(job_manager, 'write_to_file')
+    apply = mocker.patch.object(job_manager, 'apply_to_filtered_job', return_value=True)
+    mocker.patch.object(job_manager, 'wait_policy')
+    job_manager.title_blacklist, job_manager.company_blacklist = [], ['Acme']
+    job_manager.seen_jobs, job_manager.apply_once_at_company = [], False
+    job_manager.driver.execute_script.return_value = ["Data Analyst", "Acme", "Kabul"]
+
+    assert job_manager.apply_to_link("https://www.linkedin.com/jobs/view/1")
+
+    apply.assert_not_called()
+    job = write_to_file.call_args.args[0]
+    assert (job.title, job.company, job.location) == ("Data Analyst", "Acme", "Kabul")
+    assert write_to_file.call_args.args[1] == "skipped"
+
+    job_manager.company_blacklist = []
+    job_manager.apply_to_link("https://www.linkedin.com/jobs/view/1")
+    assert apply.call_args.args[0].company == "Acme"
+
+
+def test_run_end_closes_the_document_prefetcher(mocker, job_manager):
+    """Test that the prefetch threads are stopped when a run ends, also when it fails."""
+    prefetcher = mocker.Mock()
+    job_manager.easy_applier_component = mocker.Mock(prefetcher=prefetcher)
+    mocker.patch.object(job_manager, '_start_applying', side_effect=RuntimeError("browser crashed"))
+
+    with pytest.raises(RuntimeError):
+        job_manager.start_applying()
+
+    prefetcher.close.assert_called_once()
+    assert job_manager.easy_applier_component.prefetcher is None
+
+
+def test_easy_applier_shares_the_wait_policy(mocker, job_manager):
+    """Test that the easy applier waits through the job manager's policy, which owns the driver's network log."""
+    applier = mocker.patch('src.aihawk_job_manager.AIHawkEasyApplier')
+    job_manager.resume_path = None
+    job_manager.gpt_answerer = mocker.Mock()
+    job_manager.resume_generator_manager = mocker.Mock()
+
+    job_manager.prepare_applier()
+
+    assert applier.call_args.kwargs['wait_policy'] is job_manager.wait_policy
+
+
+def test_crashed_search_fails_its_shard_for_a_retry(mocker, job_manager, tmp_path):
+    """Test that a shard whose search raised is handed back and retried instead of being marked done."""
+    from src.search_plan import SearchPlan, plan_name_for
+
+    job_manager.positions, job_manager.locations, job_manager.base_search_url = ["Engineer"], ["Kabul"], "?f"
+    job_manager.search_plan_settings = {"run": "test"}
+    job_manager.pacing = mocker.Mock()
+    job_manager.set_search_plan(SearchPlan(tmp_path / "plan.sqlite", owner="worker"))
+    mocker.patch.object(job_manager, 'prepare_applier')
+    next_page = mocker.patch.object(job_manager, 'next_job_page', side_effect=RuntimeError("browser died"))
+
+    assert job_manager.apply_search_plan() is True
+
+    assert next_page.call_count == 3
+    assert job_manager.search_plan.counts(plan_name_for(["Engineer"], ["Kabul"], "?f", "test")) == {"failed": 1}
@@ -0,0 +1,55 @@
+from src.application_ledger import ApplicationLedger
+
+
+def test_claim_is_exclusive(tmp_path):
+    """Test that a key can only be claimed once until it is released."""
+    ledger = ApplicationLedger(tmp_path / "ledger.jsonl")
+
+    assert ledger.claim("https://jobs/1")
+    assert not ledger.claim("https://jobs/1")
+    ledger.release("https://jobs/1")
+    assert ledger.claim("https://jobs/1")
+
+
+def test_recorded_outcomes_survive_restart(tmp_path):
+    """Test that recorded outcomes are reloaded while unrecorded claims are not."""
+    path = tmp_path / "ledger.jsonl"
+    ledger = ApplicationLedger(path)
+    ledger.claim("https://jobs/1")
+    ledger.record("https://jobs/1", "success", company="Acme ")
+    ledger.claim("https://jobs/2")
+
+    reloaded = ApplicationLedger(path)
+
+    assert reloaded.is_recorded("https://jobs/1")
+    assert not reloaded.claim("https://jobs/1")
+    assert reloaded.claim("https://jobs/2")
+    assert reloaded.has_success_at("acme")
+    assert reloaded.counts() == {"success": 1}
+
+
+def test_corrupt_lines_are_skipped(tmp_path):
+    """Test that a truncated line from a crash does not prevent loading."""
+    path = tmp_path / "ledger.jsonl"
+    path.write_text('{"key": "a", "status": "failed"}\n{"key": "b", "sta', encoding="utf-8")
+
+    ledger = ApplicationLedger(path)
+
+    assert ledger.is_recorded("a")
+    assert not ledger.is_recorded("b")
+
+
+def test_failed_attempt_can_be_claimed_again(tmp_path):
+    """Test that a failed outcome is kept but does not block a retry, while a success does."""
+    path = tmp_path / "ledger.jsonl"
+    ledger = ApplicationLedger(path)
+    ledger.claim("https://jobs/1")
+    ledger.record("https://jobs/1", "failed")
+    ledger.claim("https://jobs/2")
+    ledger.record("https://jobs/2", "success")
+
+    reloaded = ApplicationLedger(path)
+
+    assert reloaded.is_recorded("https://jobs/1") and not reloaded.is_done("https://jobs/1")
+    assert reloaded.claim("https://jobs/1")
+    assert not reloaded.claim("https://jobs/2")
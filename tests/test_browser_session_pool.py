@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from src.browser_session_pool import BrowserSessionPool
+
+
+@pytest.fixture
+def started(mocker):
+    """Fixture recording the slot of every browser the pool starts."""
+    slots = []
+
+    def factory(slot):
+        slots.append(slot)
+        driver = mocker.Mock(name=f"driver-{slot}")
+        driver.window_handles = ["main"]
+        return driver
+
+    factory.slots = slots
+    return factory
+
+
+def test_sessions_are_reused_and_reset(started):
+    """Test that a released session is reset and handed out again instead of starting a new browser."""
+    pool = BrowserSessionPool(started, max_size=2)
+
+    with pool.session() as first:
+        pass
+    with pool.session() as second:
+        pass
+
+    assert first is second
+    assert started.slots == [0]
+    first.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+    first.get.assert_called_with("about:blank")
+    first.quit.assert_not_called()
+    pool.close()
+    first.quit.assert_called_once()
+
+
+def test_max_size_blocks_until_release(started):
+    """Test that acquire waits for a release once max_size sessions are in use."""
+    pool = BrowserSessionPool(started, max_size=1)
+    driver = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+    threading.Timer(0.05, pool.release, args=(driver,)).start()
+    assert pool.acquire(timeout=2) is driver
+    assert started.slots == [0]
+
+
+def test_failed_task_discards_session(started):
+    """Test that a session whose task raised is quit and its slot reused for a fresh browser."""
+    pool = BrowserSessionPool(started, max_size=1)
+
+    with pytest.raises(RuntimeError):
+        with pool.session() as broken:
+            raise RuntimeError("portal crashed")
+
+    broken.quit.assert_called_once()
+    with pool.session() as fresh:
+        assert fresh is not broken
+    assert started.slots == [0, 0]
+
+
+def test_session_that_cannot_be_reset_is_quit(started):
+    """Test that a dead browser is not returned to the pool."""
+    pool = BrowserSessionPool(started, max_size=2)
+    driver = pool.acquire()
+    driver.execute_cdp_cmd.side_effect = Exception("session deleted")
+
+    pool.release(driver)
+
+    driver.quit.assert_called_once()
+    assert pool.size == 0
+
+
+def test_idle_sessions_are_reaped(started, mocker):
+    """Test that sessions idle longer than idle_timeout are closed."""
+    clock = mocker.patch("src.browser_session_pool.time.monotonic", return_value=100.0)
+    pool = BrowserSessionPool(started, max_size=2, idle_timeout=60, reap_interval=3600)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    clock.return_value = 130.0
+    pool.release(second)
+
+    clock.return_value = 170.0
+    assert pool.reap_idle() == 1
+    first.quit.assert_called_once()
+    second.quit.assert_not_called()
+    assert started.slots == [0, 1]
+    pool.close()
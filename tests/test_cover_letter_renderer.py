@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+from reportlab.pdfbase import pdfmetrics
+
+from src.cover_letter_renderer import CoverLetterRenderer, Letterhead, LetterStyle, wrap_paragraph
+
+PARAGRAPH = ("I would welcome the opportunity to bring my experience in survey analysis, reporting and field "
+             "coordination to your monitoring and evaluation team in Kabul. ") * 3
+
+
+@pytest.mark.parametrize("balanced", [False, True])
+def test_lines_fit_and_keep_every_word(balanced):
+    """Test that wrapped lines are within the width and contain all words in order."""
+    lines = wrap_paragraph(PARAGRAPH, "Helvetica", 11, 300, balanced=balanced)
+
+    assert len(lines) > 3
+    assert all(pdfmetrics.stringWidth(line, "Helvetica", 11) <= 300 for line in lines)
+    assert " ".join(lines).split() == PARAGRAPH.split()
+
+
+def test_balanced_breaking_evens_out_lines():
+    """Test that balanced breaking never leaves more total slack than the greedy fill."""
+    def slack(lines):
+        return sum((300 - pdfmetrics.stringWidth(line, "Helvetica", 11)) ** 2 for line in lines[:-1])
+
+    greedy = wrap_paragraph(PARAGRAPH, "Helvetica", 11, 300)
+    balanced = wrap_paragraph(PARAGRAPH, "Helvetica", 11, 300, balanced=True)
+    assert slack(balanced) <= slack(greedy)
+
+
+def test_overlong_word_is_split():
+    """Test that a word wider than the line is split instead of overflowing."""
+    lines = wrap_paragraph("see https://example.org/" + "a" * 200, "Helvetica", 11, 200)
+
+    assert all(pdfmetrics.stringWidth(line, "Helvetica", 11) <= 200 for line in lines)
+    assert "".join(lines[1:]) == "https://example.org/" + "a" * 200
+
+
+def test_render_returns_multi_page_pdf_with_letterhead():
+    """Test that a long letter renders to PDF bytes in memory, with blank lines kept between paragraphs."""
+    renderer = CoverLetterRenderer(letterhead=Letterhead("Ahmad Karimi", ["Kabul, Afghanistan", "ahmad@example.com"]))
+    text = "Dear Hiring Manager,\n\n" + "\n\n".join([PARAGRAPH] * 15) + "\n\nSincerely,\nAhmad Karimi"
+
+    pdf = renderer.render(text, letter_date=date(2024, 3, 5))
+
+    assert pdf.startswith(b"%PDF") and pdf.count(b"/Type /Page\n") >= 2
+    assert renderer.wrap(text)[:2] == ["Dear Hiring Manager,", ""]
+
+
+def test_letterhead_from_resume_projection():
+    """Test that the letterhead is taken from the resume fields that are present."""
+    letterhead = Letterhead.from_resume({"personal_information.full_name": "Ahmad Karimi",
+                                         "personal_information.city": "Kabul",
+                                         "personal_information.email": "ahmad@example.com"})
+
+    assert letterhead == Letterhead("Ahmad Karimi", ["Kabul", "ahmad@example.com"])
+    assert LetterStyle().text_width < LetterStyle().page_size[0]
@@ -0,0 +1,76 @@
+import json
+import threading
+import time
+
+import pytest
+
+from src.cv_ingestion import ERROR, INGESTED, PARTIAL, CVIngestionRunner, list_cvs
+from src.cv_parser import CVParseResult
+
+
+class FakeParser:
+    """Stands in for CVParser; CVs whose text contains 'broken' fail in the LLM step, 'Zahra' loses a section."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def extract_text_from_pdf(self, pdf_path):
+        with open(pdf_path, encoding="utf-8") as f:
+            return f.read()
+
+    def parse_cv(self, text):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        if "broken" in text:
+            return CVParseResult("Sorry, I cannot read this resume.", ["resume"])
+        return CVParseResult(f"personal_information:\n  name: {text}\n", ["experience"] if text == "Zahra" else [])
+
+    def save_to_yaml(self, yaml_content, output_path):
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(yaml_content)
+
+
+@pytest.fixture
+def cv_dir(tmp_path):
+    """Fixture for a folder of fake CVs, one of them unreadable, plus a file that is not a PDF."""
+    folder = tmp_path / "cvs"
+    folder.mkdir()
+    for name, text in (("Ahmad Karimi.pdf", "Ahmad"), ("Ahmad_Karimi.PDF", "Ahmad2"), ("zahra.pdf", "Zahra"),
+                       ("scan.pdf", "broken")):
+        (folder / name).write_text(text, encoding="utf-8")
+    (folder / "notes.txt").write_text("not a CV", encoding="utf-8")
+    return folder
+
+
+def test_every_cv_gets_its_own_profile(tmp_path, cv_dir):
+    """Test that each CV is written to a separate profile directory and outcomes are logged with timings."""
+    parser = FakeParser()
+    runner = CVIngestionRunner(parser, tmp_path / "candidates", tmp_path / "results.jsonl", workers=2)
+
+    outcomes = runner.run(list_cvs(cv_dir))
+
+    assert [outcome.status for outcome in outcomes] == [INGESTED, INGESTED, ERROR, PARTIAL]
+    assert outcomes[3].error == "sections not parsed: experience"
+    profiles = sorted(path.name for path in (tmp_path / "candidates").iterdir())
+    assert profiles == ["Ahmad_Karimi", "Ahmad_Karimi_2"]
+    assert "Ahmad2" in (tmp_path / "candidates" / "Ahmad_Karimi_2" / "plain_text_resume.yaml").read_text()
+    assert (tmp_path / "candidates" / "Ahmad_Karimi" / "resume.pdf").read_text() == "Ahmad"
+    assert outcomes[3].profile is None
+    logged = [json.loads(line) for line in (tmp_path / "results.jsonl").read_text().splitlines()]
+    assert len(logged) == 4 and all(entry["parse_seconds"] >= 0.02 for entry in logged)
+    assert next(entry for entry in logged if entry["status"] == ERROR)["cv"].endswith("scan.pdf")
+
+
+def test_concurrency_is_bounded(tmp_path, cv_dir):
+    """Test that no more than `workers` CVs are parsed at the same time."""
+    parser = FakeParser()
+
+    CVIngestionRunner(parser, tmp_path / "candidates", tmp_path / "results.jsonl", workers=2).run(list_cvs(cv_dir))
+
+    assert parser.peak == 2
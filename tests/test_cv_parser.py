@@ -0,0 +1,179 @@
+import pytest
+import yaml
+from reportlab.pdfgen import canvas
+
+from src.cv_parse_cache import CVParseCache
+from src.cv_parser import CVParser
+
+PARSED_YAML = "personal_information:\n  name: Ahmad\n  surname: Karimi\n"
+
+
+@pytest.fixture
+def cv_pdf(tmp_path):
+    """Fixture for a one-line CV PDF."""
+    path = tmp_path / "cv.pdf"
+    pdf = canvas.Canvas(str(path))
+    pdf.drawString(72, 720, "Ahmad Karimi - Data Analyst")
+    pdf.save()
+    return path
+
+
+@pytest.fixture
+def parser(mocker, tmp_path):
+    """Fixture for a CVParser with a mocked LLM and an on-disk cache."""
+    ai_adapter = mocker.Mock()
+    ai_adapter.invoke.return_value = f"```yaml\n{PARSED_YAML}```"
+    return CVParser(ai_adapter, cache=CVParseCache(tmp_path / "cv_cache"))
+
+
+def test_unchanged_pdf_is_extracted_once(parser, cv_pdf, mocker):
+    """Test that a re-uploaded PDF gets its text from the cache instead of pdfminer."""
+    extract = mocker.spy(parser.extractor, "extract")
+
+    first = parser.extract_text_from_pdf(str(cv_pdf))
+    second = parser.extract_text_from_pdf(str(cv_pdf))
+
+    assert "Ahmad Karimi" in first and second == first
+    extract.assert_called_once()
+
+
+def test_unchanged_text_is_not_sent_to_the_llm_again(parser, tmp_path):
+    """Test that the YAML for known text is read from disk, also by a new parser instance."""
+    assert parser.parse_cv_to_yaml_structure("Ahmad Karimi - Data Analyst") == PARSED_YAML.strip()
+
+    fresh = CVParser(parser.ai_adapter, cache=CVParseCache(tmp_path / "cv_cache"))
+    assert fresh.parse_cv_to_yaml_structure("Ahmad Karimi - Data Analyst") == PARSED_YAML.strip()
+    parser.ai_adapter.invoke.assert_called_once()
+
+    parser.parse_cv_to_yaml_structure("Zahra Ahmadi - Nurse")
+    assert parser.ai_adapter.invoke.call_count == 2
+
+
+def test_invalid_yaml_is_not_cached(parser):
+    """Test that an LLM reply that is not a YAML mapping is asked for again next time."""
+    parser.ai_adapter.invoke.return_value = "Sorry, I cannot read this resume."
+
+    assert not parser.parse_cv("garbled text").complete
+    with pytest.raises(ValueError):
+        parser.parse_cv_to_yaml_structure("garbled text")
+
+    assert parser.ai_adapter.invoke.call_count == 2
+
+
+SECTIONED_CV = """Ahmad Karimi
+ahmad@example.com
+Experience
+Data Analyst, UNICEF Afghanistan, 2019 - Present
+Education
+BSc Computer Science, Kabul University
+"""
+
+SECTION_REPLIES = {
+    "contact": "personal_information:\n  name: Ahmad\n  surname: Karimi\n",
+    "experience": "experience_details:\n  - position: Data Analyst\n    company: UNICEF Afghanistan\n",
+    "education": "education_details:\n  - education_level: BSc\n    institution: Kabul University\n",
+}
+
+
+def section_reply(prompt):
+    return next(reply for name, reply in SECTION_REPLIES.items() if f"the {name} section" in prompt)
+
+
+def test_sections_are_structured_separately_and_merged(parser):
+    """Test that each section is sent with only its own schema fragment and the results merge in resume order."""
+    parser.ai_adapter.invoke.side_effect = section_reply
+
+    parsed = yaml.safe_load(parser.parse_cv_to_yaml_structure(SECTIONED_CV))
+
+    assert list(parsed) == ["personal_information", "education_details", "experience_details"]
+    assert parsed["experience_details"][0]["company"] == "UNICEF Afghanistan"
+    prompts = {call.args[0] for call in parser.ai_adapter.invoke.call_args_list}
+    education_prompt = next(prompt for prompt in prompts if "the education section" in prompt)
+    assert "institution" in education_prompt and "employment_period" not in education_prompt
+    assert "UNICEF" not in education_prompt
+
+
+def test_only_the_failing_section_is_retried(parser):
+    """Test that an unparsable section reply is asked for again without repeating the other sections."""
+    failures = iter(["Sorry, I cannot help with that."])
+
+    def flaky(prompt):
+        if "the experience section" in prompt:
+            return next(failures, None) or section_reply(prompt)
+        return section_reply(prompt)
+
+    parser.ai_adapter.invoke.side_effect = flaky
+
+    parsed = yaml.safe_load(parser.parse_cv_to_yaml_structure(SECTIONED_CV))
+
+    assert parsed["experience_details"][0]["position"] == "Data Analyst"
+    assert parser.ai_adapter.invoke.call_count == 4
+
+
+def test_changed_section_is_the_only_one_sent_again(parser):
+    """Test that sections of an edited CV that did not change are read from the cache."""
+    parser.ai_adapter.invoke.side_effect = section_reply
+    parser.parse_cv_to_yaml_structure(SECTIONED_CV)
+
+    parser.parse_cv_to_yaml_structure(SECTIONED_CV.replace("2019", "2018"))
+
+    assert parser.ai_adapter.invoke.call_count == 4
+
+
+def test_schema_violations_are_logged(parser, mocker):
+    """Test that the merged result is validated against the resume schema."""
+    replies = dict(SECTION_REPLIES, education="education_details: Kabul University\n")
+    parser.ai_adapter.invoke.side_effect = lambda prompt: next(
+        reply for name, reply in replies.items() if f"the {name} section" in prompt)
+    warning = mocker.patch("src.cv_parser.logger.warning")
+
+    parser.parse_cv_to_yaml_structure(SECTIONED_CV)
+
+    assert any("education_details" in call.args[0] for call in warning.call_args_list)
+
+
+def test_failed_section_makes_the_result_incomplete(parser):
+    """Test that a section the LLM never structured is reported and the merged YAML is not cached."""
+    parser.ai_adapter.invoke.side_effect = lambda prompt: (
+        "not yaml at all" if "the education section" in prompt else section_reply(prompt))
+
+    result = parser.parse_cv(SECTIONED_CV)
+
+    assert result.failed_sections == ["education"] and not result.complete
+    assert "UNICEF" in result.yaml
+    assert not parser.parse_cv(SECTIONED_CV).complete
+
+
+def test_section_whose_llm_call_raises_is_retried(parser):
+    """Test that a section whose LLM call raises is asked for again and the other sections are kept."""
+    failures = iter([TimeoutError("read timed out")])
+
+    def flaky(prompt):
+        if "the experience section" in prompt:
+            error = next(failures, None)
+            if error:
+                raise error
+        return section_reply(prompt)
+
+    parser.ai_adapter.invoke.side_effect = flaky
+
+    result = parser.parse_cv(SECTIONED_CV)
+
+    assert result.complete and "UNICEF" in result.yaml
+    assert parser.ai_adapter.invoke.call_count == 4
+
+
+def test_section_that_keeps_raising_is_reported_and_not_saved(parser):
+    """Test that a section whose LLM call always raises is listed as failed and no partial YAML is returned."""
+    def broken(prompt):
+        if "the education section" in prompt:
+            raise ConnectionError("LLM unreachable")
+        return section_reply(prompt)
+
+    parser.ai_adapter.invoke.side_effect = broken
+
+    result = parser.parse_cv(SECTIONED_CV)
+
+    assert result.failed_sections == ["education"] and "UNICEF" in result.yaml
+    with pytest.raises(ValueError, match="education"):
+        parser.parse_cv_to_yaml_structure(SECTIONED_CV)
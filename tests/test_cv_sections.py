@@ -0,0 +1,44 @@
+from src.cv_sections import heading_section, split_cv_sections
+
+CV_TEXT = """Ahmad Karimi
+Kabul, Afghanistan | ahmad@example.com
+
+PROFILE
+Data analyst with six years in humanitarian programmes.
+
+Work Experience:
+Data Analyst, UNICEF Afghanistan
+2019 - Present
+
+Education
+BSc Computer Science, Kabul University, 2017
+\f
+SKILLS
+Python, SQL, Power BI
+Languages
+Dari, Pashto, English
+Projects
+"""
+
+
+def test_headings_are_recognized_case_and_punctuation_insensitively():
+    """Test that headings match regardless of case and trailing colons, and ordinary lines do not."""
+    assert heading_section("WORK EXPERIENCE:") == "experience"
+    assert heading_section("  Licenses & Certifications ") == "skills"
+    assert heading_section("Data Analyst, UNICEF Afghanistan") == ""
+    assert heading_section("Experience in data analysis and monitoring for donor-funded projects") == ""
+
+
+def test_cv_is_split_into_sections():
+    """Test that the header and summary go to contact, related headings share a section, and empty ones are dropped."""
+    sections = split_cv_sections(CV_TEXT)
+
+    assert list(sections) == ["contact", "experience", "education", "skills"]
+    assert sections["contact"].startswith("Ahmad Karimi") and "six years" in sections["contact"]
+    assert "UNICEF" in sections["experience"] and "Kabul University" not in sections["experience"]
+    assert "Power BI" in sections["skills"] and "Pashto" in sections["skills"]
+
+
+def test_text_without_headings_is_one_section():
+    """Test that a CV without known headings is left whole."""
+    assert split_cv_sections("Ahmad Karimi - Data Analyst") == {"contact": "Ahmad Karimi - Data Analyst"}
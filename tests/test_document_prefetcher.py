@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from src.document_prefetcher import DocumentPrefetcher
+
+JOB = "https://www.linkedin.com/jobs/view/1"
+
+
+@pytest.fixture
+def prefetcher():
+    """Fixture for a prefetcher that is shut down after the test."""
+    prefetcher = DocumentPrefetcher(workers=1)
+    yield prefetcher
+    prefetcher.close()
+
+
+def test_scheduled_document_is_generated_in_background(prefetcher, mocker):
+    """Test that the upload step gets the background result instead of generating the document itself."""
+    threads = []
+
+    def generate():
+        threads.append(threading.current_thread().name)
+        return "generated_cv/CV_1.pdf"
+
+    prefetcher.schedule("resume", JOB, generate)
+    fallback = mocker.Mock()
+
+    assert prefetcher.result("resume", JOB, fallback) == "generated_cv/CV_1.pdf"
+    assert threads[0].startswith("document-prefetch")
+    fallback.assert_not_called()
+
+
+def test_unscheduled_or_failed_document_is_generated_now(prefetcher, mocker):
+    """Test that the caller generates the document when nothing was scheduled or the prefetch raised."""
+    prefetcher.schedule("cover_letter", JOB, mocker.Mock(side_effect=RuntimeError("rate limited")))
+
+    assert prefetcher.result("cover_letter", JOB, lambda: "Dear hiring team") == "Dear hiring team"
+    assert prefetcher.result("resume", JOB, lambda: "CV.pdf") == "CV.pdf"
+
+
+def test_forget_cancels_documents_not_started(prefetcher, mocker):
+    """Test that documents of a finished job that have not started are not generated."""
+    release = threading.Event()
+    prefetcher.schedule("resume", "https://www.linkedin.com/jobs/view/0", release.wait)
+    never = mocker.Mock()
+    prefetcher.schedule("resume", JOB, never)
+
+    prefetcher.forget(JOB)
+    release.set()
+    prefetcher.result("resume", "https://www.linkedin.com/jobs/view/0", mocker.Mock())
+
+    never.assert_not_called()
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from src.document_store import DocumentStore
+
+PDF = b"%PDF-1.4 tailored resume"
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fixture for a document store in a temporary folder."""
+    return DocumentStore(tmp_path / "generated_cv")
+
+
+def test_identical_documents_share_one_file(store, mocker):
+    """Test that the same bytes are written once under a content-hash name."""
+    first = store.put(PDF, "CV")
+    write = mocker.patch("src.document_store.open")
+    second = store.put(PDF, "CV")
+
+    assert first == second and first.read_bytes() == PDF
+    assert first.name.startswith("CV_") and first.suffix == ".pdf"
+    write.assert_not_called()
+    assert [path.name for path in store.folder.iterdir()] == [first.name]
+
+
+def test_concurrent_documents_get_distinct_files(store):
+    """Test that documents generated at the same moment by several threads never collide."""
+    paths = []
+    threads = [threading.Thread(target=lambda i=i: paths.append(store.put(PDF + bytes([i]), "CV"))) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(paths)) == 8
+    assert sorted(path.read_bytes()[-1] for path in paths) == list(range(8))
+
+
+@pytest.mark.parametrize("data, extension, message", [
+    (b"%PDF" + b"x" * (2 * 1024 * 1024), ".pdf", "exceeds the maximum limit"),
+    (PDF, ".txt", "format is not allowed"),
+    (b"<html>rate limited</html>", ".pdf", "not a valid .pdf"),
+    (b"", ".pdf", "empty"),
+])
+def test_invalid_documents_are_rejected_before_writing(store, data, extension, message):
+    """Test that size, type and content are checked in memory and nothing is written for a bad document."""
+    with pytest.raises(ValueError, match=message):
+        store.put(data, "CV", extension)
+    assert not store.folder.exists()
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from src.driver_resolver import ChromeDriverResolver, StartupTiming
+
+
+@pytest.fixture
+def driver_file(tmp_path):
+    """Fixture for an executable stand-in for a downloaded chromedriver."""
+    path = tmp_path / "chromedriver"
+    path.write_text("binary")
+    path.chmod(0o755)
+    return str(path)
+
+
+def make_resolver(tmp_path, mocker, driver_file, version="129.0.6668.100"):
+    installer = mocker.Mock(return_value=driver_file)
+    resolver = ChromeDriverResolver(tmp_path / "cache.json", installer=installer, version_reader=lambda: version)
+    return resolver, installer
+
+
+def test_cached_driver_skips_installer(tmp_path, mocker, driver_file):
+    """Test that the installer only runs for a Chrome version that is not cached yet."""
+    resolver, installer = make_resolver(tmp_path, mocker, driver_file)
+    timing = StartupTiming()
+
+    assert resolver.resolve() == driver_file
+    assert resolver.resolve(timing) == driver_file
+
+    installer.assert_called_once()
+    assert timing.source == "cache"
+    assert "129.0.6668.100" in timing.summary()
+
+
+def test_new_chrome_version_resolves_again(tmp_path, mocker, driver_file):
+    """Test that a Chrome update invalidates the cached driver."""
+    resolver, installer = make_resolver(tmp_path, mocker, driver_file)
+    resolver.resolve()
+    updated, updated_installer = make_resolver(tmp_path, mocker, driver_file, version="130.0.6723.58")
+
+    updated.resolve()
+
+    updated_installer.assert_called_once()
+
+
+def test_changed_driver_file_resolves_again(tmp_path, mocker, driver_file):
+    """Test that a cached driver that was replaced or removed on disk is not trusted."""
+    resolver, installer = make_resolver(tmp_path, mocker, driver_file)
+    resolver.resolve()
+    with open(driver_file, "a") as f:
+        f.write("patched")
+
+    resolver.resolve()
+    os.remove(driver_file)
+    installer.side_effect = RuntimeError("offline")
+
+    with pytest.raises(RuntimeError):
+        resolver.resolve()
+    assert installer.call_count == 3
+
+
+def test_offline_falls_back_to_same_major_version(tmp_path, mocker, driver_file):
+    """Test that a failed download uses a cached driver of the same major Chrome version."""
+    resolver, _ = make_resolver(tmp_path, mocker, driver_file, version="129.0.6668.58")
+    resolver.resolve()
+    patched, installer = make_resolver(tmp_path, mocker, driver_file, version="129.0.6668.100")
+    installer.side_effect = RuntimeError("offline")
+    timing = StartupTiming()
+
+    assert patched.resolve(timing) == driver_file
+    assert timing.source == "cache (offline fallback)"
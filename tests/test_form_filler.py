@@ -0,0 +1,69 @@
+import pytest
+
+from src.form_filler import FILL_FIELDS_SCRIPT, FormFiller
+
+
+@pytest.fixture
+def driver(mocker):
+    """Fixture for a mocked driver."""
+    return mocker.Mock()
+
+
+def field(mocker, tag="input"):
+    element = mocker.Mock()
+    element.tag_name = tag
+    return element
+
+
+def test_fields_are_filled_in_one_call(driver, mocker):
+    """Test that all values are set by a single script call without typing."""
+    name, letter = field(mocker), field(mocker, "textarea")
+    driver.execute_script.return_value = [True, True]
+
+    assert FormFiller(driver).fill([(name, "Ahmad"), (letter, "Dear hiring team, " * 200)]) == [True, True]
+
+    driver.execute_script.assert_called_once()
+    assert driver.execute_script.call_args.args[0] == FILL_FIELDS_SCRIPT
+    name.send_keys.assert_not_called()
+    letter.send_keys.assert_not_called()
+
+
+def test_rejected_fields_are_typed(driver, mocker):
+    """Test that fields the script could not fill fall back to keystrokes and select_by_visible_text."""
+    city, years, country = field(mocker), field(mocker), field(mocker, "select")
+    select = mocker.patch("src.form_filler.Select")
+    driver.execute_script.return_value = [False, True, False]
+
+    assert FormFiller(driver).fill([(city, "Kabul"), (years, 5), (country, "Afghanistan")]) == [True, True, True]
+
+    city.clear.assert_called_once()
+    city.send_keys.assert_called_once_with("Kabul")
+    years.send_keys.assert_not_called()
+    select.return_value.select_by_visible_text.assert_called_once_with("Afghanistan")
+
+
+def test_script_error_types_every_field(driver, mocker):
+    """Test that a failing script call still fills every field the old way."""
+    first, second = field(mocker), field(mocker)
+    driver.execute_script.side_effect = Exception("stale element")
+    second.send_keys.side_effect = Exception("element not interactable")
+
+    assert FormFiller(driver).fill([(first, "a"), (second, "b")]) == [True, False]
+    first.send_keys.assert_called_once_with("a")
+
+
+def test_checkboxes_and_radios_are_clicked(driver, mocker):
+    """Test that checkboxes and radio buttons are left to clicks instead of having their value rewritten."""
+    consent, remote = field(mocker), field(mocker)
+    consent.get_attribute.side_effect = {"type": "checkbox"}.get
+    remote.get_attribute.side_effect = {"type": "radio", "value": "remote"}.get
+    for box in (consent, remote):
+        box.is_selected.side_effect = [False, True]
+    driver.execute_script.return_value = [False, False]
+
+    assert FormFiller(driver).fill([(consent, "Yes"), (remote, "Remote")]) == [True, True]
+
+    assert "'checkbox', 'radio'" in FILL_FIELDS_SCRIPT
+    consent.click.assert_called_once()
+    remote.click.assert_called_once()
+    consent.send_keys.assert_not_called()
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from src.form_mapping_cache import FormMappingCache, ats_domain, field_signature
+from src.generic_applier import GenericPortalApplier
+
+RESUME_DATA = {"personal_information.name": "Ahmad", "personal_information.email": "ahmad@example.com"}
+
+
+def greenhouse_fields(question_id):
+    return [
+        {"tag": "input", "index": 0, "type": "text", "name": "first_name", "id": "x1", "label": "First Name *"},
+        {"tag": "input", "index": 1, "type": "email", "name": "email", "id": "x2", "label": "Email"},
+        {"tag": "textarea", "index": 2, "name": f"question_{question_id}", "id": "x3", "label": "Why us?"},
+    ]
+
+
+@pytest.fixture
+def applier(mocker, tmp_path):
+    """Fixture for a GenericPortalApplier on a Greenhouse page with a file-backed mapping cache."""
+    driver = mocker.Mock()
+    driver.current_url = "https://boards.greenhouse.io/acme/jobs/1"
+    ai_adapter = mocker.Mock()
+    ai_adapter.invoke.return_value = json.dumps({"0": "personal_information.name", "1": "personal_information.email",
+                                                 "2": "not.a.resume.key"})
+    cache = FormMappingCache(tmp_path / "form_mappings.json")
+    return GenericPortalApplier(driver, ai_adapter, RESUME_DATA, wait_policy=mocker.Mock(), mapping_cache=cache)
+
+
+def test_ats_domain():
+    """Test that per-company ATS hosts collapse to the ATS domain."""
+    assert ats_domain("https://acme.wd5.myworkdayjobs.com/en-US/careers") == "myworkdayjobs.com"
+    assert ats_domain("https://boards.greenhouse.io/acme") == "greenhouse.io"
+
+
+def test_other_hosts_are_kept_whole():
+    """Test that company career sites under a shared public suffix do not share one cache bucket."""
+    assert ats_domain("https://careers.acme.co.uk/apply") == "careers.acme.co.uk"
+    assert ats_domain("https://www.other.co.uk/jobs") == "other.co.uk"
+    assert ats_domain("https://jobs.example.com.au/1") != ats_domain("https://jobs.sample.com.au/1")
+
+
+def test_signature_ignores_generated_ids():
+    """Test that the same question with different generated ids and numbers has one signature."""
+    assert field_signature(greenhouse_fields(123)[2]) == field_signature(greenhouse_fields(456)[2])
+    assert field_signature(greenhouse_fields(1)[0]) != field_signature(greenhouse_fields(1)[1])
+
+
+def test_repeat_form_needs_no_llm_call(applier, tmp_path):
+    """Test that a second form of the same ATS is mapped from the cache, invalid keys excluded."""
+    first = applier.map_fields(greenhouse_fields(123))
+    applier.driver.current_url = "https://boards.greenhouse.io/other-company/jobs/9"
+    applier.mapping_cache = FormMappingCache(tmp_path / "form_mappings.json")
+    second = applier.map_fields(greenhouse_fields(456))
+
+    assert first == second == {0: "personal_information.name", 1: "personal_information.email"}
+    applier.ai_adapter.invoke.assert_called_once()
+
+
+def test_only_unknown_fields_go_to_the_llm(applier):
+    """Test that a form with one new field sends only that field to the LLM."""
+    applier.map_fields(greenhouse_fields(123)[:2])
+    applier.ai_adapter.invoke.return_value = "{}"
+
+    mapping = applier.map_fields(greenhouse_fields(123))
+
+    prompt = applier.ai_adapter.invoke.call_args.args[0]
+    assert "Why us?" in prompt and "First Name" not in prompt
+    assert mapping == {0: "personal_information.name", 1: "personal_information.email"}
+
+
+def test_failed_llm_call_is_not_cached(applier):
+    """Test that fields are asked again when the LLM call failed."""
+    applier.ai_adapter.invoke.side_effect = [Exception("rate limited"), "{}"]
+
+    assert applier.map_fields(greenhouse_fields(1)) == {}
+    applier.map_fields(greenhouse_fields(1))
+
+    assert applier.ai_adapter.invoke.call_count == 2
@@ -0,0 +1,44 @@
+import pytest
+
+from src.generic_applier import HARVEST_FIELDS_SCRIPT, GenericPortalApplier
+
+
+@pytest.fixture
+def applier(mocker):
+    """Fixture for a GenericPortalApplier on a mocked driver without a mapping cache."""
+    driver = mocker.Mock()
+    driver.current_url = "https://jobs.lever.co/acme/1"
+    return GenericPortalApplier(driver, mocker.Mock(), {}, wait_policy=mocker.Mock())
+
+
+def test_fields_are_harvested_in_one_round_trip(applier, mocker):
+    """Test that all fields come from a single script call and keep their element references."""
+    email, country = mocker.Mock(name="email"), mocker.Mock(name="country")
+    applier.driver.execute_script.return_value = [
+        {"tag": "input", "type": "email", "name": "email", "id": None, "placeholder": None,
+         "label": "Email address", "required": True, "element": email},
+        {"tag": "select", "name": "country", "id": "c1", "label": "Country", "required": False,
+         "options": ["Afghanistan", "Germany"], "element": country},
+    ]
+
+    elements_info, valid_elements = applier.harvest_fields()
+
+    applier.driver.execute_script.assert_called_once_with(HARVEST_FIELDS_SCRIPT)
+    applier.driver.find_elements.assert_not_called()
+    assert valid_elements == [email, country]
+    assert elements_info == [
+        {"tag": "input", "type": "email", "name": "email", "label": "Email address", "required": True, "index": 0},
+        {"tag": "select", "name": "country", "id": "c1", "label": "Country", "required": False,
+         "options": ["Afghanistan", "Germany"], "index": 1},
+    ]
+    email.get_attribute.assert_not_called()
+    email.is_displayed.assert_not_called()
+
+
+def test_script_error_yields_no_fields(applier):
+    """Test that a page the script cannot analyze is treated as having no fillable fields."""
+    applier.driver.execute_script.side_effect = Exception("javascript error")
+
+    assert applier.harvest_fields() == ([], [])
+    assert applier.process_page() is False
+    applier.ai_adapter.invoke.assert_not_called()
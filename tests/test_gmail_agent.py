@@ -0,0 +1,126 @@
+import smtplib
+import socket
+from datetime import datetime
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from src.gmail_agent import DEFERRED, FAILED, SENT, GmailAgent, OutgoingEmail, SendRateLimiter
+
+
+class Mailbox:
+    """aiosmtpd handler that keeps delivered messages and can answer 421 to chosen recipients once."""
+
+    def __init__(self):
+        self.messages = []
+        self.logins = 0
+        self.hang_up_on = set()
+
+    def authenticate(self, server, session, envelope, mechanism, auth_data):
+        self.logins += 1
+        return AuthResult(success=auth_data.password == b"app-password", handled=False)
+
+    async def handle_DATA(self, server, session, envelope):
+        recipient = envelope.rcpt_tos[0]
+        if recipient in self.hang_up_on:
+            self.hang_up_on.discard(recipient)
+            return "421 4.7.0 Try again later, closing connection"
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def mailbox():
+    """Fixture for a local SMTP server standing in for Gmail, with AUTH over plain text."""
+    mailbox = Mailbox()
+    controller = Controller(mailbox, hostname="127.0.0.1", port=free_port(),
+                            authenticator=mailbox.authenticate, auth_require_tls=False)
+    controller.start()
+    mailbox.port = controller.port
+    yield mailbox
+    controller.stop()
+
+
+def make_agent(mailbox, password="app-password", **limits):
+    limiter = SendRateLimiter(**{"per_minute": 60000, **limits})
+    return GmailAgent("me@gmail.com", password, smtp_server="127.0.0.1", smtp_port=mailbox.port,
+                      rate_limiter=limiter, starttls=False)
+
+
+def applications(count):
+    return [OutgoingEmail(f"hr{index}@example.com", "Application", f"Dear HR {index}") for index in range(count)]
+
+
+def test_batch_is_sent_over_one_login(mailbox, tmp_path):
+    """Test that a batch pays for one handshake and attachments arrive."""
+    cv = tmp_path / "resume.pdf"
+    cv.write_bytes(b"%PDF-1.4 cv")
+    emails = applications(3) + [OutgoingEmail("hr3@example.com", "Application", "Dear HR", str(cv))]
+
+    with make_agent(mailbox) as agent:
+        outcomes = agent.send_batch(emails)
+
+    assert [outcome.status for outcome in outcomes] == [SENT] * 4
+    assert mailbox.logins == 1
+    assert [message.rcpt_tos for message in mailbox.messages][-1] == ["hr3@example.com"]
+    assert b'filename="resume.pdf"' in mailbox.messages[-1].content
+
+
+def test_dropped_connection_is_reopened(mailbox):
+    """Test that a 421 from the server reconnects and retries the message instead of failing it."""
+    mailbox.hang_up_on.add("hr1@example.com")
+
+    with make_agent(mailbox) as agent:
+        outcomes = agent.send_batch(applications(3))
+
+    assert [outcome.status for outcome in outcomes] == [SENT] * 3
+    assert mailbox.logins == 2
+    assert len(mailbox.messages) == 3
+
+
+def test_daily_limit_defers_the_rest(mailbox, tmp_path):
+    """Test that messages beyond the daily limit are deferred, also for a later run sharing the state file."""
+    state_file = tmp_path / "gmail_sent.json"
+
+    with make_agent(mailbox, per_day=2, state_file=state_file) as agent:
+        outcomes = agent.send_batch(applications(3))
+    with make_agent(mailbox, per_day=2, state_file=state_file) as agent:
+        later = agent.send_batch(applications(1))
+
+    assert [outcome.status for outcome in outcomes + later] == [SENT, SENT, DEFERRED, DEFERRED]
+    assert len(mailbox.messages) == 2
+
+
+def test_refused_message_fails_alone(mailbox, tmp_path):
+    """Test that a message that cannot be built fails without stopping the batch, while a bad login does."""
+    emails = applications(2)
+    emails[0].attachment_path = str(tmp_path / "missing.pdf")
+
+    with make_agent(mailbox) as agent:
+        assert [outcome.status for outcome in agent.send_batch(emails)] == [FAILED, SENT]
+
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        make_agent(mailbox, password="wrong").send_batch(applications(1))
+
+
+def test_messages_are_spaced_to_the_per_minute_limit():
+    """Test that the limiter sleeps between messages to stay under the per-minute rate."""
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = SendRateLimiter(per_minute=20, per_day=None, clock=lambda: now[0], sleep=sleep,
+                              now=lambda: datetime(2024, 5, 1, 9))
+
+    assert all(limiter.acquire() for _ in range(3))
+    assert sleeps == [pytest.approx(3.0), pytest.approx(3.0)]
@@ -0,0 +1,73 @@
+import pytest
+
+from src.job import Job
+from src.job_pipeline import ScrapeAheadPipeline
+
+
+@pytest.fixture(autouse=True)
+def mock_wait_policy(mocker):
+    """Fixture to skip readiness waits in the harvester."""
+    return mocker.patch("src.job_pipeline.WaitPolicy")
+
+
+@pytest.fixture
+def job_manager(mocker):
+    """Fixture to mock an AIHawkJobManager with two result pages per search."""
+    manager = mocker.Mock()
+    manager.pacing = None
+    manager.driver.get_cookies.return_value = [{"name": "li_at", "value": "token", "sameSite": "None"}]
+    pages = {0: ["a", "b", "dup"], 1: ["c", "dup"], 2: []}
+    current_page = {}
+
+    def next_job_page(position, location, page, driver=None):
+        current_page["page"] = page
+
+    manager.next_job_page.side_effect = next_job_page
+    manager.get_jobs_from_page.side_effect = lambda driver=None: pages[current_page["page"]]
+    manager.jobs_from_tiles.side_effect = lambda tiles: [
+        Job(title=name, company=f"Company {name}", location="", link=f"https://jobs/{name}", apply_method="")
+        for name in tiles
+    ]
+    manager.get_skip_reason.side_effect = lambda job: "skipped" if job.title == "b" else None
+    return manager
+
+
+def test_pipeline_filters_and_dedupes(mocker, job_manager):
+    """Test that harvested pages are filtered and deduplicated before reaching the consumer."""
+    harvest_driver = mocker.Mock()
+    pipeline = ScrapeAheadPipeline(job_manager, lambda: harvest_driver, queue_size=1)
+
+    batches = list(pipeline.run([("Engineer", "Kabul")]))
+
+    assert [batch.page_number for batch in batches] == [0, 1]
+    assert [job.title for job in batches[0].jobs] == ["a", "dup"]
+    assert [(job.title, reason) for job, reason in batches[0].skipped] == [("b", "skipped")]
+    assert [job.title for job in batches[1].jobs] == ["c"]
+    harvest_driver.add_cookie.assert_called_once_with({"name": "li_at", "value": "token"})
+    harvest_driver.quit.assert_called_once()
+    assert pipeline.error is None
+
+
+def test_pipeline_stops_when_consumer_stops(mocker, job_manager):
+    """Test that closing the consumer early shuts the harvester browser down."""
+    harvest_driver = mocker.Mock()
+    pipeline = ScrapeAheadPipeline(job_manager, lambda: harvest_driver, queue_size=1)
+
+    batches = pipeline.run([("Engineer", "Kabul"), ("Designer", "Herat")])
+    first = next(batches)
+    batches.close()
+
+    assert first.page_number == 0
+    assert pipeline.stop_event.is_set()
+    harvest_driver.quit.assert_called_once()
+
+
+def test_pipeline_reports_harvester_errors(mocker, job_manager):
+    """Test that a failing browser factory ends the pipeline instead of hanging it."""
+    def broken_factory():
+        raise RuntimeError("chrome failed to start")
+
+    pipeline = ScrapeAheadPipeline(job_manager, broken_factory)
+
+    assert list(pipeline.run([("Engineer", "Kabul")])) == []
+    assert isinstance(pipeline.error, RuntimeError)
@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_PACKAGES = ["selenium", "webdriver_manager", "lib_resume_builder_AIHawk", "langchain_core", "pdfminer"]
+
+
+@pytest.mark.parametrize("module", ["agentic_main", "src.llm.llm_manager"])
+def test_entry_point_imports_stay_light(module):
+    """Test that importing an entry point does not load the browser, resume builder or LangChain stacks."""
+    check = f"import sys, {module}; print(','.join(p for p in {HEAVY_PACKAGES!r} if p in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
@@ -0,0 +1,121 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.pacing import PacingPolicy, TokenBucket, PAGE, SUBMISSION, parse_quiet_hours
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Fixture providing a manually advanced monotonic clock."""
+    return FakeClock()
+
+
+def make_policy(clock, **kwargs):
+    settings = dict(page_loads_per_minute=1, submissions_per_hour=60, burst=1,
+                    clock=clock, sleep=clock.sleep, now=lambda: datetime(2024, 5, 1, 12, 0))
+    settings.update(kwargs)
+    return PacingPolicy(**settings)
+
+
+def test_token_bucket_wait_time(clock):
+    """Test that an empty bucket reports the time until the next token."""
+    bucket = TokenBucket(rate_per_second=0.5, capacity=1, clock=clock)
+    assert bucket.time_until_available() == 0
+    bucket.consume()
+    assert bucket.time_until_available() == pytest.approx(2.0)
+    clock.now += 1
+    assert bucket.time_until_available() == pytest.approx(1.0)
+
+
+def test_acquire_waits_for_rate_limit(clock):
+    """Test that the second page load waits for the bucket to refill and records idle time."""
+    policy = make_policy(clock)
+
+    assert policy.acquire(PAGE)
+    assert clock.now == 0
+    assert policy.acquire(PAGE)
+    assert clock.now == pytest.approx(60)
+    assert policy.stats['idle_seconds'] == pytest.approx(60)
+
+
+def test_prefetch_runs_during_wait(clock):
+    """Test that queued prefetch work runs inside the wait instead of after it."""
+    policy = make_policy(clock)
+    calls = []
+
+    def prefetch():
+        calls.append(clock.now)
+        clock.now += 20
+
+    policy.acquire(PAGE)
+    policy.schedule_prefetch(prefetch)
+    policy.acquire(PAGE)
+
+    assert calls == [0]
+    assert clock.now == pytest.approx(60)
+    assert policy.stats['prefetch_seconds'] == pytest.approx(20)
+    assert policy.stats['idle_seconds'] == pytest.approx(40)
+
+
+def test_daily_cap_persists_across_instances(tmp_path, clock):
+    """Test that daily caps are enforced and survive a restart through the state file."""
+    state_file = tmp_path / "pacing_state.json"
+    policy = make_policy(clock, submissions_per_hour=3600, burst=5, daily_submission_cap=2, state_file=state_file)
+
+    assert policy.acquire(SUBMISSION)
+    assert policy.acquire(SUBMISSION)
+    assert not policy.acquire(SUBMISSION)
+    assert policy.exhausted(SUBMISSION)
+
+    restarted = make_policy(clock, daily_submission_cap=2, state_file=state_file)
+    assert not restarted.acquire(SUBMISSION)
+    assert json.loads(state_file.read_text())[SUBMISSION] == 2
+
+
+def test_quiet_hours_wrap_midnight(clock):
+    """Test that a quiet window spanning midnight pauses until it ends."""
+    policy = make_policy(clock, quiet_hours="23:00-07:00", now=lambda: datetime(2024, 5, 1, 23, 30))
+
+    assert policy.acquire(PAGE)
+    assert clock.now == pytest.approx(7.5 * 3600)
+    assert policy.stats['quiet_hours_seconds'] == pytest.approx(7.5 * 3600)
+    assert policy.stats['idle_seconds'] == 0
+
+
+def test_invalid_quiet_hours():
+    """Test that malformed quiet hours are rejected."""
+    assert parse_quiet_hours(None) is None
+    with pytest.raises(ValueError):
+        parse_quiet_hours("late")
+
+
+def test_from_parameters_overrides_defaults(clock):
+    """Test building the policy from the config.yaml 'pacing' section."""
+    policy = PacingPolicy.from_parameters({'pacing': {'daily_page_cap': 3, 'break_every_pages': 0}},
+                                          clock=clock, sleep=clock.sleep)
+    assert policy.daily_caps[PAGE] == 3
+    assert policy.break_every_pages == 0
+
+
+def test_unknown_pacing_settings_are_ignored(clock, mocker):
+    """Test that a misspelled key in the 'pacing' section is logged instead of crashing the bot."""
+    warning = mocker.patch("src.pacing.logger.warning")
+
+    policy = PacingPolicy.from_parameters({'pacing': {'daily_page_cap': 3, 'daily_pages_cap': 5}},
+                                          clock=clock, sleep=clock.sleep)
+
+    assert policy.daily_caps[PAGE] == 3
+    assert "daily_pages_cap" in warning.call_args.args[0]
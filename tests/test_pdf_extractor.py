@@ -0,0 +1,52 @@
+import io
+
+import pytest
+from pdfminer.high_level import extract_text
+from reportlab.pdfgen import canvas
+
+from src.pdf_extractor import PdfExtractor
+
+
+@pytest.fixture(scope="module")
+def portfolio():
+    """Fixture for a five-page PDF with two lines per page."""
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(5):
+        pdf.drawString(72, 720, f"Page {page} Data Analyst")
+        pdf.drawString(72, 700, f"Kabul University {page}")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def test_parallel_text_matches_pdfminer(portfolio):
+    """Test that chunks parsed in worker processes join to the same text as a single pdfminer pass."""
+    extractor = PdfExtractor(workers=2, pages_per_task=2)
+
+    assert extractor.extract(portfolio) == extract_text(io.BytesIO(portfolio))
+
+
+def test_pages_are_streamed_in_order(portfolio):
+    """Test that every page is yielded once, in page order, with its own text."""
+    pages = list(PdfExtractor(workers=1, pages_per_task=2).iter_pages(portfolio))
+
+    assert [number for number, _ in pages] == [0, 1, 2, 3, 4]
+    assert all(f"Page {number} Data Analyst" in text for number, text in pages)
+
+
+def test_fast_mode_keeps_lines(portfolio):
+    """Test that skipping layout analysis still separates lines and pages."""
+    text = PdfExtractor(fast=True, workers=1).extract(portfolio)
+
+    assert "Page 0 Data Analyst\nKabul University 0" in text
+    assert text.count("\f") == 5
+
+
+def test_settings_change_the_variant():
+    """Test that each extractor setting has its own cache variant."""
+    variants = {PdfExtractor().variant, PdfExtractor(fast=True).variant,
+                PdfExtractor(laparams={"line_margin": 0.2}).variant}
+    assert len(variants) == 3
+    with pytest.raises(ValueError):
+        PdfExtractor(pages_per_task=0)
@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+from src.application_ledger import ApplicationLedger
+from src.browser_session_pool import BrowserSessionPool
+from src.portal_batch import PortalBatchRunner
+
+
+class FakeApplier:
+    """Stands in for GenericPortalApplier; URLs containing 'broken' raise, 'stuck' ones stop before submitting."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_processed = 0
+
+    def apply(self, url):
+        if "broken" in url:
+            raise RuntimeError("form crashed")
+        self.pages_processed = 2
+        if "stuck" in url:
+            return "no_next_page"
+        return "submitted"
+
+
+@pytest.fixture
+def pool(mocker):
+    """Fixture for a session pool of two mocked browsers."""
+    def factory(slot):
+        driver = mocker.Mock()
+        driver.window_handles = ["main"]
+        return driver
+
+    pool = BrowserSessionPool(factory, max_size=2)
+    yield pool
+    pool.close()
+
+
+def read_outcomes(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_batch_records_outcomes_and_dedupes(tmp_path, pool):
+    """Test that every unique URL is applied to once and its outcome and timing are written."""
+    ledger = ApplicationLedger(tmp_path / "ledger.jsonl")
+    ledger.record("https://ats/done", "submitted")
+    urls = io.StringIO("https://ats/a\n\n# comment\nhttps://ats/a#apply\nhttps://ats/b\nhttps://ats/done\n")
+    runner = PortalBatchRunner(pool, FakeApplier, ledger, tmp_path / "results.jsonl")
+
+    results = runner.run(urls)
+
+    assert results == {"submitted": 2, "skipped": 2}
+    outcomes = read_outcomes(tmp_path / "results.jsonl")
+    assert sorted(outcome["url"] for outcome in outcomes) == ["https://ats/a", "https://ats/b"]
+    assert all(outcome["pages"] == 2 and outcome["seconds"] >= 0 for outcome in outcomes)
+    assert ledger.is_recorded("https://ats/a")
+
+
+def test_failed_url_is_retried_in_next_batch(tmp_path, pool):
+    """Test that a URL whose application raised is logged as an error but not recorded in the ledger."""
+    ledger = ApplicationLedger(tmp_path / "ledger.jsonl")
+    runner = PortalBatchRunner(pool, FakeApplier, ledger, tmp_path / "results.jsonl", workers=1)
+
+    results = runner.run(["https://ats/broken", "https://ats/ok"])
+
+    assert results == {"error": 1, "submitted": 1}
+    assert not ledger.is_recorded("https://ats/broken")
+    assert ledger.claim("https://ats/broken")
+    error = next(outcome for outcome in read_outcomes(tmp_path / "results.jsonl") if outcome["status"] == "error")
+    assert error["error"] == "form crashed"
+
+
+def test_unsubmitted_form_is_retried_in_next_batch(tmp_path, pool):
+    """Test that a URL that stopped before submitting is reported but left for the next batch."""
+    ledger = ApplicationLedger(tmp_path / "ledger.jsonl")
+    runner = PortalBatchRunner(pool, FakeApplier, ledger, tmp_path / "results.jsonl", workers=1)
+
+    assert runner.run(["https://ats/stuck"]) == {"no_next_page": 1}
+
+    assert not ledger.is_recorded("https://ats/stuck")
+    assert ledger.claim("https://ats/stuck")
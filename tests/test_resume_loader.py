@@ -0,0 +1,68 @@
+import os
+
+import pytest
+import yaml
+
+from src.job_application_profile import JobApplicationProfile
+from src.resume_loader import load_resume
+
+
+@pytest.fixture
+def resume_file(tmp_path):
+    """Fixture for a copy of the example plain_text_resume.yaml."""
+    path = tmp_path / "plain_text_resume.yaml"
+    with open("data_folder_example/plain_text_resume.yaml", "r", encoding="utf-8") as f:
+        path.write_text(f.read(), encoding="utf-8")
+    return path
+
+
+def touch(path):
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+
+def test_resume_is_parsed_once_and_shared(resume_file, mocker):
+    """Test that repeated loads return the same parse without reading YAML again, also after a bare touch."""
+    safe_load = mocker.spy(yaml, "safe_load")
+
+    first = load_resume(resume_file)
+    assert load_resume(str(resume_file)) is first
+    touch(resume_file)
+    assert load_resume(resume_file) is first
+
+    assert safe_load.call_count == 1
+    assert first.errors == () and first.projection.fields["personal_information.name"] == "solid"
+    assert JobApplicationProfile(first.data).work_preferences.remote_work == "Yes"
+
+
+def test_edited_resume_is_parsed_and_validated_again(resume_file):
+    """Test that a changed file is parsed again and its schema violations are reported."""
+    first = load_resume(resume_file)
+    data = yaml.safe_load(first.text)
+    data["languages"][0]["proficiency"] = "Excellent"
+    resume_file.write_text(yaml.safe_dump(data), encoding="utf-8")
+    touch(resume_file)
+
+    edited = load_resume(resume_file)
+
+    assert edited.digest != first.digest
+    assert edited.errors == ("languages.0.proficiency: 'Excellent' is not one of "
+                             "['Native', 'Fluent', 'Intermediate', 'Beginner']",)
+
+
+def test_resume_that_is_not_a_mapping_is_rejected(tmp_path):
+    """Test that a YAML file without resume sections raises a ValueError."""
+    path = tmp_path / "plain_text_resume.yaml"
+    path.write_text("- just a list\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_resume(path)
+
+
+def test_empty_resume_is_an_empty_projection(tmp_path):
+    """Test that an empty resume file loads as an empty resume instead of failing the applier."""
+    path = tmp_path / "plain_text_resume.yaml"
+    path.write_text("", encoding="utf-8")
+
+    resume = load_resume(path)
+
+    assert resume.data == {} and resume.projection.fields == {}
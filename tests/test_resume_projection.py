@@ -0,0 +1,96 @@
+import os
+from datetime import date
+
+import pytest
+import yaml
+
+from src.generic_applier import GenericPortalApplier
+from src.resume_projection import load_resume_projection, project_resume, years_of_experience
+
+RESUME = {
+    "personal_information": {"name": "Ahmad", "surname": "Karimi", "phone_prefix": "+93", "phone": "700123456",
+                             "email": "ahmad@example.com", "zip_code": "1001"},
+    "education_details": [{"education_level": "Bachelor", "institution": "Kabul University"},
+                          {"education_level": "Diploma", "institution": "Habibia High School"}],
+    "experience_details": [
+        {"position": "Data Analyst", "company": "UNDP", "employment_period": "03/2021 - Present",
+         "skills_acquired": ["SQL", "Python"]},
+        {"position": "Intern", "company": "AWCC", "employment_period": "01/2019 - 06/2021", "skills_acquired": ["SQL"]},
+    ],
+    "availability": {"notice_period": "1 month"},
+}
+TODAY = date(2024, 3, 15)
+
+
+def test_catalog_covers_all_entries_and_derived_fields():
+    """Test that every entry is projected, the most recent one unindexed, plus derived fields."""
+    fields = project_resume(RESUME, today=TODAY).fields
+
+    assert fields["education.1.institution"] == "Habibia High School"
+    assert fields["education.institution"] == "Kabul University"
+    assert fields["personal_information.full_name"] == "Ahmad Karimi"
+    assert fields["personal_information.phone_formatted"] == "+93 700123456"
+    assert fields["experience.current_title"] == "Data Analyst"
+    assert fields["experience.years"] == 5
+    assert fields["skills"] == "SQL, Python"
+    assert fields["availability.notice_period"] == "1 month"
+
+
+def test_overlapping_jobs_are_counted_once():
+    """Test that years of experience merge overlapping employment periods."""
+    experiences = [{"employment_period": "2018 - 2020"}, {"employment_period": "06/2019 - 12/2021"},
+                   {"employment_period": "unknown"}]
+    assert years_of_experience(experiences, today=TODAY) == 4
+    assert years_of_experience([{"employment_period": "n/a"}]) is None
+
+
+@pytest.mark.parametrize("field, key", [
+    ({"label": "Mobile Phone Number *"}, "personal_information.phone"),
+    ({"label": "Phone number with country code"}, "personal_information.phone_formatted"),
+    ({"name": "first_name", "label": None}, "personal_information.name"),
+    ({"label": "Last name:"}, "personal_information.surname"),
+    ({"placeholder": "Postal code"}, "personal_information.zip_code"),
+    ({"label": "Why do you want to work here?"}, None),
+    ({"label": "Location"}, None),
+    ({"label": "Company"}, None),
+    ({"label": "Title"}, None),
+])
+def test_fields_are_matched_by_synonyms(field, key):
+    """Test that labels, names and placeholders are matched to catalog keys, unknown questions are not."""
+    assert project_resume(RESUME, today=TODAY).match(field) == key
+
+
+def test_ambiguous_labels_are_not_answered_from_jobs_or_schools():
+    """Test that generic labels get the candidate's own details or no answer, never a job's or a school's."""
+    with open("data_folder_example/plain_text_resume.yaml", "r", encoding="utf-8") as f:
+        projection = project_resume(yaml.safe_load(f), today=TODAY)
+
+    assert projection.answer("Location") == "Dublin"
+    assert projection.answer("Mobile phone number") == "7819117091"
+    assert [projection.answer(label) for label in ("Start date", "Link", "Description", "Position")] == [None] * 4
+
+
+def test_projection_is_cached_by_mtime(tmp_path):
+    """Test that the file is parsed once until it changes."""
+    path = tmp_path / "plain_text_resume.yaml"
+    path.write_text(yaml.safe_dump(RESUME), encoding="utf-8")
+
+    first = load_resume_projection(path)
+    assert load_resume_projection(path) is first
+
+    path.write_text(yaml.safe_dump({**RESUME, "personal_information": {"name": "Zahra"}}), encoding="utf-8")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    assert load_resume_projection(path).fields["personal_information.name"] == "Zahra"
+
+
+def test_portal_applier_matches_before_asking_the_llm(mocker):
+    """Test that a form made only of known fields is mapped without an LLM call."""
+    driver = mocker.Mock()
+    driver.current_url = "https://jobs.lever.co/acme/1"
+    applier = GenericPortalApplier(driver, mocker.Mock(), project_resume(RESUME, today=TODAY), wait_policy=mocker.Mock())
+
+    mapping = applier.map_fields([{"index": 0, "tag": "input", "label": "Full name"},
+                                  {"index": 1, "tag": "input", "type": "email", "name": "email"}])
+
+    assert mapping == {0: "personal_information.full_name", 1: "personal_information.email"}
+    applier.ai_adapter.invoke.assert_not_called()
@@ -0,0 +1,18 @@
+import yaml
+
+from src.resume_schema import validate_resume
+
+
+def test_example_resume_matches_the_schema():
+    """Test that the example plain_text_resume.yaml satisfies assets/resume_schema.yaml."""
+    with open("data_folder_example/plain_text_resume.yaml", "r", encoding="utf-8") as f:
+        example = yaml.safe_load(f)
+
+    assert validate_resume(example) == []
+
+
+def test_violations_name_the_field():
+    """Test that errors point at the offending field and unknown sections are not checked."""
+    errors = validate_resume({"languages": [{"language": "Dari", "proficiency": "Excellent"}], "hobbies": 42})
+
+    assert len(errors) == 1 and errors[0].startswith("languages.0.proficiency:")
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from src.job import Job
+from src.run_checkpoint import RunCheckpoint
+
+SEARCHES = [("Engineer", "Kabul"), ("Designer", "Herat")]
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    """Fixture for the checkpoint file of a run."""
+    return tmp_path / "run_checkpoint.json"
+
+
+def make_job(link):
+    return Job(title=f"Title {link}", company=f"Company {link}", location="", link=link, apply_method="")
+
+
+def test_resume_restores_position(checkpoint_path):
+    """Test that a resumed run keeps the saved search order, search, page and handled jobs."""
+    checkpoint = RunCheckpoint(checkpoint_path)
+    checkpoint.start("run", SEARCHES)
+    checkpoint.search_started(1)
+    checkpoint.page_done(0)
+    checkpoint.job_done("a")
+
+    resumed = RunCheckpoint(checkpoint_path, resume=True)
+    searches = resumed.start("run", list(reversed(SEARCHES)))
+
+    assert searches == SEARCHES
+    assert (resumed.search_index, resumed.page) == (1, 1)
+    assert resumed.should_skip("a")
+    assert not resumed.should_skip("b")
+
+
+def test_new_run_ignores_checkpoint(checkpoint_path):
+    """Test that the checkpoint is only restored when resuming a run with the same searches."""
+    checkpoint = RunCheckpoint(checkpoint_path)
+    checkpoint.start("run", SEARCHES)
+    checkpoint.search_started(1)
+
+    assert RunCheckpoint(checkpoint_path).start("run", SEARCHES[::-1]) == SEARCHES[::-1]
+    checkpoint.search_started(1)
+    other = RunCheckpoint(checkpoint_path, resume=True)
+    other.start("other searches", SEARCHES)
+    assert other.search_index == 0
+
+
+def test_in_flight_job_is_retried_once(checkpoint_path):
+    """Test that a job interrupted mid-application is retried, and skipped after a second interruption."""
+    checkpoint = RunCheckpoint(checkpoint_path)
+    checkpoint.start("run", SEARCHES)
+    checkpoint.job_started(make_job("a"))
+
+    retry = RunCheckpoint(checkpoint_path, resume=True)
+    retry.start("run", SEARCHES)
+    assert not retry.should_skip("a")
+    retry.job_started(make_job("a"))
+
+    last = RunCheckpoint(checkpoint_path, resume=True)
+    last.start("run", SEARCHES)
+    assert last.should_skip("a")
+
+
+def test_checkpoint_file_is_valid_json_after_each_job(checkpoint_path):
+    """Test that the checkpoint is written after every job and removed when the run finishes."""
+    checkpoint = RunCheckpoint(checkpoint_path)
+    checkpoint.start("run", SEARCHES)
+    checkpoint.job_started(make_job("a"))
+    checkpoint.job_done("a")
+
+    state = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    assert state["processed"] == ["a"]
+    assert state["in_flight"] is None
+    assert not checkpoint_path.with_suffix(".tmp").exists()
+
+    checkpoint.finish()
+    assert not checkpoint_path.exists()
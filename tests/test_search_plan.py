@@ -0,0 +1,93 @@
+import pytest
+
+from src.search_plan import SearchPlan, plan_name_for
+
+
+@pytest.fixture
+def plan_path(tmp_path):
+    """Fixture for the SQLite file shared by the plan instances of a test."""
+    return tmp_path / "plan.sqlite"
+
+
+def test_add_searches_is_idempotent(plan_path):
+    """Test that every process can register the same searches without duplicating shards."""
+    plan = SearchPlan(plan_path, owner="a")
+    assert plan.add_searches("p", ["Engineer", "Designer"], ["Kabul"], "?f") == 2
+    assert SearchPlan(plan_path, owner="b").add_searches("p", ["Engineer", "Designer"], ["Kabul"], "?f") == 0
+    assert plan.counts("p") == {"pending": 2}
+
+
+def test_page_ranges(plan_path):
+    """Test that searches are split into page ranges when pages_per_shard is set."""
+    plan = SearchPlan(plan_path, owner="a")
+    plan.add_searches("p", ["Engineer"], ["Kabul"], "?f", pages_per_shard=2, max_pages=5)
+
+    ranges = set()
+    while (shard := plan.claim("p")) is not None:
+        ranges.add((shard.page_start, shard.page_end, shard.next_page))
+    assert ranges == {(0, 2, 0), (2, 4, 2), (4, 5, 4)}
+
+    with pytest.raises(ValueError):
+        plan.add_searches("p", ["Engineer"], ["Kabul"], "?f", pages_per_shard=2)
+
+
+def test_claims_do_not_overlap(plan_path):
+    """Test that two owners never receive the same shard."""
+    first = SearchPlan(plan_path, owner="a")
+    second = SearchPlan(plan_path, owner="b")
+    first.add_searches("p", ["Engineer", "Designer"], ["Kabul"], "?f")
+
+    claimed = [first.claim("p"), second.claim("p")]
+
+    assert {shard.position for shard in claimed} == {"Engineer", "Designer"}
+    assert first.claim("p") is None
+    assert second.claim("p") is None
+
+
+def test_expired_lease_resumes_from_progress(plan_path, mocker):
+    """Test that a crashed owner's shard is reclaimed from the last page it reported."""
+    clock = mocker.patch("src.search_plan.time.time", return_value=1000.0)
+    crashed = SearchPlan(plan_path, lease_seconds=60, owner="crashed")
+    survivor = SearchPlan(plan_path, lease_seconds=60, owner="survivor")
+    crashed.add_searches("p", ["Engineer"], ["Kabul"], "?f")
+
+    shard = crashed.claim("p")
+    crashed.record_progress(shard, 3)
+    assert survivor.claim("p") is None
+
+    clock.return_value = 1100.0
+    reclaimed = survivor.claim("p")
+    assert reclaimed.id == shard.id
+    assert reclaimed.next_page == 3
+    assert reclaimed.attempts == 2
+
+    crashed.complete(shard)
+    assert survivor.counts("p") == {"claimed": 1}
+
+
+def test_release_fail_and_complete(plan_path):
+    """Test shard status transitions and the attempt limit."""
+    plan = SearchPlan(plan_path, max_attempts=2, owner="a")
+    plan.add_searches("p", ["Engineer"], ["Kabul"], "?f")
+
+    shard = plan.claim("p")
+    plan.release(shard)
+    shard = plan.claim("p")
+    assert shard.attempts == 1
+    plan.fail(shard)
+    shard = plan.claim("p")
+    plan.fail(shard)
+
+    assert plan.claim("p") is None
+    assert plan.counts("p") == {"failed": 1}
+
+    plan.add_searches("q", ["Engineer"], ["Herat"], "?f")
+    plan.complete(plan.claim("q"))
+    assert plan.counts("q") == {"done": 1}
+
+
+def test_plan_name_ignores_order():
+    """Test that identically configured processes derive the same plan name."""
+    assert plan_name_for(["b", "a"], ["x"], "?f") == plan_name_for(["a", "b"], ["x"], "?f")
+    assert plan_name_for(["a"], ["x"], "?f") != plan_name_for(["a"], ["x"], "?g")
+    assert plan_name_for(["a"], ["x"], "?f", "2026-10-19") != plan_name_for(["a"], ["x"], "?f", "2026-10-20")
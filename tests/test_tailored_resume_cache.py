@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from src.tailored_resume_cache import TailoredResumeCache, hamming_distance, simhash
+
+DESCRIPTION = (
+    "We are looking for a data analyst to join our humanitarian programme team in {city}. You will collect, clean "
+    "and analyse survey data, build dashboards in Power BI, write reports for donors and work closely with field "
+    "officers to improve monitoring and evaluation. Requirements: a degree in statistics or economics, three years "
+    "of experience with SQL and Python, excellent English and Dari, and the ability to travel to the provinces."
+)
+OTHER_ROLE = (
+    "Our logistics unit needs a warehouse supervisor who manages stock levels, receives deliveries, organises the "
+    "drivers and keeps the fleet maintenance schedule. You will train storekeepers, report losses and coordinate "
+    "with procurement on every purchase order. Experience in supply chain management and a driving licence are "
+    "required, knowledge of Pashto is an advantage for working with local suppliers."
+)
+PDF = b"%PDF" + b"x" * 996
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture for a tailored resume cache in a temporary folder."""
+    return TailoredResumeCache(tmp_path / "generated_cv", variant="v1")
+
+
+def test_reposts_are_close_and_other_roles_are_not():
+    """Test that a repost for another city is within the threshold and a different role is far away."""
+    kabul, herat = simhash(DESCRIPTION.format(city="Kabul")), simhash(DESCRIPTION.format(city="Herat"))
+    assert hamming_distance(kabul, herat) <= 4
+    assert hamming_distance(kabul, simhash(OTHER_ROLE)) > 10
+    assert simhash("Apply now!") is None
+
+
+def test_similar_description_reuses_pdf(cache):
+    """Test that the PDF generated for one description is returned for a near-duplicate."""
+    generate = iter([b"%PDF kabul", b"%PDF logistics"]).__next__
+
+    first = cache.get_or_create(DESCRIPTION.format(city="Kabul"), generate)
+    repost = cache.get_or_create(DESCRIPTION.format(city="Herat"), generate)
+    other = cache.get_or_create(OTHER_ROLE, generate)
+
+    assert repost == first and first.read_bytes() == b"%PDF kabul"
+    assert other != first and other.read_bytes() == b"%PDF logistics"
+
+
+def test_other_resume_version_does_not_match(cache, tmp_path):
+    """Test that PDFs generated from another version of the base resume are not reused."""
+    cache.store(DESCRIPTION.format(city="Kabul"), PDF)
+
+    assert TailoredResumeCache(tmp_path / "generated_cv", variant="v2").lookup(DESCRIPTION.format(city="Kabul")) is None
+    assert TailoredResumeCache(tmp_path / "generated_cv", variant="v1").lookup(DESCRIPTION.format(city="Kabul"))
+
+
+def test_folder_is_bounded_by_evicting_least_recently_used(cache):
+    """Test that the oldest tailored resumes are deleted beyond max_bytes and cover letters are kept."""
+    cache.max_bytes = 2500
+    cover_letter = cache.folder / "Cover_Letter_1.pdf"
+    cache.folder.mkdir(parents=True)
+    cover_letter.write_bytes(PDF)
+    os.utime(cover_letter, (1, 1))
+    kabul = cache.store(DESCRIPTION.format(city="Kabul"), PDF + b"kabul")
+
+    logistics = cache.store(OTHER_ROLE, PDF + b"logistics")
+
+    assert kabul.exists() and logistics.exists()
+    cache.max_bytes = 1500
+    cache.store("Apply now!", PDF + b"short")
+    assert not kabul.exists()
+    assert cover_letter.exists()
+    assert cache.lookup(DESCRIPTION.format(city="Kabul")) is None
@@ -4,7 +4,7 @@ import os
 import time
 from unittest import mock
 from selenium.webdriver.remote.webelement import WebElement
-from src.utils import ensure_chrome_profile, is_scrollable, scroll_slow, chrome_browser_options, printred, printyellow
+from src.utils import ensure_chrome_profile, is_scrollable, scroll_slow, chrome_browser_options, enable_fast_mode, printred, printyellow, stringWidth
 
 # Mocking logging to avoid actual file writing
 @pytest.fixture(autouse=True)
@@ -94,3 +94,28 @@ def test_printyellow(mocker):
     mocker.patch("builtins.print")
     printyellow("Test")
     print.assert_called_once_with("\033[93mTest\033[0m")
+
+def test_chrome_browser_options_fast_mode(mocker):
+    """Test that fast mode runs headless with a fixed window instead of a maximized one."""
+    mocker.patch("src.utils.ensure_chrome_profile")
+
+    arguments = chrome_browser_options(fast=True).arguments
+
+    assert "--headless=new" in arguments
+    assert "--start-maximized" not in arguments
+    assert any(argument.startswith("--window-size=") for argument in arguments)
+
+def test_enable_fast_mode(mocker):
+    """Test that fast mode blocks heavy requests and bypasses service workers over CDP."""
+    mock_driver = mocker.Mock()
+
+    enable_fast_mode(mock_driver)
+
+    commands = [call.args[0] for call in mock_driver.execute_cdp_cmd.call_args_list]
+    assert commands == ["Network.enable", "Network.setBlockedURLs", "Network.setBypassServiceWorker"]
+
+
+def test_string_width_uses_font_metrics():
+    """Test that text width is measured with the named ReportLab font and grows with the font size."""
+    assert stringWidth("Kabul", "Helvetica", 12) == pytest.approx(30.684)
+    assert stringWidth("Kabul", "Helvetica", 24) == 2 * stringWidth("Kabul", "Helvetica", 12)
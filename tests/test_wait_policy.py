@@ -0,0 +1,139 @@
+import json
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from src.wait_policy import WaitPolicy
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(mocker):
+    """Fixture to avoid real sleeping in readiness loops."""
+    return mocker.patch("src.wait_policy.time.sleep")
+
+
+@pytest.fixture
+def mock_driver(mocker):
+    """Fixture to mock Selenium WebDriver."""
+    driver = mocker.Mock()
+    driver.execute_script.return_value = ["complete", 10]
+    driver.execute_async_script.return_value = True
+    driver.get_log.side_effect = WebDriverException("performance log disabled")
+    return driver
+
+
+def perf_entry(method, request_id):
+    return {"message": json.dumps({"message": {"method": method, "params": {"requestId": request_id}}})}
+
+
+def test_invalid_delay_bounds(mock_driver):
+    """Test that inverted human delay bounds are rejected."""
+    with pytest.raises(ValueError):
+        WaitPolicy(mock_driver, min_delay=2, max_delay=1)
+
+
+def test_pause_only_sleeps_the_remainder(mocker, mock_driver, mock_sleep):
+    """Test that time already spent waiting counts towards the human-like delay."""
+    policy = WaitPolicy(mock_driver, min_delay=1.0, max_delay=1.0)
+    mocker.patch("src.wait_policy.time.monotonic", return_value=100.4)
+
+    policy.pause(started_at=100.0)
+
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args[0][0] == pytest.approx(0.6)
+
+
+def test_pause_skipped_when_wait_was_long_enough(mocker, mock_driver, mock_sleep):
+    """Test that no extra sleep happens after a slow readiness wait."""
+    policy = WaitPolicy(mock_driver, min_delay=0.5, max_delay=0.5)
+    mocker.patch("src.wait_policy.time.monotonic", return_value=105.0)
+
+    policy.pause(started_at=100.0)
+
+    mock_sleep.assert_not_called()
+
+
+def test_network_idle_with_resource_timing_fallback(mock_driver):
+    """Test that a stable resource count on a loaded document counts as idle."""
+    policy = WaitPolicy(mock_driver, min_delay=0, max_delay=0, quiet_period=0)
+
+    assert policy.wait_for_network_idle(timeout=1) is True
+    assert policy._performance_log_available is False
+
+
+def test_network_idle_tracks_cdp_requests(mocker, mock_driver):
+    """Test that in-flight requests from the performance log block idleness until they finish."""
+    mock_driver.get_log.side_effect = [
+        [perf_entry("Network.requestWillBeSent", "1")],
+        [perf_entry("Network.loadingFinished", "1")],
+        [],
+        [],
+    ]
+    policy = WaitPolicy(mock_driver, min_delay=0, max_delay=0, quiet_period=0)
+
+    assert policy.wait_for_network_idle(timeout=5) is True
+    assert mock_driver.get_log.call_count >= 3
+    assert policy._inflight_requests == {}
+
+
+def test_reset_network_tracking_forgets_the_old_page(mock_driver):
+    """Test that requests queued or in flight before a navigation no longer count after a reset."""
+    mock_driver.get_log.side_effect = [
+        [perf_entry("Network.requestWillBeSent", "1")],
+        [perf_entry("Network.requestWillBeSent", "2")],
+        [],
+    ]
+    policy = WaitPolicy(mock_driver, min_delay=0, max_delay=0)
+    assert policy._drain_performance_log() == 1
+
+    policy.reset_network_tracking()
+
+    assert policy._inflight_requests == {}
+    assert policy._drain_performance_log() == 0
+
+
+def test_network_idle_times_out_while_loading(mocker, mock_driver):
+    """Test that a document that never finishes loading is reported as not idle."""
+    mock_driver.execute_script.return_value = ["loading", 1]
+    clock = iter(range(100))
+    mocker.patch("src.wait_policy.time.monotonic", side_effect=lambda: next(clock))
+    policy = WaitPolicy(mock_driver, min_delay=0, max_delay=0)
+
+    assert policy.wait_for_network_idle(timeout=3) is False
+
+
+def test_dom_settled_uses_mutation_observer(mock_driver):
+    """Test that DOM quiescence is checked with a single async script call."""
+    policy = WaitPolicy(mock_driver, min_delay=0, max_delay=0, quiet_period=0.25)
+
+    assert policy.dom_settled(timeout=2) is True
+    args = mock_driver.execute_async_script.call_args[0]
+    assert args[1:] == (250, 2000)
+
+
+def test_dom_quiet_handles_driver_errors(mock_driver):
+    """Test that a failing async script does not break the caller."""
+    mock_driver.execute_async_script.side_effect = WebDriverException("script timeout")
+    policy = WaitPolicy(mock_driver, min_delay=0, max_delay=0)
+
+    assert policy.wait_for_dom_quiet(timeout=1) is False
+
+
+def test_element_ready_with_locator(mocker, mock_driver):
+    """Test waiting for a locator to become clickable."""
+    element = mocker.Mock()
+    wait = mocker.patch("src.wait_policy.WebDriverWait")
+    wait.return_value.until.return_value = element
+    policy = WaitPolicy(mock_driver, min_delay=0, max_delay=0)
+
+    assert policy.element_ready((By.ID, "submit"), "clickable", timeout=3) is element
+    assert wait.call_args[0][1] == 3
+
+
+def test_element_ready_rejects_unknown_state(mock_driver):
+    """Test that unsupported element states raise an error."""
+    policy = WaitPolicy(mock_driver)
+
+    with pytest.raises(ValueError):
+        policy.element_ready((By.ID, "submit"), "enabled")
@@ -0,0 +1,84 @@
+import threading
+from collections import Counter
+
+import pytest
+
+from src.worker_pool import BrowserWorkerPool, JobLinkTask, SearchTask, Worker
+
+
+class FakeJobManager:
+    def __init__(self, calls, lock):
+        self.calls = calls
+        self.lock = lock
+        self.results = Counter()
+
+    def apply_search(self, position, location):
+        with self.lock:
+            self.calls.append((position, location))
+        self.results["success"] += 1
+        return True
+
+    def apply_to_link(self, link):
+        if link == "bad":
+            raise RuntimeError("boom")
+        with self.lock:
+            self.calls.append(link)
+        self.results["success"] += 1
+        return True
+
+
+@pytest.fixture
+def calls():
+    """Fixture collecting the tasks executed by all workers."""
+    return []
+
+
+def make_factory(calls, closed):
+    lock = threading.Lock()
+
+    def factory(worker_id):
+        return Worker(FakeJobManager(calls, lock), lambda: closed.append(worker_id))
+
+    return factory
+
+
+def test_pool_runs_every_task_once(calls):
+    """Test that tasks are spread over the workers and results are aggregated."""
+    closed = []
+    tasks = [SearchTask(f"position {i}", "Kabul") for i in range(6)] + [JobLinkTask("https://jobs/1")]
+
+    report = BrowserWorkerPool(3, make_factory(calls, closed)).run(tasks)
+
+    assert sorted(map(str, calls)) == sorted(map(str, [(t.position, t.location) for t in tasks[:6]] + ["https://jobs/1"]))
+    assert report.results["success"] == 7
+    assert sum(worker.tasks_done for worker in report.workers) == 7
+    assert sorted(closed) == [0, 1, 2]
+
+
+def test_failing_task_does_not_stop_worker(calls):
+    """Test that an exception in one task is recorded and the worker continues."""
+    report = BrowserWorkerPool(1, make_factory(calls, [])).run([JobLinkTask("bad"), JobLinkTask("good")])
+
+    assert calls == ["good"]
+    assert len(report.workers[0].errors) == 1
+
+
+def test_worker_startup_failure_leaves_tasks_to_others(calls):
+    """Test that a worker whose browser fails to start drops out without losing tasks."""
+    healthy = make_factory(calls, [])
+
+    def factory(worker_id):
+        if worker_id == 0:
+            raise RuntimeError("chrome crashed")
+        return healthy(worker_id)
+
+    report = BrowserWorkerPool(2, factory).run([SearchTask("a", "b"), SearchTask("c", "d")])
+
+    assert len(calls) == 2
+    assert report.workers[0].errors == ["startup: chrome crashed"]
+
+
+def test_invalid_worker_count():
+    """Test that a pool needs at least one worker."""
+    with pytest.raises(ValueError):
+        BrowserWorkerPool(0, lambda worker_id: None)